@@ -0,0 +1,162 @@
+"""
+공고 역색인 (inverted index)
+- 공고명/공고내용/지원분야/지원사업분류 등 필드별로 2글자 n-gram -> 공고 ID 색인
+- n-gram은 공백만 정리한 텍스트의 한글/영문/숫자 구간에서 추출 (matching_engine의 정확한 포함 판정과 같은 텍스트)
+- 공고 데이터 로드 시 한 번 구축하고, 이후에는 변경된 행만 증분 갱신
+  (sync_announcement_index는 공고 캐시 로드/갱신 경로에서만 호출, 추천 생성은 indexed_frame으로 읽기만 함)
+- 키워드 매칭은 후보 공고(n-gram 교집합)에만 수행
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from text_normalization import NGRAM_SIZE, text_ngrams
+
+# 소스별 색인 설정 (공고 ID 컬럼, 색인 필드)
+INDEX_CONFIG = {
+    'biz2': {'id_column': '번호', 'fields': ['공고명', '지원분야', '소관부처']},
+    'kstartup2': {'id_column': '공고일련번호', 'fields': ['공고내용', '지원사업분류']},
+}
+
+def extract_ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """공백만 정리한 텍스트의 한글/영문/숫자 구간별 n-gram 집합 (대소문자 구분)"""
+    return text_ngrams(text, n)
+
+class AnnouncementIndex:
+    """필드별 n-gram -> 공고 ID 역색인"""
+
+    def __init__(self, id_column: str, fields: List[str]):
+        self.id_column = id_column
+        self.fields = list(fields)
+        self._postings: Dict[str, Dict[str, Set[str]]] = {field: defaultdict(set) for field in self.fields}
+        self._doc_ngrams: Dict[str, Dict[str, Set[str]]] = {}
+        self._doc_hashes: Dict[str, int] = {}
+        # 마지막으로 동기화한 공고 프레임 (색인과 같은 데이터로 채점하도록 함께 보관)
+        self.frame: Optional[pd.DataFrame] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_hashes)
+
+    def _row_hashes(self, df: pd.DataFrame) -> pd.Series:
+        """색인 필드 내용의 행별 해시 (벡터 연산)"""
+        columns = [field for field in self.fields if field in df.columns]
+        if not columns:
+            return pd.Series(0, index=df[self.id_column].astype(str).values, dtype='uint64')
+        hashes = pd.util.hash_pandas_object(df[columns].fillna('').astype(str), index=False)
+        return pd.Series(hashes.values, index=df[self.id_column].astype(str).values)
+
+    def _add(self, doc_id: str, row: Dict):
+        doc_ngrams = {}
+        for field in self.fields:
+            ngrams = extract_ngrams(row.get(field))
+            for ngram in ngrams:
+                self._postings[field][ngram].add(doc_id)
+            doc_ngrams[field] = ngrams
+        self._doc_ngrams[doc_id] = doc_ngrams
+
+    def _remove(self, doc_id: str):
+        doc_ngrams = self._doc_ngrams.pop(doc_id, {})
+        for field, ngrams in doc_ngrams.items():
+            postings = self._postings[field]
+            for ngram in ngrams:
+                ids = postings.get(ngram)
+                if ids is not None:
+                    ids.discard(doc_id)
+                    if not ids:
+                        del postings[ngram]
+        self._doc_hashes.pop(doc_id, None)
+
+    def build(self, df: pd.DataFrame):
+        """색인 전체 재구축"""
+        with self._lock:
+            self._postings = {field: defaultdict(set) for field in self.fields}
+            self._doc_ngrams = {}
+            self._doc_hashes = {}
+        return self.sync(df)
+
+    def sync(self, df: pd.DataFrame) -> Dict[str, int]:
+        """현재 공고 프레임과 비교하여 추가/변경/삭제된 공고만 증분 갱신"""
+        if df is not None:
+            self.frame = df
+        if df is None or df.empty or self.id_column not in df.columns:
+            return {'added': 0, 'changed': 0, 'removed': 0}
+
+        hashes = self._row_hashes(df)
+        hashes = hashes[~hashes.index.duplicated(keep='last')]
+        with self._lock:
+            current_ids = set(hashes.index)
+            removed = [doc_id for doc_id in self._doc_hashes if doc_id not in current_ids]
+            dirty = {doc_id: int(h) for doc_id, h in hashes.items() if self._doc_hashes.get(doc_id) != int(h)}
+            added = sum(1 for doc_id in dirty if doc_id not in self._doc_hashes)
+
+            for doc_id in removed:
+                self._remove(doc_id)
+
+            if dirty:
+                rows = df[df[self.id_column].astype(str).isin(list(dirty))]
+                records = rows[[self.id_column] + [f for f in self.fields if f in rows.columns]].to_dict('records')
+                for row in records:
+                    doc_id = str(row[self.id_column])
+                    if doc_id in self._doc_ngrams:
+                        self._remove(doc_id)
+                    self._add(doc_id, row)
+                    self._doc_hashes[doc_id] = dirty[doc_id]
+
+        return {'added': added, 'changed': len(dirty) - added, 'removed': len(removed)}
+
+    def candidates(self, field: str, term: str) -> Optional[Set[str]]:
+        """term을 포함할 수 있는 공고 ID 후보 집합 (색인으로 좁힐 수 없으면 None)"""
+        if not term:
+            return set()
+        if field not in self._postings:
+            return None
+        ngrams = extract_ngrams(term)
+        if not ngrams:
+            return None
+        postings = self._postings[field]
+        with self._lock:
+            result = None
+            for ngram in sorted(ngrams, key=lambda g: len(postings.get(g, ()))):
+                ids = postings.get(ngram)
+                if not ids:
+                    return set()
+                result = set(ids) if result is None else result & ids
+                if not result:
+                    return set()
+        return result
+
+    def candidates_any(self, queries: Iterable[tuple]) -> Optional[Set[str]]:
+        """(field, term) 중 하나라도 매칭될 수 있는 공고 ID 합집합 (None이면 전체 스캔 필요)"""
+        union = set()
+        for field, term in queries:
+            ids = self.candidates(field, term)
+            if ids is None:
+                return None
+            union |= ids
+        return union
+
+# 프로세스 전역 색인 (소스별 1개)
+_INDEXES: Dict[str, AnnouncementIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+def get_announcement_index(source: str) -> AnnouncementIndex:
+    """소스(biz2/kstartup2)별 프로세스 전역 색인 반환"""
+    with _INDEXES_LOCK:
+        if source not in _INDEXES:
+            config = INDEX_CONFIG[source]
+            _INDEXES[source] = AnnouncementIndex(config['id_column'], config['fields'])
+        return _INDEXES[source]
+
+def sync_announcement_index(source: str, df: pd.DataFrame) -> AnnouncementIndex:
+    """공고 데이터 로드/갱신 직후 호출 - 변경분만 반영한 색인 반환"""
+    index = get_announcement_index(source)
+    index.sync(df)
+    return index
+
+def indexed_frame(source: str) -> Tuple[Optional[pd.DataFrame], AnnouncementIndex]:
+    """마지막으로 동기화한 공고 프레임과 색인 (읽기 전용, 아직 로드 전이면 프레임은 None)"""
+    index = get_announcement_index(source)
+    return index.frame, index
@@ -0,0 +1,121 @@
+"""
+공고 식별 키 (announcement_key)
+- 기업마당/K-스타트업 공고는 출처 + 원본 번호: 'biz:{번호}', 'ks:{공고일련번호}'
+- 원본 번호가 없는 행(CSV로 올린 추천 테이블 등)은 정규화한 공고제목의 해시: 'h:{md5 앞 16자리}'
+- 추천 테이블/상태/알림이 공고제목 문자열 대신 이 키로 중복 제거와 조회를 수행
+- 규칙은 supabase_announcement_keys.sql의 normalize_announcement_title/announcement_content_key와 동일하게 유지
+- 알림 확인 상태는 키를 64비트 정수 ID로 바꿔 정렬 배열로 저장 (announcement_int_id, supabase_notification_seen.sql과 동일 규칙)
+"""
+import hashlib
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from text_normalization import fold_text
+
+ANNOUNCEMENT_KEY_COLUMN = 'announcement_key'
+CONTENT_KEY_PREFIX = 'h'
+CONTENT_KEY_LENGTH = 16
+# 공고 키 접두어 (공고제목에도 ':'가 들어갈 수 있으므로 접두어로만 판별, SQL과 동일 패턴)
+ANNOUNCEMENT_KEY_PATTERN = r'^(biz|ks|h):'
+
+# 공고 출처 표기 -> 키 접두어 (테이블명/영문/한글 표기 모두 허용)
+SOURCE_PREFIXES = {
+    'biz2': 'biz', 'bizinfo': 'biz', '기업마당': 'biz',
+    'kstartup2': 'ks', 'kstartup': 'ks', 'k-startup': 'ks', 'k-스타트업': 'ks',
+}
+
+# 정수 ID: 하위 2비트는 키 종류, 상위 60비트는 원본 번호 또는 해시 앞 15자리
+INT_ID_TAGS = {'biz': 1, 'ks': 2, CONTENT_KEY_PREFIX: 3}
+INT_ID_HEX_DIGITS = 15
+INT_ID_MAX_NATIVE = 1 << 60
+
+_announcement_key = re.compile(ANNOUNCEMENT_KEY_PATTERN)
+
+def normalize_title(title) -> str:
+    """공고제목 정규화 (공백/특수문자 제거, 영문 소문자)"""
+    return fold_text(title)
+
+def is_announcement_key(value) -> bool:
+    """공고 키 형식('biz:', 'ks:', 'h:' 접두어)인지 ('2025년 공고: ...' 같은 공고제목은 False)"""
+    return isinstance(value, str) and _announcement_key.match(value) is not None
+
+def source_prefix(source) -> Optional[str]:
+    if source is None or (isinstance(source, float) and pd.isna(source)):
+        return None
+    return SOURCE_PREFIXES.get(str(source).strip().lower())
+
+def _id_text(native_id) -> str:
+    # 정수로 읽힌 번호가 실수(123.0)로 바뀐 경우도 같은 키가 되도록 정리
+    if isinstance(native_id, float) and native_id.is_integer():
+        return str(int(native_id))
+    return str(native_id).strip()
+
+def content_key(title) -> str:
+    """공고제목 해시 키"""
+    digest = hashlib.md5(normalize_title(title).encode('utf-8')).hexdigest()
+    return f"{CONTENT_KEY_PREFIX}:{digest[:CONTENT_KEY_LENGTH]}"
+
+def announcement_key(source=None, native_id=None, title=None) -> str:
+    """공고 키 (출처와 원본 번호가 있으면 원본 번호, 없으면 공고제목 해시)"""
+    prefix = source_prefix(source)
+    if prefix and native_id is not None and not pd.isna(native_id) and _id_text(native_id):
+        return f"{prefix}:{_id_text(native_id)}"
+    return content_key(title)
+
+def native_keys(prefix: str, ids: pd.Series) -> pd.Series:
+    """원본 번호 컬럼 -> 공고 키 컬럼 (예: biz2 번호 -> 'biz:123')"""
+    text = ids.astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    return (prefix + ':' + text).astype(object).where(ids.notna(), None)
+
+def frame_announcement_keys(df: pd.DataFrame, title_column: str = '공고제목',
+                            source_column: Optional[str] = None, id_column: Optional[str] = None) -> pd.Series:
+    """프레임의 공고 키 컬럼 (저장된 키 > 출처+원본 번호 > 공고제목 해시 순으로 사용)"""
+    if ANNOUNCEMENT_KEY_COLUMN in df.columns:
+        keys = df[ANNOUNCEMENT_KEY_COLUMN].astype(object)
+    else:
+        keys = pd.Series(None, index=df.index, dtype=object)
+
+    if id_column and source_column and id_column in df.columns and source_column in df.columns:
+        missing = keys.isna()
+        if missing.any():
+            prefixes = df.loc[missing, source_column].map(source_prefix)
+            ids = df.loc[missing, id_column]
+            native = (prefixes + ':' + ids.astype(str).str.strip().str.replace(r'\.0$', '', regex=True))
+            keys.loc[missing] = native.where(prefixes.notna() & ids.notna())
+
+    missing = keys.isna()
+    if missing.any():
+        titles = df.loc[missing, title_column] if title_column in df.columns else pd.Series('', index=keys.index[missing])
+        # 같은 제목은 한 번만 해시
+        codes, uniques = pd.factorize(titles.fillna('').astype(str))
+        hashed = pd.Index([content_key(title) for title in uniques], dtype=object)
+        keys.loc[missing] = hashed.take(codes).to_numpy()
+    return keys
+
+def add_announcement_keys(df: pd.DataFrame, title_column: str = '공고제목',
+                          source_column: Optional[str] = None, id_column: Optional[str] = None) -> pd.DataFrame:
+    """announcement_key 컬럼 추가/보완 (빈 프레임은 그대로 반환)"""
+    if df.empty:
+        return df
+    df[ANNOUNCEMENT_KEY_COLUMN] = frame_announcement_keys(df, title_column, source_column, id_column)
+    return df
+
+def announcement_int_id(key) -> int:
+    """공고 키 -> 정수 ID ('biz:123' -> 123*4+1, 'ks:45' -> 45*4+2, 'h:...' -> 해시*4+3, 그 외 키 해시*4)"""
+    prefix, _, value = str(key).partition(':')
+    tag = INT_ID_TAGS.get(prefix)
+    if tag == INT_ID_TAGS[CONTENT_KEY_PREFIX]:
+        return (int(value[:INT_ID_HEX_DIGITS], 16) << 2) | tag
+    if tag and value.isascii() and value.isdigit() and int(value) < INT_ID_MAX_NATIVE:
+        return (int(value) << 2) | tag
+    digest = hashlib.md5(str(key).encode('utf-8')).hexdigest()
+    return int(digest[:INT_ID_HEX_DIGITS], 16) << 2
+
+def frame_announcement_int_ids(keys: pd.Series) -> np.ndarray:
+    """공고 키 컬럼 -> 정수 ID 배열 (int64, 같은 키는 한 번만 변환)"""
+    codes, uniques = pd.factorize(keys.astype(str))
+    ids = np.fromiter((announcement_int_id(key) for key in uniques), dtype=np.int64, count=len(uniques))
+    return ids.take(codes)
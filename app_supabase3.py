@@ -1,12 +1,41 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import altair as alt
 from supabase import create_client, Client
 import json
 from config import SUPABASE_URL, SUPABASE_KEY
+from matching_engine import score_biz_announcements, score_kstartup_announcements
+from announcement_index import indexed_frame, sync_announcement_index
+from date_normalization import add_date_columns, get_reference_date, reference_date_key, roadmap_buckets
+from shared_cache import register_shared_cache
+from table_watermarks import cached_by_table_version, tables_version, notify_table_changed
+from table_snapshots import snapshot_frame
+from company_keys import normalize_company_names, build_company_key_map, lookup_company, company_key_row
+from company_search import CompanySearchIndex, build_company_search_index
+from text_normalization import extract_company_names
+from batch_writer import (
+    upsert_rows, RECOMMENDATION_CONFLICT_COLUMNS, NOTIFICATION_CONFLICT_COLUMNS
+)
+from supabase_loader import (
+    fetch_frame, fetch_detail, get_available_columns, DEFAULT_ORDER,
+    ALPHA_COMPANY_COLUMNS, COMPANY_COLUMNS,
+    BIZ_MATCH_COLUMNS, KSTARTUP_MATCH_COLUMNS, BIZ_SOURCE_COLUMNS, KSTARTUP_SOURCE_COLUMNS
+)
+from recommend_schema import (
+    RECOMMEND3_COLUMN_MAPPING, ACTIVE3_COLUMN_MAPPING, REGION4_COLUMN_MAPPING, KEYWORD4_COLUMN_MAPPING,
+    RULES4_COLUMN_MAPPING, PRIORITY4_COLUMN_MAPPING, RECOMMEND3_DETAIL_COLUMNS,
+    RECOMMEND3_LIST_COLUMNS, ACTIVE3_LIST_COLUMNS, REGION4_LIST_COLUMNS, KEYWORD4_LIST_COLUMNS,
+    RULES4_LIST_COLUMNS, PRIORITY4_LIST_COLUMNS
+)
+from recommend_ranking import rank_recommendations
+from recommendation_status import STATUS_TABLE, DEFAULT_STATUS, fetch_statuses, save_statuses
+from announcement_keys import ANNOUNCEMENT_KEY_COLUMN, add_announcement_keys, native_keys, frame_announcement_int_ids
+from notification_seen import SEEN_COLUMN, seen_array, contains, load_seen, add_seen
+from recommend_view import VIEW_NAME, view_available, fetch_company_view, split_view_frame, refresh_view
 
 # Supabase 설정
 @st.cache_resource
@@ -30,9 +59,12 @@ def init_supabase():
 supabase: Client = init_supabase()
 
 def calculate_support_status(start_date, end_date, reference_date=None):
-    """접수시작일과 접수마감일을 기준으로 지원 가능 여부를 판단합니다."""
+    """접수시작일과 접수마감일을 기준으로 지원 가능 여부를 판단합니다.
+
+    단건 판정용입니다. DataFrame 전체는 date_normalization.add_date_columns를 사용하세요.
+    """
     if reference_date is None:
-        reference_date = datetime(2025, 9, 16)  # 기준일 설정
+        reference_date = get_reference_date().to_pydatetime()  # 기준일 (REFERENCE_DATE 환경변수)
     
     try:
         # 날짜 파싱
@@ -58,357 +90,382 @@ def calculate_support_status(start_date, end_date, reference_date=None):
     except Exception as e:
         return "정보부족"
 
-@st.cache_data(ttl=30)  # 캐시 시간을 30초로 단축하여 새로 추가된 회사가 빠르게 반영되도록
-def load_companies() -> pd.DataFrame:
-    """회사 데이터 로드 (alpha_companies2 + companies 테이블 통합)"""
+# 공유 캐시 원본 버전 확인 주기 (초) - 테이블이 바뀐 경우에만 백그라운드에서 다시 로드
+COMPANY_CACHE_MAX_AGE = 10
+ANNOUNCEMENT_CACHE_MAX_AGE = 30
+
+# 공유 캐시별 원본 테이블 (버전 확인 대상)
+COMPANY_SOURCE_TABLES = ('alpha_companies2', 'companies')
+ANNOUNCEMENT_SOURCE_TABLES = ('biz2', 'kstartup2')
+
+def get_supabase_client():
+    """현재 Supabase 클라이언트 (워터마크 확인용)"""
+    return supabase
+
+def load_source_table(table: str, columns: List[str], key_column: str, order: Optional[str] = None,
+                      offline: bool = False) -> Optional[pd.DataFrame]:
+    """원본 테이블 로드 (로컬 스냅샷 + 워터마크 이후 변경분만 조회)
+
+    order가 없으면 key_column 순으로 조회합니다.
+    offline=True이면 스냅샷만 읽고, 스냅샷이 없으면 None을 반환합니다.
+    """
+    order = order or key_column
+    df = snapshot_frame(supabase, table, columns, key_column, order=order, offline=offline)
+    if df is None and not offline:
+        df = fetch_frame(supabase, table, columns, order=order)
+    return df
+
+def fetch_companies(offline: bool = False) -> Optional[pd.DataFrame]:
+    """회사 데이터 조회 (alpha_companies2 + companies 테이블 통합, 공유 캐시 로더)
+
+    offline=True이면 로컬 스냅샷만으로 구성하고, 스냅샷이 없으면 None을 반환합니다.
+    """
+    if supabase is None:
+        if offline:
+            return None
+        # 데모 데이터 반환
+        return pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['데모 회사 1', '데모 회사 2', '데모 회사 3'],
+            'business_type': ['법인', '개인', '법인'],
+            'region': ['서울', '경기', '부산'],
+            'industry': ['IT', '제조업', '서비스업'],
+            'keywords': [['AI', '빅데이터'], ['제조', '자동화'], ['서비스', '플랫폼']],
+            'years': [5, 3, 7],
+            'stage': ['성장', '초기', '성장'],
+            'preferred_uses': [['R&D', '마케팅'], ['설비', '인력'], ['플랫폼', '마케팅']],
+            'preferred_budget': ['중간', '소액', '대형']
+        })
+    
+    all_companies = []
+    
+    # 1. alpha_companies2 테이블에서 기존 고객사 데이터 로드
     try:
-        if supabase is None:
-            # 데모 데이터 반환
-            return pd.DataFrame({
-                'id': [1, 2, 3],
-                'name': ['데모 회사 1', '데모 회사 2', '데모 회사 3'],
-                'business_type': ['법인', '개인', '법인'],
-                'region': ['서울', '경기', '부산'],
-                'industry': ['IT', '제조업', '서비스업'],
-                'keywords': [['AI', '빅데이터'], ['제조', '자동화'], ['서비스', '플랫폼']],
-                'years': [5, 3, 7],
-                'stage': ['성장', '초기', '성장'],
-                'preferred_uses': [['R&D', '마케팅'], ['설비', '인력'], ['플랫폼', '마케팅']],
-                'preferred_budget': ['중간', '소액', '대형']
-            })
-        
-        all_companies = []
-        
-        # 1. alpha_companies2 테이블에서 기존 고객사 데이터 로드
-        try:
-            alpha_result = supabase.table('alpha_companies2').select('*').execute()
-            alpha_df = pd.DataFrame(alpha_result.data)
-            
-            if not alpha_df.empty:
-                # 컬럼명을 companies 테이블과 호환되도록 매핑
-                alpha_df = alpha_df.rename(columns={
-                    'No.': 'original_id',
-                    '사업아이템 한 줄 소개': 'name',
-                    '기업형태': 'business_type',
-                    '소재지': 'region',
-                    '주업종 (사업자등록증 상)': 'industry',
-                    '특화분야': 'keywords'
-                })
-                
-                # ID 충돌 방지를 위해 alpha_companies2는 음수 ID 사용
-                alpha_df['id'] = -alpha_df['original_id']
-                
-                # 기업명 추출 (사업아이템 한 줄 소개에서 "기업명 - " 부분 추출)
-                if 'name' in alpha_df.columns:
-                    # 먼저 기존 기업명 컬럼이 있는지 확인
-                    if '기업명' in alpha_df.columns:
-                        alpha_df['company_name'] = alpha_df['기업명']
-                    else:
-                        # 기업명이 없으면 사업아이템에서 추출 시도
-                        alpha_df['company_name'] = alpha_df['name'].str.extract(r'^([^-]+) - ')[0].str.strip()
-                        # 기업명이 추출되지 않은 경우 전체 이름 사용
-                        alpha_df['company_name'] = alpha_df['company_name'].fillna(alpha_df['name'])
-                
-                # 추가 컬럼들을 별도로 추가
-                alpha_df['설립일'] = alpha_df.get('설립연월일', '')
-                alpha_df['매출'] = alpha_df.get('#매출', '')
-                alpha_df['고용'] = alpha_df.get('#고용', '')
-                alpha_df['특허'] = alpha_df.get('#기술특허(등록)', '')
-                alpha_df['인증'] = alpha_df.get('#기업인증', '')
-                alpha_df['주요산업'] = alpha_df.get('주요 산업', '')
-                
-                # years 컬럼 추가 (기본값)
-                alpha_df['years'] = 0
-                    
-                # stage 컬럼 추가 (기본값)
-                alpha_df['stage'] = '예비'
-                
-                # preferred_uses, preferred_budget 컬럼 추가 (기본값)
-                alpha_df['preferred_uses'] = ''
-                alpha_df['preferred_budget'] = '소액'
-                
-                # 테이블 구분을 위한 컬럼 추가
-                alpha_df['source_table'] = 'alpha_companies2'
-                
-                all_companies.append(alpha_df)
-        except Exception as e:
-            st.warning(f"alpha_companies2 테이블 로드 실패: {e}")
+        alpha_df = load_source_table('alpha_companies2', ALPHA_COMPANY_COLUMNS, 'No.', order='No.', offline=offline)
+        if alpha_df is None:
+            return None
         
-        # 2. companies 테이블에서 신규 회사 데이터 로드
-        try:
-            companies_result = supabase.table('companies').select('*').execute()
-            companies_df = pd.DataFrame(companies_result.data)
+        if not alpha_df.empty:
+            # 컬럼명을 companies 테이블과 호환되도록 매핑
+            alpha_df = alpha_df.rename(columns={
+                'No.': 'original_id',
+                '사업아이템 한 줄 소개': 'name',
+                '기업형태': 'business_type',
+                '소재지': 'region',
+                '주업종 (사업자등록증 상)': 'industry',
+                '특화분야': 'keywords'
+            })
             
-            if not companies_df.empty:
-                # company_name 컬럼 추가 (name과 동일)
-                companies_df['company_name'] = companies_df['name']
-                
-                # 테이블 구분을 위한 컬럼 추가
-                companies_df['source_table'] = 'companies'
+            # ID 충돌 방지를 위해 alpha_companies2는 음수 ID 사용
+            alpha_df['id'] = -alpha_df['original_id']
+            
+            # 기업명 추출 (사업아이템 한 줄 소개에서 "기업명 - " 부분 추출)
+            if 'name' in alpha_df.columns:
+                # 먼저 기존 기업명 컬럼이 있는지 확인
+                if '기업명' in alpha_df.columns:
+                    alpha_df['company_name'] = alpha_df['기업명']
+                else:
+                    # 기업명이 없으면 사업아이템에서 추출 시도
+                    # (기업명이 추출되지 않은 경우 전체 이름 사용)
+                    alpha_df['company_name'] = extract_company_names(alpha_df['name'])
+            
+            # 추가 컬럼들을 별도로 추가
+            alpha_df['설립일'] = alpha_df.get('설립연월일', '')
+            alpha_df['매출'] = alpha_df.get('#매출', '')
+            alpha_df['고용'] = alpha_df.get('#고용', '')
+            alpha_df['특허'] = alpha_df.get('#기술특허(등록)', '')
+            alpha_df['인증'] = alpha_df.get('#기업인증', '')
+            alpha_df['주요산업'] = alpha_df.get('주요 산업', '')
+            
+            # years 컬럼 추가 (기본값)
+            alpha_df['years'] = 0
                 
-                all_companies.append(companies_df)
-        except Exception as e:
-            st.warning(f"companies 테이블 로드 실패: {e}")
-        
-        # 3. 모든 회사 데이터 통합
-        if all_companies:
-            combined_df = pd.concat(all_companies, ignore_index=True)
-            # 최신 추가된 회사가 먼저 보이도록 정렬 (ID 기준 내림차순)
-            combined_df = combined_df.sort_values('id', ascending=False)
-            return combined_df
-        else:
-            return pd.DataFrame()
+            # stage 컬럼 추가 (기본값)
+            alpha_df['stage'] = '예비'
+            
+            # preferred_uses, preferred_budget 컬럼 추가 (기본값)
+            alpha_df['preferred_uses'] = ''
+            alpha_df['preferred_budget'] = '소액'
+            
+            # 테이블 구분을 위한 컬럼 추가
+            alpha_df['source_table'] = 'alpha_companies2'
+            
+            all_companies.append(alpha_df)
+    except Exception as e:
+        st.warning(f"alpha_companies2 테이블 로드 실패: {e}")
+    
+    # 2. companies 테이블에서 신규 회사 데이터 로드
+    try:
+        companies_df = load_source_table('companies', COMPANY_COLUMNS, 'id', order='id', offline=offline)
+        if companies_df is None:
+            return None
         
+        if not companies_df.empty:
+            # company_name 컬럼 추가 (name과 동일)
+            companies_df['company_name'] = companies_df['name']
+            
+            # 테이블 구분을 위한 컬럼 추가
+            companies_df['source_table'] = 'companies'
+            
+            all_companies.append(companies_df)
+    except Exception as e:
+        st.warning(f"companies 테이블 로드 실패: {e}")
+    
+    # 3. 모든 회사 데이터 통합
+    if all_companies:
+        combined_df = pd.concat(all_companies, ignore_index=True)
+        # 추천 테이블 조회용 회사 키 (정규화 기업명)
+        combined_df['company_key'] = normalize_company_names(combined_df['company_name'])
+        # 최신 추가된 회사가 먼저 보이도록 정렬 (ID 기준 내림차순)
+        combined_df = combined_df.sort_values('id', ascending=False)
+        return combined_df
+    else:
+        return pd.DataFrame()
+
+companies_cache = register_shared_cache(
+    'companies', fetch_companies, COMPANY_CACHE_MAX_AGE,
+    version_probe=lambda: tables_version(supabase, COMPANY_SOURCE_TABLES),
+    initial_loader=lambda: fetch_companies(offline=True)
+)
+
+def load_companies() -> pd.DataFrame:
+    """회사 데이터 로드 (프로세스 공유 캐시 - 만료되어도 기다리지 않고 기존 데이터 반환)
+
+    반환된 DataFrame은 모든 세션이 공유하므로 수정하지 말고 복사해서 사용하세요.
+    """
+    try:
+        return companies_cache.get()
     except Exception as e:
         st.error(f"회사 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=60)
+def invalidate_companies():
+    """회사 추가/삭제 후 호출 - 공유 캐시 백그라운드 갱신 예약"""
+    for table in COMPANY_SOURCE_TABLES:
+        notify_table_changed(table)
+    companies_cache.invalidate()
+
+def fetch_announcements(offline: bool = False) -> Optional[pd.DataFrame]:
+    """공고 데이터 조회 (biz2 + kstartup2 테이블 통합, 공유 캐시 로더)
+
+    offline=True이면 로컬 스냅샷만으로 구성하고, 스냅샷이 없으면 None을 반환합니다.
+    """
+    if supabase is None:
+        return None if offline else pd.DataFrame()
+    
+    # biz2 테이블 데이터 로드 (목록 표시 + 추천 매칭 컬럼, 스냅샷 이후 변경분만)
+    biz_df = load_source_table('biz2', BIZ_SOURCE_COLUMNS, '번호', order='번호', offline=offline)
+    
+    # kstartup2 테이블 데이터 로드 (목록 표시 + 추천 매칭 컬럼, 스냅샷 이후 변경분만)
+    kstartup_df = load_source_table('kstartup2', KSTARTUP_SOURCE_COLUMNS, '공고일련번호', order='공고일련번호', offline=offline)
+    if biz_df is None or kstartup_df is None:
+        return None
+    
+    # 추천 매칭용 역색인은 공고 데이터를 (다시) 로드할 때만 변경분 갱신 (추천 생성은 색인을 읽기만 함)
+    sync_announcement_index('biz2', biz_df[[c for c in BIZ_MATCH_COLUMNS if c in biz_df.columns]])
+    sync_announcement_index('kstartup2', kstartup_df[[c for c in KSTARTUP_MATCH_COLUMNS if c in kstartup_df.columns]])
+    
+    # biz2 데이터 정규화
+    if not biz_df.empty:
+        biz_df['source'] = 'Bizinfo'
+        biz_df['id'] = biz_df['번호'].astype(str)
+        biz_df[ANNOUNCEMENT_KEY_COLUMN] = native_keys('biz', biz_df['번호'])
+        biz_df['title'] = biz_df['공고명']
+        biz_df['agency'] = biz_df['사업수행기관']
+        biz_df['region'] = ''  # biz2에는 지역 정보가 없음
+        biz_df['due_date'] = biz_df['신청종료일자']
+        biz_df['info_session_date'] = biz_df['신청시작일자']
+        biz_df['url'] = biz_df['공고상세URL']
+        biz_df['amount_text'] = ''
+        biz_df['amount_krw'] = None
+        biz_df['stage'] = ''
+        biz_df['update_type'] = '신규'
+        biz_df['budget_band'] = '중간'
+        biz_df['allowed_uses'] = [[] for _ in range(len(biz_df))]
+        biz_df['keywords'] = [[] for _ in range(len(biz_df))]
+    
+    # kstartup2 데이터 정규화
+    if not kstartup_df.empty:
+        kstartup_df['source'] = 'K-Startup'
+        kstartup_df['id'] = kstartup_df['공고일련번호'].astype(str)
+        kstartup_df[ANNOUNCEMENT_KEY_COLUMN] = native_keys('ks', kstartup_df['공고일련번호'])
+        kstartup_df['title'] = kstartup_df['사업공고명']
+        kstartup_df['agency'] = kstartup_df['주관기관']
+        kstartup_df['region'] = kstartup_df['지원지역']
+        kstartup_df['due_date'] = kstartup_df['공고접수종료일시']
+        kstartup_df['info_session_date'] = kstartup_df['공고접수시작일시']
+        kstartup_df['url'] = kstartup_df['상세페이지 url']
+        kstartup_df['amount_text'] = ''
+        kstartup_df['amount_krw'] = None
+        kstartup_df['stage'] = kstartup_df['사업업력']
+        kstartup_df['update_type'] = '신규'
+        kstartup_df['budget_band'] = '중간'
+        kstartup_df['allowed_uses'] = [[] for _ in range(len(kstartup_df))]
+        kstartup_df['keywords'] = [[] for _ in range(len(kstartup_df))]
+    
+    # 두 데이터프레임 통합
+    common_columns = ['id', ANNOUNCEMENT_KEY_COLUMN, 'title', 'agency', 'source', 'region', 'due_date', 
+                     'info_session_date', 'url', 'amount_text', 'amount_krw', 
+                     'stage', 'update_type', 'budget_band', 'allowed_uses', 'keywords']
+    
+    combined_df = pd.DataFrame()
+    if not biz_df.empty:
+        biz_selected = biz_df[common_columns]
+        combined_df = pd.concat([combined_df, biz_selected], ignore_index=True)
+    
+    if not kstartup_df.empty:
+        kstartup_selected = kstartup_df[common_columns]
+        combined_df = pd.concat([combined_df, kstartup_selected], ignore_index=True)
+    
+    return combined_df
+
+announcements_cache = register_shared_cache(
+    'announcements', fetch_announcements, ANNOUNCEMENT_CACHE_MAX_AGE,
+    version_probe=lambda: tables_version(supabase, ANNOUNCEMENT_SOURCE_TABLES),
+    initial_loader=lambda: fetch_announcements(offline=True)
+)
+
 def load_announcements() -> pd.DataFrame:
-    """공고 데이터 로드 (biz2 + kstartup2 테이블 통합)"""
+    """공고 데이터 로드 (프로세스 공유 캐시 - 만료되어도 기다리지 않고 기존 데이터 반환)"""
     try:
-        if supabase is None:
-            return pd.DataFrame()
-        
-        # biz2 테이블 데이터 로드
-        biz_result = supabase.table('biz2').select('*').execute()
-        biz_df = pd.DataFrame(biz_result.data)
-        
-        # kstartup2 테이블 데이터 로드
-        kstartup_result = supabase.table('kstartup2').select('*').execute()
-        kstartup_df = pd.DataFrame(kstartup_result.data)
-        
-        # biz2 데이터 정규화
-        if not biz_df.empty:
-            biz_df['source'] = 'Bizinfo'
-            biz_df['id'] = biz_df['번호'].astype(str)
-            biz_df['title'] = biz_df['공고명']
-            biz_df['agency'] = biz_df['사업수행기관']
-            biz_df['region'] = ''  # biz2에는 지역 정보가 없음
-            biz_df['due_date'] = biz_df['신청종료일자']
-            biz_df['info_session_date'] = biz_df['신청시작일자']
-            biz_df['url'] = biz_df['공고상세URL']
-            biz_df['amount_text'] = ''
-            biz_df['amount_krw'] = None
-            biz_df['stage'] = ''
-            biz_df['update_type'] = '신규'
-            biz_df['budget_band'] = '중간'
-            biz_df['allowed_uses'] = [[] for _ in range(len(biz_df))]
-            biz_df['keywords'] = [[] for _ in range(len(biz_df))]
-        
-        # kstartup2 데이터 정규화
-        if not kstartup_df.empty:
-            kstartup_df['source'] = 'K-Startup'
-            kstartup_df['id'] = kstartup_df['공고일련번호'].astype(str)
-            kstartup_df['title'] = kstartup_df['사업공고명']
-            kstartup_df['agency'] = kstartup_df['주관기관']
-            kstartup_df['region'] = kstartup_df['지원지역']
-            kstartup_df['due_date'] = kstartup_df['공고접수종료일시']
-            kstartup_df['info_session_date'] = kstartup_df['공고접수시작일시']
-            kstartup_df['url'] = kstartup_df['상세페이지 url']
-            kstartup_df['amount_text'] = ''
-            kstartup_df['amount_krw'] = None
-            kstartup_df['stage'] = kstartup_df['사업업력']
-            kstartup_df['update_type'] = '신규'
-            kstartup_df['budget_band'] = '중간'
-            kstartup_df['allowed_uses'] = [[] for _ in range(len(kstartup_df))]
-            kstartup_df['keywords'] = [[] for _ in range(len(kstartup_df))]
-        
-        # 두 데이터프레임 통합
-        common_columns = ['id', 'title', 'agency', 'source', 'region', 'due_date', 
-                         'info_session_date', 'url', 'amount_text', 'amount_krw', 
-                         'stage', 'update_type', 'budget_band', 'allowed_uses', 'keywords']
-        
-        combined_df = pd.DataFrame()
-        if not biz_df.empty:
-            biz_selected = biz_df[common_columns]
-            combined_df = pd.concat([combined_df, biz_selected], ignore_index=True)
-        
-        if not kstartup_df.empty:
-            kstartup_selected = kstartup_df[common_columns]
-            combined_df = pd.concat([combined_df, kstartup_selected], ignore_index=True)
-        
-        return combined_df
-        
+        return announcements_cache.get()
     except Exception as e:
         st.error(f"공고 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=60)
+def load_company_key_map() -> Dict[int, Dict]:
+    """회사 ID -> company_key/기업명 매핑 (회사 공유 캐시 버전이 바뀔 때만 다시 구축)"""
+    try:
+        return companies_cache.derived('company_key_map', build_company_key_map)
+    except Exception:
+        return {}
+
+def load_company_search_index() -> CompanySearchIndex:
+    """회사 검색 색인 (회사 공유 캐시 버전이 바뀔 때만 다시 구축)"""
+    return companies_cache.derived('company_search_index', build_company_search_index)
+
+def resolve_company(company_id: int) -> Optional[Dict]:
+    """회사 ID로 company_key와 기업명 조회 (네트워크 요청 없음)"""
+    return lookup_company(load_company_key_map(), company_id)
+
+def register_company_key(company_id: int, company_name: str, source_table: str):
+    """신규 회사의 company_key 매핑 등록"""
+    try:
+        supabase.table('company_keys').upsert(
+            company_key_row(company_id, company_name, source_table), on_conflict='company_key'
+        ).execute()
+    except Exception:
+        # company_keys 테이블이 없는 경우 (supabase_company_keys.sql 미적용) 무시
+        pass
+
+def fetch_recommend_table(table: str, columns: List[str], company_id: int = None) -> pd.DataFrame:
+    """추천 테이블을 company_key 동등 조회로 로드
+
+    company_key 컬럼이 없는 테이블(마이그레이션 전)은 기존 방식(기업명 ilike)으로 조회합니다.
+    페이지는 기본키(id) 순으로 나눕니다.
+    """
+    if not company_id:
+        return fetch_frame(supabase, table, columns, order=DEFAULT_ORDER)
+    
+    company = resolve_company(company_id)
+    if company is None:
+        st.warning(f"회사 ID {company_id}에 대한 기업명을 찾을 수 없습니다.")
+        return pd.DataFrame()
+    
+    try:
+        return fetch_frame(supabase, table, columns, [('eq', 'company_key', company['company_key'])],
+                           order=DEFAULT_ORDER)
+    except Exception:
+        company_name = company['company_name']
+        df = fetch_frame(supabase, table, columns, [('ilike', 'company_name', f'%{company_name}%')],
+                         order=DEFAULT_ORDER)
+        # 정확히 일치하는 기업명이 있으면 그 행만 사용
+        if not df.empty and 'company_name' in df.columns:
+            exact_match = df[df['company_name'] == company_name]
+            if not exact_match.empty:
+                df = exact_match
+        return df
+
+@cached_by_table_version('recommend3', client=get_supabase_client)
 def load_recommendations(company_id: int = None) -> pd.DataFrame:
     """추천 데이터 로드 (recommend3 테이블 사용)"""
     try:
-        query = supabase.table('recommend3').select('*')
-        if company_id:
-            # load_companies에서 추출한 company_name 사용
-            companies_df = load_companies()
-            company_data = companies_df[companies_df['id'] == company_id]
-            
-            if not company_data.empty and 'company_name' in company_data.columns:
-                company_name = company_data.iloc[0]['company_name']
-                
-                # 기업명으로 recommend3에서 검색
-                query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-            else:
-                # alpha_companies2의 경우 원본 ID 사용
-                if company_id < 0:
-                    original_id = -company_id
-                    company_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                    if company_result.data:
-                        company_name = company_result.data[0]['기업명']
-                        query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-                    else:
-                        return pd.DataFrame()
-                else:
-                    # companies 테이블의 경우
-                    company_result = supabase.table('companies').select('name').eq('id', company_id).execute()
-                    if company_result.data:
-                        company_name = company_result.data[0]['name']
-                        query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-                    else:
-                        return pd.DataFrame()
-        result = query.execute()
-        return pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회
+        return fetch_recommend_table('recommend3', RECOMMEND3_LIST_COLUMNS, company_id)
     except Exception as e:
         st.error(f"추천 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=60)
+@cached_by_table_version('recommend3', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations2(company_id: int = None) -> pd.DataFrame:
     """추천 데이터 로드 (recommend3 테이블) - URL 정보 포함"""
     try:
-        
-        query = supabase.table('recommend3').select('*')
-        
-        # company_id가 있는 경우, 기업명으로 검색
-        if company_id:
-            # load_companies에서 추출한 company_name 사용
-            companies_df = load_companies()
-            company_data = companies_df[companies_df['id'] == company_id]
-            
-            if not company_data.empty and 'company_name' in company_data.columns:
-                company_name = company_data.iloc[0]['company_name']
-                
-                # 기업명으로 recommend3에서 검색
-                query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-            else:
-                # alpha_companies2의 경우 원본 ID 사용
-                if company_id < 0:
-                    original_id = -company_id
-                    company_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                    if company_result.data:
-                        company_name = company_result.data[0]['기업명']
-                        query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-                    else:
-                        st.warning(f"회사 ID {company_id}에 대한 기업명을 찾을 수 없습니다.")
-                        query = supabase.table('recommend2').select('*')
-                else:
-                    # companies 테이블의 경우
-                    company_result = supabase.table('companies').select('name').eq('id', company_id).execute()
-                    if company_result.data:
-                        company_name = company_result.data[0]['name']
-                        query = supabase.table('recommend3').select('*').ilike('company_name', f'%{company_name}%')
-                    else:
-                        st.warning(f"회사 ID {company_id}에 대한 기업명을 찾을 수 없습니다.")
-                        query = supabase.table('recommend2').select('*')
-        
-        result = query.execute()
-        df = pd.DataFrame(result.data)
-        
-        # company_id가 있고 데이터가 있으면 필터링
-        if company_id and not df.empty and company_name:
-            # 기업명으로 필터링 (클라이언트 사이드)
-            if 'company_name' in df.columns:
-                # 정확한 매칭 시도
-                exact_match = df[df['company_name'] == company_name]
-                if not exact_match.empty:
-                    df = exact_match
-                    st.success(f"✅ 정확한 매칭 발견: {len(exact_match)}개 추천")
-                else:
-                    # 부분 매칭 시도
-                    partial_match = df[df['company_name'].str.contains(company_name, case=False, na=False)]
-                    if not partial_match.empty:
-                        df = partial_match
-                        st.warning(f"⚠️ 부분 매칭 발견: {len(partial_match)}개 추천")
-                    else:
-                        st.warning(f"❌ 매칭되는 추천이 없습니다. 검색 기업명: {company_name}")
-                        # 디버깅을 위해 recommend3의 기업명 샘플 표시
-                        sample_companies = df['company_name'].unique()[:5]
-                        st.info(f"📋 recommend3 테이블 기업명 샘플: {list(sample_companies)}")
-            elif '기업명' in df.columns:
-                df = df[df['기업명'].str.contains(company_name, case=False, na=False)]
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend3', RECOMMEND3_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend3 테이블에 맞게)
         if not df.empty:
-            # recommend3 테이블의 컬럼명에 맞게 매핑
-            column_mapping = {
-                'company_name': '회사명',
-                'title_y': '공고제목',
-                'source': '공고출처',
-                'final_score': '총점수',
-                'final_level': '적합도',
-                'description': '매칭이유',
-                'apply_start_y': '접수시작일',
-                'apply_end_y': '접수마감일',
-                'url': '공고보기',
-                'doc_text': '공고상세정보'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in RECOMMEND3_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
             
-            # status 컬럼이 없으면 기본값 'pending'으로 설정
+            # status 컬럼이 없으면 기본값 'pending'으로 설정 (현재 상태는 apply_recommendation_statuses로 덮어씀)
             if 'status' not in df.columns:
                 df['status'] = 'pending'
-                
-                # 세션 상태에서 상태 정보 가져오기
-                if 'recommendation_status' in st.session_state:
-                    for idx, row in df.iterrows():
-                        company_name = row.get('company_name', '')
-                        announcement_title = row.get('title_y', '')
-                        if company_name and announcement_title:
-                            key = f"{company_name}_{announcement_title}"
-                            if key in st.session_state['recommendation_status']:
-                                df.at[idx, 'status'] = st.session_state['recommendation_status'][key]
-            
-            # 지원가능여부 컬럼 추가 (매핑 후 컬럼명 사용)
-            if '접수시작일' in df.columns and '접수마감일' in df.columns:
-                df['지원가능여부'] = df.apply(
-                    lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                    axis=1
-                )
+            
+            # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+            df = add_date_columns(df)
+            # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+            df = add_announcement_keys(df)
+            df = rank_recommendations(df, 'recommend3')
         
         return df
     except Exception as e:
         st.error(f"추천 데이터 로드 실패 (recommend2): {e}")
         return pd.DataFrame()
 
-def update_recommendation_status(company_name, announcement_title, status):
+@cached_by_table_version('recommend3', client=get_supabase_client)
+def load_recommendation_detail(company_name: str, announcement_title: str) -> str:
+    """추천 공고 상세정보(doc_text) 단건 조회 - 행을 펼칠 때만 호출"""
+    if supabase is None:
+        return ''
+    try:
+        detail = fetch_detail(
+            supabase, 'recommend3', list(RECOMMEND3_DETAIL_COLUMNS),
+            [('eq', 'company_name', company_name), ('eq', 'title_y', announcement_title)]
+        )
+        return detail.get('doc_text') or ''
+    except Exception as e:
+        st.error(f"공고 상세정보 로드 실패: {e}")
+        return ''
+
+def update_recommendation_status(company_id: int, announcement_key: str, status: str, announcement_title: str = None):
     """추천 공고의 승인/반려 상태 업데이트"""
+    titles = {announcement_key: announcement_title} if announcement_title else None
+    return update_recommendation_statuses(company_id, {announcement_key: status}, titles)
+
+def update_recommendation_statuses(company_id: int, statuses: Dict[str, str],
+                                   titles: Optional[Dict[str, str]] = None) -> bool:
+    """여러 추천 공고의 승인/반려 상태를 한 번에 업데이트 ({공고 키: 상태})
+
+    세션 상태에 먼저 반영(낙관적 업데이트)한 뒤 recommendation_status 테이블에
+    다중 행 upsert 한 번으로 저장합니다. 저장에 실패하면 세션 상태만 유지합니다.
+    """
     if supabase is None:
         st.warning("Supabase 연결이 없습니다. 데모 모드로 실행됩니다.")
         return False
     
     try:
-        # 세션 상태 초기화
-        if 'recommendation_status' not in st.session_state:
-            st.session_state['recommendation_status'] = {}
+        # 세션 상태에 먼저 반영 (회사 ID -> {공고 키: 상태})
+        get_session_statuses(company_id).update(statuses)
         
-        # 세션 상태에 저장 (항상 세션 상태로 관리)
-        key = f"{company_name}_{announcement_title}"
-        st.session_state['recommendation_status'][key] = status
-        
-        # 데이터베이스에도 업데이트 시도 (status 컬럼이 있는 경우)
         try:
-            result = supabase.table('recommend3').select('*').eq('company_name', company_name).eq('title_y', announcement_title).execute()
-            
-            if result.data and 'status' in result.data[0]:
-                update_data = {'status': status}
-                supabase.table('recommend3').update(update_data).eq('company_name', company_name).eq('title_y', announcement_title).execute()
-        except:
-            pass
+            save_statuses(supabase, company_id, statuses, titles)
+            # 다른 세션/워커도 다음 조회에서 새 상태를 읽도록 버전 갱신
+            notify_table_changed(STATUS_TABLE)
+        except Exception as e:
+            st.warning(f"상태가 이 세션에만 저장되었습니다 ({STATUS_TABLE} 저장 실패: {e})")
         
         return True
             
@@ -416,31 +473,33 @@ def update_recommendation_status(company_name, announcement_title, status):
         st.error(f"❌ 상태 업데이트 실패: {e}")
         return False
 
-def get_recommendation_status(company_name, announcement_title):
-    """추천 공고의 현재 상태 조회"""
-    # 세션 상태 초기화
+def get_session_statuses(company_id: int) -> Dict[str, str]:
+    """세션에 저장된 회사의 추천 상태 ({공고 키: 상태})"""
     if 'recommendation_status' not in st.session_state:
         st.session_state['recommendation_status'] = {}
-    
-    # 세션 상태에서 먼저 확인
-    key = f"{company_name}_{announcement_title}"
-    if key in st.session_state['recommendation_status']:
-        return st.session_state['recommendation_status'][key]
-    
-    # 세션 상태에 없으면 데이터베이스에서 확인
-    if supabase is not None:
-        try:
-            result = supabase.table('recommend3').select('status').eq('company_name', company_name).eq('title_y', announcement_title).execute()
-            
-            if result.data and len(result.data) > 0:
-                status = result.data[0].get('status', 'pending')
-                # 데이터베이스에서 가져온 상태를 세션 상태에도 저장
-                st.session_state['recommendation_status'][key] = status
-                return status
-        except:
-            pass
-    
-    return 'pending'
+    return st.session_state['recommendation_status'].setdefault(company_id, {})
+
+@cached_by_table_version(STATUS_TABLE, client=get_supabase_client)
+def load_recommendation_statuses(company_id: int) -> Dict[str, str]:
+    """회사의 저장된 추천 상태를 한 번에 조회 ({공고 키: 상태}, 회사당 요청 1회)"""
+    return fetch_statuses(supabase, company_id)
+
+def get_recommendation_statuses(company_id: int) -> Dict[str, str]:
+    """회사의 현재 추천 상태 (저장된 상태 위에 세션의 낙관적 업데이트를 덮어씀)"""
+    return {**load_recommendation_statuses(company_id), **get_session_statuses(company_id)}
+
+def get_recommendation_status(company_id: int, announcement_key: str) -> str:
+    """추천 공고의 현재 상태 조회"""
+    return get_recommendation_statuses(company_id).get(announcement_key, DEFAULT_STATUS)
+
+def apply_recommendation_statuses(df: pd.DataFrame, company_id: int) -> pd.DataFrame:
+    """추천 프레임의 status 컬럼을 현재 상태로 갱신 (공고 키 기준 벡터 매핑)"""
+    if df.empty:
+        return df
+    statuses = get_recommendation_statuses(company_id)
+    df = add_announcement_keys(df.copy())
+    df['status'] = df[ANNOUNCEMENT_KEY_COLUMN].map(statuses).fillna(DEFAULT_STATUS)
+    return df
 
 def create_recommend3_table():
     """recommend3 테이블 생성"""
@@ -481,381 +540,197 @@ def create_recommend3_table():
         st.warning(f"recommend3 테이블 생성 중 오류: {e}")
         # 테이블이 이미 존재하는 경우 무시
 
+@cached_by_table_version('recommend_region4', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations_region4(company_id: int = None) -> pd.DataFrame:
     """지역별 추천 데이터 로드 (recommend_region4 테이블)"""
     try:
-        query = supabase.table('recommend_region4').select('*')
-        if company_id:
-            # alpha_companies2 테이블에서 기업명 찾기
-            company_name = None
-            try:
-                # company_id가 음수인 경우 (alpha_companies2에서 온 경우)
-                if company_id < 0:
-                    original_id = -company_id
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                else:
-                    # company_id가 양수인 경우 (companies 테이블에서 온 경우)
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', company_id).execute()
-                
-                if alpha_result.data:
-                    company_name = alpha_result.data[0]['기업명']
-            except:
-                pass
-            
-            if company_name:
-                # 기업명으로 recommend_region4에서 부분 매칭 (ilike 사용)
-                query = supabase.table('recommend_region4').select('*').ilike('company_name', f'%{company_name}%')
-        
-        result = query.execute()
-        df = pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend_region4', REGION4_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend_region4 테이블에 맞게)
         if not df.empty:
-            column_mapping = {
-                'company_name': '회사명',
-                'company_province': '회사지역',
-                'program_id': '프로그램ID',
-                'url': '공고보기',
-                'final_score': '총점수',
-                'final_score_10': '총점수(10점만점)',
-                'final_level': '적합도',
-                'program_provinces': '프로그램지역',
-                'region_match': '지역매칭',
-                'source': '공고출처',
-                'base_score': '기본점수',
-                'sim_raw': '유사도(원본)',
-                'sim_points': '유사도점수',
-                'priority_boost_points': '우선순위보너스',
-                'base_score_10': '기본점수(10점만점)',
-                'score_stage': '단계점수',
-                'score_industry': '업종점수',
-                'score_region': '지역점수',
-                'score_timing': '시기점수',
-                'score_bonus': '보너스점수',
-                'score_penalty': '감점',
-                'priority_type_x': '우선순위유형',
-                'title_x': '공고제목',
-                'sim': '유사도',
-                'apply_start_x': '접수시작일',
-                'apply_end_x': '접수마감일',
-                'region': '지역',
-                'years': '업력',
-                'raw_text': '원본텍스트',
-                'industry_primary': '주요업종',
-                'title_y': '프로그램제목',
-                'description': '프로그램설명',
-                'category': '카테고리',
-                'doc_text': '문서텍스트',
-                'program_region': '프로그램지역',
-                'priority_type_y': '우선순위유형2',
-                'apply_start_y': '접수시작일2',
-                'apply_end_y': '접수마감일2',
-                'base_score_recomputed': '재계산기본점수',
-                'region_prog': '프로그램지역2',
-                'title_prog': '프로그램제목2',
-                'description_prog': '프로그램설명2',
-                'category_prog': '카테고리2',
-                'doc_text_prog': '문서텍스트2'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in REGION4_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
         
-        # 지원가능여부 컬럼 추가
-        if not df.empty and '접수시작일' in df.columns and '접수마감일' in df.columns:
-            df['지원가능여부'] = df.apply(
-                lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                axis=1
-            )
+        # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+        df = add_date_columns(df)
+        # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+        df = add_announcement_keys(df)
+        df = rank_recommendations(df, 'region4')
         
         return df
     except Exception as e:
         st.error(f"지역별 추천 데이터 로드 실패 (recommend_region4): {e}")
         return pd.DataFrame()
 
+@cached_by_table_version('recommend_rules4', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations_rules4(company_id: int = None) -> pd.DataFrame:
     """규칙별 추천 데이터 로드 (recommend_rules4 테이블)"""
     try:
-        query = supabase.table('recommend_rules4').select('*')
-        if company_id:
-            # alpha_companies2 테이블에서 기업명 찾기
-            company_name = None
-            try:
-                # company_id가 음수인 경우 (alpha_companies2에서 온 경우)
-                if company_id < 0:
-                    original_id = -company_id
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                else:
-                    # company_id가 양수인 경우 (companies 테이블에서 온 경우)
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', company_id).execute()
-                
-                if alpha_result.data:
-                    company_name = alpha_result.data[0]['기업명']
-            except Exception as e:
-                pass
-            
-            if company_name:
-                # 기업명으로 recommend_rules4에서 부분 매칭 (ilike 사용)
-                query = supabase.table('recommend_rules4').select('*').ilike('company_name', f'%{company_name}%')
-        
-        result = query.execute()
-        df = pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend_rules4', RULES4_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend_rules4 테이블의 실제 컬럼명에 맞게)
         if not df.empty:
-            column_mapping = {
-                'company_id': '회사ID',
-                'company_name': '회사명',
-                'company_province': '회사지역',
-                'company_years': '회사업력',
-                'company_section': '회사업종',
-                'program_id': '프로그램ID',
-                'priority_type': '우선순위유형',
-                'title': '공고제목',
-                'url': '공고보기',
-                'apply_start': '접수시작일',
-                'apply_end': '접수마감일',
-                'program_provinces': '프로그램지역',
-                'program_years_min': '최소업력',
-                'program_years_max': '최대업력',
-                'program_section': '프로그램업종',
-                'passed': '통과여부',
-                'reason': '통과이유'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in RULES4_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
         
-        # 지원가능여부 컬럼 추가
-        if not df.empty and '접수시작일' in df.columns and '접수마감일' in df.columns:
-            df['지원가능여부'] = df.apply(
-                lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                axis=1
-            )
+        # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+        df = add_date_columns(df)
+        # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+        df = add_announcement_keys(df)
+        df = rank_recommendations(df, 'rules4')
         
         return df
     except Exception as e:
         st.error(f"규칙별 추천 데이터 로드 실패 (recommend_rules4): {e}")
         return pd.DataFrame()
 
+@cached_by_table_version('recommend_priority4', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations_priority4(company_id: int = None) -> pd.DataFrame:
     """3대장별 추천 데이터 로드 (recommend_priority4 테이블)"""
     try:
-        query = supabase.table('recommend_priority4').select('*')
-        if company_id:
-            # alpha_companies2 테이블에서 기업명 찾기
-            company_name = None
-            try:
-                # company_id가 음수인 경우 (alpha_companies2에서 온 경우)
-                if company_id < 0:
-                    original_id = -company_id
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                else:
-                    # company_id가 양수인 경우 (companies 테이블에서 온 경우)
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', company_id).execute()
-                
-                if alpha_result.data:
-                    company_name = alpha_result.data[0]['기업명']
-            except:
-                pass
-            
-            if company_name:
-                # 기업명으로 recommend_priority4에서 부분 매칭 (ilike 사용)
-                query = supabase.table('recommend_priority4').select('*').ilike('company_name', f'%{company_name}%')
-        
-        result = query.execute()
-        df = pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend_priority4', PRIORITY4_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend_priority4 테이블의 실제 컬럼명에 맞게)
         if not df.empty:
-            column_mapping = {
-                'company_id': '회사ID',
-                'company_name': '회사명',
-                'program_id': '프로그램ID',
-                'source': '공고출처',
-                'final_score': '총점수',
-                'base_score': '기본점수',
-                'sim_raw': '유사도(원본)',
-                'sim_points': '유사도점수',
-                'priority_boost_points': '우선순위보너스',
-                'final_score_10': '총점수(10점만점)',
-                'base_score_10': '기본점수(10점만점)',
-                'final_level': '적합도',
-                'score_stage': '단계점수',
-                'score_industry': '업종점수',
-                'score_region': '지역점수',
-                'score_timing': '시기점수',
-                'score_bonus': '보너스점수',
-                'score_penalty': '감점',
-                'url': '공고보기',
-                'priority_type_x': '우선순위유형',
-                'title_x': '공고제목',
-                'sim': '유사도',
-                'apply_start_x': '접수시작일',
-                'apply_end_x': '접수마감일',
-                'region': '지역',
-                'years': '업력',
-                'raw_text': '원본텍스트',
-                'industry_primary': '주요업종',
-                'title_y': '프로그램제목',
-                'description': '프로그램설명',
-                'category': '카테고리',
-                'doc_text': '문서텍스트',
-                'program_region': '프로그램지역',
-                'priority_type_y': '우선순위유형2',
-                'apply_start_y': '접수시작일2',
-                'apply_end_y': '접수마감일2',
-                'base_score_recomputed': '재계산기본점수'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in PRIORITY4_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
         
-        # 지원가능여부 컬럼 추가
-        if not df.empty and '접수시작일' in df.columns and '접수마감일' in df.columns:
-            df['지원가능여부'] = df.apply(
-                lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                axis=1
-            )
+        # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+        df = add_date_columns(df)
+        # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+        df = add_announcement_keys(df)
+        df = rank_recommendations(df, 'priority4')
         
         return df
     except Exception as e:
         st.error(f"3대장별 추천 데이터 로드 실패 (recommend_priority4): {e}")
         return pd.DataFrame()
 
+@cached_by_table_version('recommend_keyword4', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations_keyword4(company_id: int = None) -> pd.DataFrame:
     """키워드별 추천 데이터 로드 (recommend_keyword4 테이블)"""
     try:
-        query = supabase.table('recommend_keyword4').select('*')
-        if company_id:
-            # alpha_companies2 테이블에서 기업명 찾기
-            company_name = None
-            try:
-                # company_id가 음수인 경우 (alpha_companies2에서 온 경우)
-                if company_id < 0:
-                    original_id = -company_id
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', original_id).execute()
-                else:
-                    # company_id가 양수인 경우 (companies 테이블에서 온 경우)
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', company_id).execute()
-                
-                if alpha_result.data:
-                    company_name = alpha_result.data[0]['기업명']
-            except:
-                pass
-            
-            if company_name:
-                # 기업명으로 recommend_keyword4에서 부분 매칭 (ilike 사용)
-                query = supabase.table('recommend_keyword4').select('*').ilike('company_name', f'%{company_name}%')
-        
-        result = query.execute()
-        df = pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend_keyword4', KEYWORD4_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend_keyword4 테이블의 실제 컬럼명에 맞게)
         if not df.empty:
-            column_mapping = {
-                'company_name': '회사명',
-                'program_id': '프로그램ID',
-                'url': '공고보기',
-                'title': '공고제목',
-                'priority_type': '우선순위유형',
-                'apply_start': '접수시작일',
-                'apply_end': '접수마감일',
-                'kw_intersection': '키워드교집합',
-                'kw_tfidf': '키워드TF-IDF',
-                'kw_bm25': '키워드BM25',
-                'kw_phrase_hit': '키워드구문매칭',
-                'kw_must_have_hits': '필수키워드매칭',
-                'kw_forbid_hit': '금지키워드매칭',
-                'kw_gate': '키워드게이트',
-                'kw_reason': '키워드매칭이유',
-                'keyword_points': '키워드점수'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in KEYWORD4_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
         
-        # 지원가능여부 컬럼 추가
-        if not df.empty and '접수시작일' in df.columns and '접수마감일' in df.columns:
-            df['지원가능여부'] = df.apply(
-                lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                axis=1
-            )
+        # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+        df = add_date_columns(df)
+        # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+        df = add_announcement_keys(df)
+        df = rank_recommendations(df, 'keyword4')
         
         return df
     except Exception as e:
         st.error(f"키워드별 추천 데이터 로드 실패 (recommend_keyword4): {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=60)
+@cached_by_table_version('recommend_active3', client=get_supabase_client, extra_key=reference_date_key)
 def load_recommendations3_active(company_id: int = None) -> pd.DataFrame:
     """활성 추천 데이터 로드 (recommend_active3 테이블) - URL 정보 포함"""
     try:
-        query = supabase.table('recommend_active3').select('*')
-        if company_id:
-            # 회사의 기업명으로 직접 매칭
-            company_name = None
-            
-            # companies 테이블에서 먼저 찾기
-            try:
-                company_result = supabase.table('companies').select('name').eq('id', company_id).execute()
-                if company_result.data:
-                    company_name = company_result.data[0]['name']
-            except:
-                pass
-            
-            # alpha_companies2 테이블에서 찾기
-            if not company_name:
-                try:
-                    alpha_result = supabase.table('alpha_companies2').select('"기업명"').eq('"No."', company_id).execute()
-                    if alpha_result.data:
-                        company_name = alpha_result.data[0]['기업명']
-                except:
-                    pass
-            
-            if company_name:
-                # 기업명으로 recommend_active3에서 검색
-                query = supabase.table('recommend_active3').select('*').ilike('company_name', f'%{company_name}%')
-        result = query.execute()
-        df = pd.DataFrame(result.data)
+        # company_key 인덱스 동등 조회 (회사 키는 load_companies 캐시에서 조회)
+        df = fetch_recommend_table('recommend_active3', ACTIVE3_LIST_COLUMNS, company_id)
         
         # 컬럼명을 한국어로 매핑 (recommend_active3 테이블에 맞게)
         if not df.empty:
-            column_mapping = {
-                'company_name': '회사명',
-                'title': '공고제목',
-                'source': '공고출처',
-                'final_score': '총점수',
-                'url': '공고보기',
-                'apply_start': '접수시작일',
-                'apply_end': '접수마감일'
-            }
-            
             # 존재하는 컬럼만 매핑
             existing_columns = df.columns.tolist()
-            mapping_to_apply = {k: v for k, v in column_mapping.items() if k in existing_columns}
+            mapping_to_apply = {k: v for k, v in ACTIVE3_COLUMN_MAPPING.items() if k in existing_columns}
             df = df.rename(columns=mapping_to_apply)
         
-        # 지원가능여부 컬럼 추가
-        if not df.empty and '접수시작일' in df.columns and '접수마감일' in df.columns:
-            df['지원가능여부'] = df.apply(
-                lambda row: calculate_support_status(row['접수시작일'], row['접수마감일']), 
-                axis=1
-            )
+        # 지원가능여부/접수월 컬럼 추가 (날짜는 고유값 단위로 한 번만 파싱)
+        df = add_date_columns(df)
+        # 공고 키 보완 (백필 전 행은 공고제목 해시) 후 중복 제거/순위 계산 (데이터 버전당 한 번)
+        df = add_announcement_keys(df)
+        df = rank_recommendations(df, 'active3')
         
         return df
     except Exception as e:
         st.error(f"활성 추천 데이터 로드 실패 (recommend_active3): {e}")
         return pd.DataFrame()
 
+# 추천 탭별 로더 (탭 키 -> 로더 함수)
+RECOMMENDATION_LOADERS = {
+    'recommend3': load_recommendations2,
+    'active3': load_recommendations3_active,
+    'region4': load_recommendations_region4,
+    'keyword4': load_recommendations_keyword4,
+    'rules4': load_recommendations_rules4,
+    'priority4': load_recommendations_priority4,
+}
+
+# 추천 데이터 하위 화면 (화면 이름 목록, 필터 옵션은 recommend3 사용)
+RECOMMENDATION_VIEWS = ["전체 추천", "활성 공고만", "추천(지역)", "추천(키워드)", "추천(규칙)", "추천(3대장)", "필터 옵션"]
+
+# 승인/반려 검토 목록 (필터 옵션 화면)
+REVIEW_PAGE_SIZES = [20, 50, 100]
+REVIEW_COLUMNS = ['공고제목', '총점수', '접수시작일', '접수마감일', '매칭이유', '공고보기']
+STATUS_LABELS = {'pending': '⏳ 대기중', 'approved': '✅ 승인', 'rejected': '❌ 반려'}
+
+# 메인 화면
+MAIN_VIEWS = ["📊 추천 데이터", "🔔 신규 공고 알림", "🗓️ 12개월 로드맵"]
+
+@cached_by_table_version(VIEW_NAME, client=get_supabase_client, extra_key=reference_date_key)
+def load_recommendation_view(company_id: int) -> Optional[Dict[str, pd.DataFrame]]:
+    """통합 추천 뷰(recommend_company_view)에서 회사의 모든 추천을 요청 1회로 로드
+
+    중복 제거/추천순위는 뷰에서 미리 계산되어 있으며, 회사를 찾을 수 없으면 None을 반환합니다.
+    """
+    company = resolve_company(company_id)
+    if company is None:
+        return None
+    frames = split_view_frame(fetch_company_view(supabase, company['company_key']))
+    for key, df in frames.items():
+        frames[key] = add_announcement_keys(add_date_columns(df))
+    if not frames['recommend3'].empty and 'status' not in frames['recommend3'].columns:
+        frames['recommend3']['status'] = 'pending'
+    return frames
+
+def get_recommendation_frame(recommendation_frames: Optional[Dict[str, pd.DataFrame]], key: str,
+                             company_id: int) -> pd.DataFrame:
+    """미리 로드된 추천 프레임 반환 (없으면 해당 로더로 단건 조회)"""
+    if recommendation_frames is not None and key in recommendation_frames:
+        return recommendation_frames[key]
+    return RECOMMENDATION_LOADERS[key](company_id)
+
+def load_shared_recommendations(company_id: int) -> Optional[Dict[str, pd.DataFrame]]:
+    """통합 추천 뷰가 있으면 모든 추천을 요청 1회로 로드
+
+    뷰가 없으면 None을 반환하고, 각 화면은 get_recommendation_frame으로 필요한 테이블만
+    (테이블 버전 캐시를 거쳐) 조회합니다.
+    """
+    if not view_available(supabase):
+        return None
+    try:
+        return load_recommendation_view(company_id)
+    except Exception as e:
+        st.warning(f"통합 추천 뷰 조회 실패, 필요한 추천 테이블만 개별 조회합니다: {e}")
+        return None
+
+def select_view(options: List[str], key: str) -> str:
+    """선택한 화면 하나만 렌더링하는 탭 대체 선택기
+
+    st.tabs는 보이지 않는 탭 본문까지 매 rerun마다 실행하므로, 선택값을 세션 상태(key)에
+    유지하고 선택된 화면의 데이터 조회와 위젯 생성만 수행합니다.
+    """
+    return st.radio("화면 선택", options, horizontal=True, key=key, label_visibility="collapsed")
+
 def save_company(company_data: Dict) -> bool:
     """회사 저장"""
     try:
@@ -864,6 +739,9 @@ def save_company(company_data: Dict) -> bool:
             return False
         
         result = supabase.table('companies').insert(company_data).execute()
+        if result.data:
+            register_company_key(result.data[0]['id'], company_data.get('name', ''), 'companies')
+        invalidate_companies()
         return True
     except Exception as e:
         st.error(f"회사 저장 실패: {e}")
@@ -877,6 +755,7 @@ def delete_company(company_id: int) -> bool:
             return False
         
         supabase.table('companies').delete().eq('id', company_id).execute()
+        invalidate_companies()
         return True
     except Exception as e:
         st.error(f"회사 삭제 실패: {e}")
@@ -907,6 +786,8 @@ def enhanced_save_company_with_recommendations(company_data: Dict) -> bool:
         
         # 저장된 회사의 ID 가져오기
         company_id = result.data[0]['id']
+        register_company_key(company_id, company_data['name'], 'companies')
+        invalidate_companies()
         
         # 2. 자동 추천 생성
         recommendations = generate_company_recommendations(company_data, company_id)
@@ -955,60 +836,14 @@ def generate_company_recommendations(company_data: Dict, company_id: int) -> Lis
 def generate_biz_recommendations(company_data: Dict, company_id: int) -> List[Dict]:
     """기업마당(biz2) 데이터 기반 추천 생성"""
     try:
-        # biz2 데이터 로드
-        result = supabase.table('biz2').select('*').execute()
-        if not result.data:
+        # 공유 공고 로드에서 갱신한 역색인/매칭 프레임 사용 (저장할 때마다 biz2를 다시 받지 않음)
+        load_announcements()
+        biz_df, biz_index = indexed_frame('biz2')
+        if biz_df is None or biz_df.empty:
             return []
         
-        biz_df = pd.DataFrame(result.data)
-        recommendations = []
-        
-        # 업종 매칭
-        industry = company_data.get('industry', '')
-        keywords = company_data.get('keywords', [])
-        
-        for _, announcement in biz_df.iterrows():
-            score = 0
-            matching_reasons = []
-            
-            # 업종 매칭
-            if industry and '지원분야' in announcement:
-                if industry in str(announcement['지원분야']):
-                    score += 80
-                    matching_reasons.append(f"업종 매칭: {industry}")
-            
-            # 키워드 매칭
-            for keyword in keywords:
-                if keyword and '공고명' in announcement:
-                    if keyword in str(announcement['공고명']):
-                        score += 70
-                        matching_reasons.append(f"키워드 매칭: {keyword}")
-                        break
-            
-            # 지역 매칭
-            region = company_data.get('region', '')
-            if region and '소관부처' in announcement:
-                if region in str(announcement['소관부처']):
-                    score += 60
-                    matching_reasons.append(f"지역 매칭: {region}")
-            
-            if score > 0:
-                recommendations.append({
-                    'company_id': company_id,
-                    'company_name': company_data['name'],
-                    'announcement_title': announcement.get('공고명', ''),
-                    'announcement_source': '기업마당',
-                    'total_score': score,
-                    'matching_reason': '; '.join(matching_reasons),
-                    'application_start_date': announcement.get('신청시작일자', ''),
-                    'application_end_date': announcement.get('신청종료일자', ''),
-                    'detail_page_url': announcement.get('공고상세URL', ''),
-                    'announcement_details': f"소관부처: {announcement.get('소관부처', 'N/A')}, 사업수행기관: {announcement.get('사업수행기관', 'N/A')}",
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                })
-        
-        return recommendations
+        # 후보 공고만 벡터 연산으로 채점
+        return score_biz_announcements(biz_df, company_data, company_id, index=biz_index)
         
     except Exception as e:
         st.error(f"biz2 추천 생성 실패: {e}")
@@ -1017,61 +852,14 @@ def generate_biz_recommendations(company_data: Dict, company_id: int) -> List[Di
 def generate_kstartup_recommendations(company_data: Dict, company_id: int) -> List[Dict]:
     """K-스타트업(kstartup2) 데이터 기반 추천 생성"""
     try:
-        # kstartup2 데이터 로드
-        result = supabase.table('kstartup2').select('*').execute()
-        if not result.data:
+        # 공유 공고 로드에서 갱신한 역색인/매칭 프레임 사용 (저장할 때마다 kstartup2를 다시 받지 않음)
+        load_announcements()
+        kstartup_df, kstartup_index = indexed_frame('kstartup2')
+        if kstartup_df is None or kstartup_df.empty:
             return []
         
-        kstartup_df = pd.DataFrame(result.data)
-        recommendations = []
-        
-        # 업종 및 키워드 매칭
-        industry = company_data.get('industry', '')
-        keywords = company_data.get('keywords', [])
-        
-        for _, announcement in kstartup_df.iterrows():
-            score = 0
-            matching_reasons = []
-            
-            # 업종 매칭
-            if industry and '지원사업분류' in announcement:
-                if industry in str(announcement['지원사업분류']):
-                    score += 80
-                    matching_reasons.append(f"업종 매칭: {industry}")
-            
-            # 키워드 매칭 (공고내용에서)
-            for keyword in keywords:
-                if keyword and '공고내용' in announcement:
-                    if keyword in str(announcement['공고내용']):
-                        score += 70
-                        matching_reasons.append(f"키워드 매칭: {keyword}")
-                        break
-            
-            # 사업아이템 매칭
-            if 'description' in company_data:
-                business_item = company_data['description']
-                if business_item and '공고내용' in announcement:
-                    if business_item in str(announcement['공고내용']):
-                        score += 90
-                        matching_reasons.append("사업아이템 매칭")
-            
-            if score > 0:
-                recommendations.append({
-                    'company_id': company_id,
-                    'company_name': company_data['name'],
-                    'announcement_title': announcement.get('사업공고명', ''),
-                    'announcement_source': 'K-스타트업',
-                    'total_score': score,
-                    'matching_reason': '; '.join(matching_reasons),
-                    'application_start_date': announcement.get('공고접수시작일시', ''),
-                    'application_end_date': announcement.get('공고접수종료일시', ''),
-                    'detail_page_url': announcement.get('상세페이지 url', ''),
-                    'announcement_details': announcement.get('공고내용', '')[:200] + '...' if len(str(announcement.get('공고내용', ''))) > 200 else announcement.get('공고내용', ''),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                })
-        
-        return recommendations
+        # 후보 공고만 벡터 연산으로 채점 (사업아이템은 description 사용)
+        return score_kstartup_announcements(kstartup_df, company_data, company_id, index=kstartup_index)
         
     except Exception as e:
         st.error(f"kstartup2 추천 생성 실패: {e}")
@@ -1080,12 +868,12 @@ def generate_kstartup_recommendations(company_data: Dict, company_id: int) -> Li
 def deduplicate_and_sort_recommendations(recommendations: List[Dict]) -> List[Dict]:
     """추천 결과 중복 제거 및 정렬"""
     try:
-        # 중복 제거 (공고제목 기준)
+        # 중복 제거 (공고 키 기준, 키가 없으면 공고제목)
         seen = set()
         unique_recommendations = []
         
         for rec in recommendations:
-            key = (rec['company_id'], rec['announcement_title'])
+            key = (rec['company_id'], rec.get(ANNOUNCEMENT_KEY_COLUMN) or rec['announcement_title'])
             if key not in seen:
                 seen.add(key)
                 unique_recommendations.append(rec)
@@ -1102,9 +890,18 @@ def deduplicate_and_sort_recommendations(recommendations: List[Dict]) -> List[Di
 def save_recommendations_to_supabase(company_id: int, recommendations: List[Dict]):
     """추천 결과를 Supabase에 저장"""
     try:
-        for rec in recommendations:
-            rec['company_id'] = company_id
-            supabase.table('recommend3').insert(rec).execute()
+        # 다중 행 upsert 한 번으로 저장 (같은 회사/공고는 갱신, 유니크 인덱스가 없으면 insert)
+        rows = [{**rec, 'company_id': company_id} for rec in recommendations]
+        # announcement_key 컬럼이 없는 테이블(supabase_announcement_keys.sql 미적용)에는 키 제외
+        available = get_available_columns(supabase, 'recommend3')
+        if available is not None and ANNOUNCEMENT_KEY_COLUMN not in available:
+            rows = [{k: v for k, v in row.items() if k != ANNOUNCEMENT_KEY_COLUMN} for row in rows]
+        upsert_rows(supabase, 'recommend3', rows, on_conflict=RECOMMENDATION_CONFLICT_COLUMNS,
+                    insert_fallback=True)
+        notify_table_changed('recommend3')
+        # 통합 추천 뷰는 백그라운드에서 갱신 (갱신 완료 후 뷰 워터마크가 바뀌면 다시 조회)
+        if view_available(supabase):
+            refresh_view(supabase, wait=False)
         
         st.info(f"📊 {len(recommendations)}개 추천이 recommend3 테이블에 저장되었습니다.")
         
@@ -1120,7 +917,9 @@ def initialize_notification_state(company_id: int):
             'last_updated': datetime.now().isoformat()
         }
         
-        supabase.table('notification_states').insert(notification_data).execute()
+        upsert_rows(supabase, 'notification_states', [notification_data], on_conflict=NOTIFICATION_CONFLICT_COLUMNS,
+                    insert_fallback=True)
+        notify_table_changed('notification_states')
         st.info(f"🔔 알림 상태가 초기화되었습니다.")
         
     except Exception as e:
@@ -1130,32 +929,30 @@ def delete_company(company_id: int) -> bool:
     """회사 삭제"""
     try:
         supabase.table('companies').delete().eq('id', company_id).execute()
+        invalidate_companies()
         return True
     except Exception as e:
         st.error(f"회사 삭제 실패: {e}")
         return False
 
-@st.cache_data(ttl=300)  # 5분 캐싱
-def load_notifications(company_id: int) -> List[str]:
-    """알림 상태 로드"""
+@cached_by_table_version('notification_states', client=get_supabase_client)
+def load_notifications(company_id: int) -> np.ndarray:
+    """알림 상태 로드 (확인한 공고 정수 ID 정렬 배열)"""
     try:
         # alpha_companies2의 음수 ID는 세션 상태에서 로드
         if company_id < 0:
             if 'notification_states' in st.session_state and company_id in st.session_state['notification_states']:
-                return st.session_state['notification_states'][company_id].get('last_seen_announcement_ids', [])
-            return []
+                return st.session_state['notification_states'][company_id].get(SEEN_COLUMN, seen_array())
+            return seen_array()
         
         # 양수 ID는 데이터베이스에서 로드
-        result = supabase.table('notification_states').select('last_seen_announcement_ids').eq('company_id', company_id).execute()
-        if result.data:
-            return result.data[0]['last_seen_announcement_ids'] or []
-        return []
+        return load_seen(supabase, company_id)
     except Exception as e:
         st.error(f"알림 상태 로드 실패: {e}")
-        return []
+        return seen_array()
 
-def save_notifications(company_id: int, announcement_ids: List[str]) -> bool:
-    """알림 상태 저장"""
+def save_notifications(company_id: int, announcement_ids: Iterable[int]) -> bool:
+    """알림 상태 저장 (새로 확인한 공고 정수 ID만 추가)"""
     try:
         # alpha_companies2의 음수 ID는 notification_states 테이블에 저장하지 않음
         if company_id < 0:
@@ -1163,28 +960,17 @@ def save_notifications(company_id: int, announcement_ids: List[str]) -> bool:
             if 'notification_states' not in st.session_state:
                 st.session_state['notification_states'] = {}
             
+            state = st.session_state['notification_states'].get(company_id, {})
             st.session_state['notification_states'][company_id] = {
-                'last_seen_announcement_ids': announcement_ids,
+                SEEN_COLUMN: np.union1d(state.get(SEEN_COLUMN, seen_array()), seen_array(announcement_ids)),
                 'last_updated': datetime.now().isoformat()
             }
+            notify_table_changed('notification_states')
             return True
         
-        # 양수 ID만 데이터베이스에 저장
-        # 기존 레코드 확인
-        existing = supabase.table('notification_states').select('id').eq('company_id', company_id).execute()
-        
-        data = {
-            'company_id': company_id,
-            'last_seen_announcement_ids': announcement_ids,
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        if existing.data:
-            # 업데이트
-            supabase.table('notification_states').update(data).eq('company_id', company_id).execute()
-        else:
-            # 삽입
-            supabase.table('notification_states').insert(data).execute()
+        # 양수 ID만 데이터베이스에 저장 (추가분만 서버에서 합집합)
+        add_seen(supabase, company_id, announcement_ids)
+        notify_table_changed('notification_states')
         
         return True
     except Exception as e:
@@ -1224,67 +1010,28 @@ def render_sidebar():
     # 기존 고객사 목록 (alpha_companies 테이블 사용)
     st.sidebar.subheader("기존 고객사")
     companies_df = load_companies()
+    if companies_cache.last_refresh:
+        st.sidebar.caption(f"🕒 목록 갱신: {companies_cache.last_refresh.strftime('%H:%M:%S')}")
     
     if not companies_df.empty:
-        # 검색 기능
+        # 검색 기능 (회사 데이터 버전당 한 번 구축한 색인에서 순위순 회사 ID 조회)
+        search_index = load_company_search_index()
         search_term = st.sidebar.text_input("🔍 회사 검색", key="existing_search")
-        if search_term:
-            if 'company_name' in companies_df.columns:
-                # 기업명으로 검색
-                filtered_companies = companies_df[
-                    companies_df['company_name'].str.contains(search_term, case=False, na=False)
-                ]
-            else:
-                # 기존 방식으로 검색
-                filtered_companies = companies_df[
-                    companies_df['name'].str.contains(search_term, case=False, na=False)
-                ]
-        else:
-            filtered_companies = companies_df
-        
-        # 회사 선택 (기업명 + 사업 아이템으로 표시)
-        if 'company_name' in filtered_companies.columns:
-            # 기업명이 있는 경우 기업명 + 사업 아이템으로 표시
-            company_display_names = filtered_companies['company_name'].tolist()
-            company_descriptions = filtered_companies['name'].tolist()  # 사업아이템 한 줄 소개
-            company_ids = filtered_companies['id'].tolist()
-            source_tables = filtered_companies.get('source_table', [''] * len(company_display_names)).tolist()
-            
-            if company_display_names:
-                # 신규 회사 구분하여 표시
-                display_options = []
-                for name, desc, id, source in zip(company_display_names, company_descriptions, company_ids, source_tables):
-                    if source == 'companies' or id > 0:  # 신규 회사 (companies 테이블 또는 양수 ID)
-                        display_options.append(f"🆕 신규 {name} - {desc}")
-                    else:  # 기존 회사 (alpha_companies2 테이블 또는 음수 ID)
-                        display_options.append(f"{name} - {desc}")
-                
-                selected_display = st.sidebar.selectbox(
-                    "회사 선택",
-                    display_options,
-                    key="existing_company_select"
-                )
-                if selected_display:
-                    # 선택된 기업명 추출 (🆕 신규 표시 제거)
-                    selected_company_name = selected_display.replace("🆕 신규 ", "").split(" - ")[0]
-                    selected_company_data = filtered_companies[filtered_companies['company_name'] == selected_company_name].iloc[0]
-                    st.session_state['selected_company'] = selected_company_data.to_dict()
-            else:
-                st.sidebar.info("검색 결과가 없습니다.")
+        company_ids = search_index.search(search_term) if search_term else search_index.ids
+        
+        # 회사 선택 (ID 기준, 표시는 기업명 + 사업 아이템)
+        if company_ids:
+            selected_id = st.sidebar.selectbox(
+                "회사 선택",
+                company_ids,
+                format_func=search_index.label,
+                key="existing_company_select"
+            )
+            selected_company_data = search_index.row(selected_id) if selected_id is not None else None
+            if selected_company_data is not None:
+                st.session_state['selected_company'] = selected_company_data
         else:
-            # 기업명이 없는 경우 기존 방식 사용
-            company_names = filtered_companies['name'].tolist()
-            if company_names:
-                selected_company = st.sidebar.selectbox(
-                    "회사 선택",
-                    company_names,
-                    key="existing_company_select"
-                )
-                if selected_company:
-                    selected_company_data = filtered_companies[filtered_companies['name'] == selected_company].iloc[0]
-                    st.session_state['selected_company'] = selected_company_data.to_dict()
-            else:
-                st.sidebar.info("검색 결과가 없습니다.")
+            st.sidebar.info("검색 결과가 없습니다.")
     else:
         st.sidebar.info("기존 고객사 데이터가 없습니다.")
     
@@ -1324,7 +1071,7 @@ def render_sidebar():
                 st.error("회사명을 입력해주세요.")
 
 
-def render_alerts_tab():
+def render_alerts_tab(recommendation_frames: Optional[Dict[str, pd.DataFrame]] = None):
     """신규 공고 알림 탭 렌더링 (recommendations3 테이블 사용)"""
     if 'selected_company' not in st.session_state:
         st.info("사이드바에서 회사를 선택해주세요.")
@@ -1341,20 +1088,15 @@ def render_alerts_tab():
         st.session_state['notifications_processed'] = False
         st.session_state['last_selected_company'] = company['id']
         # 개별 확인 상태도 초기화
-        st.session_state['individual_seen_announcements'] = []
+        st.session_state['individual_seen_announcements'] = set()
     
-    # 알림 상태 로드
+    # 알림 상태 로드 (확인한 공고 정수 ID 정렬 배열)
     last_seen_ids = load_notifications(company['id'])
     
-    # 활성 추천 데이터 로드 (recommend3 테이블 사용) - 캐싱된 데이터 사용
-    recommendations2_df = load_recommendations2(company['id'])
+    # 활성 추천 데이터 로드 (recommend3 테이블 사용) - 미리 로드된 데이터 사용
+    recommendations2_df = get_recommendation_frame(recommendation_frames, 'recommend3', company['id'])
     
     if not recommendations2_df.empty:
-        # 중복 제거: 공고명별로 가장 높은 총점수를 가진 레코드만 유지
-        if '공고제목' in recommendations2_df.columns and '총점수' in recommendations2_df.columns:
-            recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False).drop_duplicates(subset=['공고제목'], keep='first')
-            recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False)
-        
         # 활성 공고만 필터링 (마감일 기준) - 최적화된 필터링
         today = date.today()
         today_str = today.strftime('%Y-%m-%d')
@@ -1369,65 +1111,51 @@ def render_alerts_tab():
             active_recommendations = recommendations2_df
         
         if not active_recommendations.empty:
-            # 확인 처리된 공고 필터링
-            last_seen_names = []
-            if last_seen_ids:
-                # 기존 알림 상태에서 공고 이름들을 가져옴
-                last_seen_names = last_seen_ids
-            
-            # 개별 확인된 공고도 추가
-            individual_seen = st.session_state.get('individual_seen_announcements', [])
-            for name in individual_seen:
-                if name not in last_seen_names:
-                    last_seen_names.append(name)
+            # 확인 처리된 공고 ID (저장된 정렬 배열 + 이번 세션에서 개별 확인한 ID)
+            individual_seen = st.session_state.get('individual_seen_announcements', set())
+            seen_ids = np.union1d(last_seen_ids, seen_array(individual_seen))
+            
+            # 확인된 공고 여부 (공고 키의 정수 ID를 정렬 배열에서 이진 탐색)
+            active_ids = frame_announcement_int_ids(active_recommendations[ANNOUNCEMENT_KEY_COLUMN])
+            seen_mask = contains(seen_ids, active_ids)
             
             # 확인 처리되지 않은 공고만 필터링
-            if last_seen_names:
-                # 공고제목이 last_seen_names에 없는 것만 선택
-                new_announcements = active_recommendations[
-                    ~active_recommendations['공고제목'].isin(last_seen_names)
-                ]
-            else:
-                # 확인 처리된 공고가 없으면 모든 활성 공고를 신규로 표시
-                new_announcements = active_recommendations
+            new_announcements = active_recommendations[~seen_mask]
+            new_ids = active_ids[~seen_mask]
+            hidden_announcements = active_recommendations[seen_mask]
             
             # 확인 처리 버튼이 눌렸는지 확인
             if 'notifications_processed' not in st.session_state:
                 st.session_state['notifications_processed'] = False
             
             # 숨김 처리된 공고들 표시 (상단)
-            if last_seen_names:
-                with st.expander(f"📋 숨김 처리된 공고 ({len(last_seen_names)}개)", expanded=False):
+            if not hidden_announcements.empty:
+                with st.expander(f"📋 숨김 처리된 공고 ({len(hidden_announcements)}개)", expanded=False):
                     # 숨김 처리된 공고들을 원본 데이터에서 찾아서 표시
-                    hidden_announcements = active_recommendations[
-                        active_recommendations['공고제목'].isin(last_seen_names)
-                    ]
-                    
-                    if not hidden_announcements.empty:
-                        for idx, row in hidden_announcements.iterrows():
-                            with st.container():
-                                col1, col2, col3 = st.columns([3, 1, 1])
-                                
-                                with col1:
-                                    st.write(f"~~{row.get('공고제목', 'N/A')}~~")  # 취소선으로 표시
-                                    if '기관명' in row and pd.notna(row['기관명']):
-                                        st.caption(f"📋 {row['기관명']}")
-                                    if '매칭이유' in row and pd.notna(row['매칭이유']):
-                                        st.caption(f"💡 {row['매칭이유']}")
-                                
-                                with col2:
-                                    if '총점수' in row and pd.notna(row['총점수']):
-                                        st.metric("점수", f"{row['총점수']:.0f}")
-                                    if '적합도' in row and pd.notna(row['적합도']):
-                                        st.caption(f"적합도: {row['적합도']}")
-                                
-                                with col3:
-                                    if '접수마감일' in row and pd.notna(row['접수마감일']):
-                                        st.caption(f"마감: {row['접수마감일']}")
-                                    if '공고보기' in row and pd.notna(row['공고보기']):
-                                        st.link_button("공고보기", row['공고보기'])
-                                
-                                st.divider()
+                    for idx, row in hidden_announcements.iterrows():
+                        with st.container():
+                            col1, col2, col3 = st.columns([3, 1, 1])
+                            
+                            with col1:
+                                st.write(f"~~{row.get('공고제목', 'N/A')}~~")  # 취소선으로 표시
+                                if '기관명' in row and pd.notna(row['기관명']):
+                                    st.caption(f"📋 {row['기관명']}")
+                                if '매칭이유' in row and pd.notna(row['매칭이유']):
+                                    st.caption(f"💡 {row['매칭이유']}")
+                            
+                            with col2:
+                                if '총점수' in row and pd.notna(row['총점수']):
+                                    st.metric("점수", f"{row['총점수']:.0f}")
+                                if '적합도' in row and pd.notna(row['적합도']):
+                                    st.caption(f"적합도: {row['적합도']}")
+                            
+                            with col3:
+                                if '접수마감일' in row and pd.notna(row['접수마감일']):
+                                    st.caption(f"마감: {row['접수마감일']}")
+                                if '공고보기' in row and pd.notna(row['공고보기']):
+                                    st.link_button("공고보기", row['공고보기'])
+                            
+                            st.divider()
                     
                     # 새로고침 버튼
                     col1, col2, col3 = st.columns([1, 2, 1])
@@ -1435,11 +1163,7 @@ def render_alerts_tab():
                         if st.button("🔄 새로고침", use_container_width=True):
                             # 모든 확인 상태 초기화
                             st.session_state['notifications_processed'] = False
-                            st.session_state['individual_seen_announcements'] = []
-                            # 개별 공고 확인 상태도 초기화
-                            for key in list(st.session_state.keys()):
-                                if key.startswith(f"announcement_{company['id']}_"):
-                                    del st.session_state[key]
+                            st.session_state['individual_seen_announcements'] = set()
                             st.rerun()
                 
                 st.markdown("---")
@@ -1455,22 +1179,11 @@ def render_alerts_tab():
                 with col2:
                     # 모두 확인 처리 버튼 - 상단 오른쪽 고정
                     if st.button("✅ 모두 확인 처리", type="primary", use_container_width=True):
-                        # 현재 신규 공고들의 공고제목을 스냅샷에 저장
-                        current_names = new_announcements['공고제목'].tolist()
-                        
-                        # 기존 개별 확인된 공고와 합치기
-                        individual_seen = st.session_state.get('individual_seen_announcements', [])
-                        all_names = list(set(current_names + individual_seen))
+                        # 현재 신규 공고 ID와 세션에서 개별 확인한 ID만 추가 저장
+                        delta = np.union1d(new_ids, seen_array(individual_seen))
                         
-                        if save_notifications(company['id'], all_names):
-                            # 모든 공고를 개별 확인 상태로 설정
-                            for name in current_names:
-                                announcement_key = f"announcement_{company['id']}_{name}"
-                                st.session_state[announcement_key] = True
-                            
-                            # 개별 확인 목록 업데이트
-                            st.session_state['individual_seen_announcements'] = all_names
-                            
+                        if save_notifications(company['id'], delta):
+                            st.session_state['individual_seen_announcements'] = set()
                             st.rerun()
                         else:
                             st.error("❌ 확인 처리에 실패했습니다.")
@@ -1497,16 +1210,9 @@ def render_alerts_tab():
                     st.markdown('<div class="scrollable-container">', unsafe_allow_html=True)
                     
                     # 공고 목록을 간단한 카드 형태로 표시
-                    for idx, row in new_announcements.iterrows():
+                    for (idx, row), announcement_id in zip(new_announcements.iterrows(), new_ids.tolist()):
                         announcement_name = row.get('공고제목', 'N/A')
                         
-                        # 개별 공고 확인 상태 관리 (공고명 기반)
-                        announcement_key = f"announcement_{company['id']}_{announcement_name}"
-                        
-                        # 이미 확인된 공고는 건너뛰기
-                        if st.session_state.get(announcement_key, False):
-                            continue
-                            
                         with st.container():
                             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                             
@@ -1531,19 +1237,15 @@ def render_alerts_tab():
                             
                             with col4:
                                 # 개별 확인 버튼
-                                button_key = f"confirm_{company['id']}_{idx}_{announcement_name}"
+                                button_key = f"confirm_{company['id']}_{announcement_id}"
                                 if st.button("✅ 확인", key=button_key, type="secondary", use_container_width=True):
-                                    # 현재 확인된 공고 목록에 추가
-                                    current_seen = st.session_state.get('individual_seen_announcements', [])
-                                    if announcement_name not in current_seen:
-                                        current_seen.append(announcement_name)
-                                        st.session_state['individual_seen_announcements'] = current_seen
-                                    
-                                    # 개별 공고 확인 상태 저장
-                                    st.session_state[announcement_key] = True
+                                    # 세션에 먼저 반영 (저장 실패 시에도 이번 세션에서는 숨김)
+                                    current_seen = st.session_state.setdefault('individual_seen_announcements', set())
+                                    current_seen.add(announcement_id)
                                     
-                                    # 데이터베이스에 저장
-                                    if save_notifications(company['id'], current_seen):
+                                    # 데이터베이스에는 이 공고 ID만 추가
+                                    if save_notifications(company['id'], [announcement_id]):
+                                        current_seen.discard(announcement_id)
                                         st.success(f"✅ '{announcement_name}' 확인 처리되었습니다!")
                                         st.rerun()
                                     else:
@@ -1555,13 +1257,13 @@ def render_alerts_tab():
                             
             else:
                 # 신규 공고가 없는 경우
-                if last_seen_names:
+                if not hidden_announcements.empty:
                     # 확인 처리된 공고가 있는 경우
-                    st.info(f"✅ 모든 공고를 확인 처리했습니다! (총 {len(last_seen_names)}개 공고 확인됨)")
+                    st.info(f"✅ 모든 공고를 확인 처리했습니다! (총 {len(hidden_announcements)}개 공고 확인됨)")
                     
                     # 확인된 공고 목록을 접을 수 있는 형태로 표시
                     with st.expander("📋 확인된 공고 목록 보기", expanded=False):
-                        for i, name in enumerate(last_seen_names, 1):
+                        for i, name in enumerate(hidden_announcements['공고제목'], 1):
                             st.write(f"{i}. {name}")
                     
                     # 새로고침 버튼
@@ -1578,7 +1280,7 @@ def render_alerts_tab():
     else:
         st.info("활성 추천 데이터가 없습니다.")
 
-def render_roadmap_tab():
+def render_roadmap_tab(recommendation_frames: Optional[Dict[str, pd.DataFrame]] = None):
     """12개월 로드맵 탭 렌더링 (recommendations3 테이블 사용)"""
     if 'selected_company' not in st.session_state:
         st.info("사이드바에서 회사를 선택해주세요.")
@@ -1588,13 +1290,8 @@ def render_roadmap_tab():
     display_name = company.get('company_name', company.get('name', 'Unknown'))
     st.subheader(f"🗓️ {display_name} 12개월 로드맵")
     
-    # 추천 데이터 로드 (recommend3 테이블 사용)
-    recommendations2_df = load_recommendations2(company['id'])
-    
-    # 중복 제거: 공고명별로 가장 높은 총점수를 가진 레코드만 유지
-    if not recommendations2_df.empty and '공고제목' in recommendations2_df.columns and '총점수' in recommendations2_df.columns:
-        recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False).drop_duplicates(subset=['공고제목'], keep='first')
-        recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False)
+    # 추천 데이터 로드 (recommend3 테이블 사용) - 미리 로드된 데이터 사용
+    recommendations2_df = get_recommendation_frame(recommendation_frames, 'recommend3', company['id'])
     
     if not recommendations2_df.empty:
         # 접수시작일 컬럼 확인
@@ -1602,69 +1299,24 @@ def render_roadmap_tab():
             st.error("접수시작일 컬럼을 찾을 수 없습니다.")
             return
         
-        # 접수시작일에서 월을 추출하는 함수 - 최적화된 버전
-        @st.cache_data
-        def extract_month_from_date(date_str):
-            """접수시작일에서 월을 추출하는 함수 - 캐싱 적용"""
-            if pd.isna(date_str) or date_str == '' or str(date_str).strip() == '':
-                return None
-            
-            date_str = str(date_str).strip()
-            
-            # YYYY-MM-DD 형식인 경우 (가장 일반적) - 최적화
-            if len(date_str) == 10 and date_str.count('-') == 2:
-                try:
-                    return int(date_str.split('-')[1])  # 월 부분만 추출
-                except:
-                    pass
-            
-            # N월 형식인 경우 (예: "3월", "12월")
-            if '월' in date_str:
-                try:
-                    month_str = date_str.replace('월', '').strip()
-                    month_num = int(month_str)
-                    if 1 <= month_num <= 12:
-                        return month_num
-                except:
-                    pass
-            
-            # MM 형식인 경우 (예: "03", "12")
-            try:
-                month_num = int(date_str)
-                if 1 <= month_num <= 12:
-                    return month_num
-            except:
-                pass
-            
-            return None
-        
-        # 접수시작일에서 월 추출
-        recommendations2_df['접수월'] = recommendations2_df['접수시작일'].apply(extract_month_from_date)
-        
-        # 월별 데이터 준비
-        monthly_data = []
-        monthly_matches = {}  # DataFrame을 별도로 저장
+        # 이번 달부터 12개월 구간별 행 위치 (로더에서 만든 접수월번호 재사용, groupby 한 번)
+        window, month_positions = roadmap_buckets(recommendations2_df)
         
-        for month in range(1, 13):
-            # 접수월이 해당 월과 일치하는 공고 필터링
-            month_matches = recommendations2_df[
-                recommendations2_df['접수월'] == month
-            ]
-            
-            monthly_data.append({
-                'Month': f"{month}월",
-                'Count': len(month_matches)
-            })
-            
-            # DataFrame을 별도 딕셔너리에 저장
-            monthly_matches[month] = month_matches
+        # 월별 데이터 준비 (연도 경계를 넘는 구간은 연도를 함께 표시)
+        monthly_data = [
+            {
+                'Month': f"{period.year}년 {period.month}월",
+                'Count': len(month_positions.get(offset, ()))
+            }
+            for offset, period in enumerate(window)
+        ]
         
         # 월별 차트 표시
         chart_data = pd.DataFrame(monthly_data)
         if not chart_data.empty:
             # 공고 수 차트만 표시
             chart_count = alt.Chart(chart_data).mark_bar(color='lightblue').encode(
-                x=alt.X('Month:O', sort=['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']),
+                x=alt.X('Month:O', sort=chart_data['Month'].tolist()),
                 y='Count:Q',
                 tooltip=['Month', 'Count']
             ).properties(
@@ -1675,10 +1327,7 @@ def render_roadmap_tab():
             st.altair_chart(chart_count)
         
         # 월별 상세 정보
-        for month_data in monthly_data:
-            month_num = int(month_data['Month'].replace('월', ''))
-            month_matches_df = monthly_matches.get(month_num, pd.DataFrame())
-            
+        for offset, month_data in enumerate(monthly_data):
             # 월별 요약 정보 표시
             if month_data['Count'] > 0:
                 st.success(f"📅 {month_data['Month']}: {month_data['Count']}개 공고")
@@ -1686,13 +1335,8 @@ def render_roadmap_tab():
                 st.info(f"📅 {month_data['Month']}: 추천 공고 없음")
             
             with st.expander(f"{month_data['Month']} 상세 정보 ({month_data['Count']}개 공고)"):
-                if not month_matches_df.empty:
-                    # 추천순위로 정렬 (있는 경우)
-                    if '추천순위' in month_matches_df.columns:
-                        month_matches_df = month_matches_df.sort_values('추천순위')
-                    elif '총점수' in month_matches_df.columns:
-                        month_matches_df = month_matches_df.sort_values('총점수', ascending=False)
-                    
+                if offset in month_positions:
+                    month_matches_df = recommendations2_df.iloc[month_positions[offset]]
                     # 표시할 컬럼들 정의
                     display_columns = ['총점수', '적합도', '공고제목', '공고보기', '접수시작일', '접수마감일', '지역', '기관명', '매칭이유']
                     
@@ -1750,7 +1394,62 @@ def render_roadmap_tab():
     else:
         st.info("추천 데이터가 없습니다.")
 
-def render_recommendations2_tab():
+def render_status_review(df: pd.DataFrame, company_id: int):
+    """승인/반려 검토 목록 (페이지 단위 편집 표, 변경된 상태는 저장 버튼으로 한 번에 반영)
+
+    행마다 버튼/컨테이너를 만들지 않고 현재 페이지만 st.data_editor 하나로 렌더링합니다.
+    """
+    # 페이지 크기와 커서 (필터로 페이지 수가 줄면 마지막 페이지로 맞춤)
+    col1, col2, col3, col4 = st.columns([1, 1, 2, 1])
+    with col1:
+        page_size = st.selectbox("페이지 크기", REVIEW_PAGE_SIZES, key="review_page_size")
+    page_count = max(1, -(-len(df) // page_size))
+    page = min(st.session_state.get('review_page', 1), page_count)
+    with col2:
+        if st.button("◀ 이전", disabled=page <= 1, use_container_width=True):
+            st.session_state['review_page'] = page - 1
+            st.rerun()
+    with col3:
+        st.caption(f"{page} / {page_count} 페이지 (총 {len(df)}개)")
+    with col4:
+        if st.button("다음 ▶", disabled=page >= page_count, use_container_width=True):
+            st.session_state['review_page'] = page + 1
+            st.rerun()
+    
+    page_df = df.iloc[(page - 1) * page_size:page * page_size]
+    columns = [col for col in REVIEW_COLUMNS if col in page_df.columns]
+    review_df = page_df[columns].copy()
+    review_df.insert(0, '상태', page_df['status'].map(STATUS_LABELS).fillna(STATUS_LABELS[DEFAULT_STATUS]))
+    review_df.index = page_df[ANNOUNCEMENT_KEY_COLUMN]
+    
+    edited_df = st.data_editor(
+        review_df,
+        key=f"review_editor_{company_id}_{page}_{page_size}",
+        hide_index=True,
+        width='stretch',
+        disabled=columns,
+        column_config={
+            "상태": st.column_config.SelectboxColumn("상태", options=list(STATUS_LABELS.values()), required=True, width="small"),
+            "공고제목": st.column_config.TextColumn("공고명", width="large"),
+            "총점수": st.column_config.NumberColumn("점수", format="%.0f", width="small"),
+            "접수시작일": st.column_config.TextColumn("접수시작일", width="small"),
+            "접수마감일": st.column_config.TextColumn("접수마감일", width="small"),
+            "매칭이유": st.column_config.TextColumn("매칭 이유", width="large"),
+            "공고보기": st.column_config.LinkColumn("공고보기", width="medium", display_text="공고 보기")
+        }
+    )
+    
+    # 상태가 바뀐 행만 모아 한 번에 저장
+    changed = edited_df['상태'] != review_df['상태']
+    label_statuses = {label: status for status, label in STATUS_LABELS.items()}
+    statuses = edited_df.loc[changed, '상태'].map(label_statuses).to_dict()
+    if st.button(f"💾 상태 변경 저장 ({len(statuses)}건)", type="primary", disabled=not statuses):
+        titles = review_df.loc[changed, '공고제목'].to_dict() if '공고제목' in review_df.columns else None
+        if update_recommendation_statuses(company_id, statuses, titles):
+            st.success(f"✅ {len(statuses)}개 공고의 상태가 저장되었습니다.")
+            st.rerun()
+
+def render_recommendations2_tab(recommendation_frames: Optional[Dict[str, pd.DataFrame]] = None):
     """추천 데이터 탭 렌더링 (recommendations3 테이블)"""
     if 'selected_company' not in st.session_state:
         st.info("사이드바에서 회사를 선택해주세요.")
@@ -1760,23 +1459,18 @@ def render_recommendations2_tab():
     display_name = company.get('company_name', company.get('name', 'Unknown'))
     st.subheader(f"📊 {display_name} 추천 데이터")
     
-    # 탭 선택
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["전체 추천", "활성 공고만", "추천(지역)", "추천(키워드)", "추천(규칙)", "추천(3대장)", "필터 옵션"])
+    # 화면 선택 (선택된 화면의 추천 테이블만 조회/렌더링)
+    view = select_view(RECOMMENDATION_VIEWS, key='recommendation_view')
     
-    with tab1:
+    if view == "전체 추천":
         # 전체 추천 (recommendations3 테이블만 사용)
-        recommendations2_df = load_recommendations2(company['id'])
+        recommendations2_df = get_recommendation_frame(recommendation_frames, 'recommend3', company['id'])
         
         if not recommendations2_df.empty:
             # 투자금액을 지원금액으로 컬럼명 변경
             if '투자금액' in recommendations2_df.columns:
                 recommendations2_df = recommendations2_df.rename(columns={'투자금액': '지원금액'})
             
-            # 중복 제거: 공고명별로 가장 높은 총점수를 가진 레코드만 유지
-            if '공고제목' in recommendations2_df.columns and '총점수' in recommendations2_df.columns:
-                recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False).drop_duplicates(subset=['공고제목'], keep='first')
-                recommendations2_df = recommendations2_df.sort_values('총점수', ascending=False)
-            
             st.info(f"📊 총 {len(recommendations2_df)}개의 추천 공고 (recommend3 테이블, 중복 제거)")
             
             # 컬럼명을 한글로 매핑 (공고보기 링크 추가, 순서 조정)
@@ -1793,10 +1487,6 @@ def render_recommendations2_tab():
                     # dtype 접근에 실패하면 문자열로 변환
                     display_df[col] = display_df[col].astype(str)
             
-            # 추천순위로 정렬
-            if '추천순위' in display_df.columns:
-                display_df = display_df.sort_values('추천순위')
-            
             st.dataframe(
                 display_df,
                 width='stretch',
@@ -1813,18 +1503,21 @@ def render_recommendations2_tab():
                     "적합도": st.column_config.TextColumn("적합도", width="small")
                 }
             )
+            
+            # 공고상세정보(doc_text)는 목록 조회에서 제외하고, 펼칠 때만 단건 조회
+            if '공고제목' in recommendations2_df.columns and st.toggle("📄 공고 상세정보 보기", key="recommend3_detail_toggle"):
+                detail_title = st.selectbox("공고 선택", recommendations2_df['공고제목'].dropna().tolist(), key="recommend3_detail_title")
+                if detail_title:
+                    detail_company = recommendations2_df.loc[recommendations2_df['공고제목'] == detail_title, '회사명'].iloc[0] if '회사명' in recommendations2_df.columns else display_name
+                    detail_text = load_recommendation_detail(detail_company, detail_title)
+                    st.text_area("공고상세정보", detail_text or "상세정보가 없습니다.", height=300, disabled=True)
         else:
             st.info("해당 회사의 추천 결과가 없습니다.")
     
-    with tab2:
+    elif view == "활성 공고만":
         # 활성 공고만 (recommend_active3 테이블 사용)
-        active_recommendations_df = load_recommendations3_active(company['id'])
+        active_recommendations_df = get_recommendation_frame(recommendation_frames, 'active3', company['id'])
         if not active_recommendations_df.empty:
-            # 중복 제거: 공고명별로 가장 높은 총점수를 가진 레코드만 유지
-            if '공고제목' in active_recommendations_df.columns and '총점수' in active_recommendations_df.columns:
-                active_recommendations_df = active_recommendations_df.sort_values('총점수', ascending=False).drop_duplicates(subset=['공고제목'], keep='first')
-                active_recommendations_df = active_recommendations_df.sort_values('총점수', ascending=False)
-            
             st.success(f"🟢 {len(active_recommendations_df)}개의 활성 공고가 있습니다! (recommend_active3 테이블, 중복 제거)")
             
             display_columns = ['총점수', '적합도', '공고제목', '지원가능여부', '공고보기', '접수시작일', '접수마감일', '지역', '기관명', '매칭이유']
@@ -1859,15 +1552,11 @@ def render_recommendations2_tab():
         else:
             st.info("활성 추천 데이터가 없습니다.")
     
-    with tab3:
+    elif view == "추천(지역)":
         # 추천(지역) 탭 (recommend_region4 테이블 사용)
-        region_recommendations_df = load_recommendations_region4(company['id'])
+        region_recommendations_df = get_recommendation_frame(recommendation_frames, 'region4', company['id'])
         
         if not region_recommendations_df.empty:
-            # 총점수로 정렬
-            if '총점수' in region_recommendations_df.columns:
-                region_recommendations_df = region_recommendations_df.sort_values('총점수', ascending=False)
-            
             st.success(f"🗺️ {len(region_recommendations_df)}개의 지역별 추천이 있습니다! (recommend_region4 테이블)")
             
             # 지역별 통계 표시
@@ -1945,15 +1634,11 @@ def render_recommendations2_tab():
         else:
             st.info("지역별 추천 데이터가 없습니다.")
     
-    with tab4:
+    elif view == "추천(키워드)":
         # 추천(키워드) 탭 (recommend_keyword4 테이블 사용)
-        keyword_recommendations_df = load_recommendations_keyword4(company['id'])
+        keyword_recommendations_df = get_recommendation_frame(recommendation_frames, 'keyword4', company['id'])
         
         if not keyword_recommendations_df.empty:
-            # 키워드점수로 정렬
-            if '키워드점수' in keyword_recommendations_df.columns:
-                keyword_recommendations_df = keyword_recommendations_df.sort_values('키워드점수', ascending=False)
-            
             st.success(f"🔑 {len(keyword_recommendations_df)}개의 키워드별 추천이 있습니다! (recommend_keyword4 테이블)")
             
             # 키워드 점수 통계 표시
@@ -2014,15 +1699,11 @@ def render_recommendations2_tab():
         else:
             st.info("키워드별 추천 데이터가 없습니다.")
     
-    with tab5:
+    elif view == "추천(규칙)":
         # 추천(규칙) 탭 (recommend_rules4 테이블 사용)
-        rules_recommendations_df = load_recommendations_rules4(company['id'])
+        rules_recommendations_df = get_recommendation_frame(recommendation_frames, 'rules4', company['id'])
         
         if not rules_recommendations_df.empty:
-            # 통과여부로 정렬
-            if '통과여부' in rules_recommendations_df.columns:
-                rules_recommendations_df = rules_recommendations_df.sort_values('통과여부', ascending=False)
-            
             st.success(f"📋 {len(rules_recommendations_df)}개의 규칙별 추천이 있습니다! (recommend_rules4 테이블)")
             
             # 통과 통계 표시
@@ -2091,15 +1772,11 @@ def render_recommendations2_tab():
         else:
             st.info("규칙별 추천 데이터가 없습니다.")
     
-    with tab6:
+    elif view == "추천(3대장)":
         # 추천(3대장) 탭 (recommend_priority4 테이블 사용)
-        priority_recommendations_df = load_recommendations_priority4(company['id'])
+        priority_recommendations_df = get_recommendation_frame(recommendation_frames, 'priority4', company['id'])
         
         if not priority_recommendations_df.empty:
-            # 총점수로 정렬
-            if '총점수' in priority_recommendations_df.columns:
-                priority_recommendations_df = priority_recommendations_df.sort_values('총점수', ascending=False)
-            
             st.success(f"🏆 {len(priority_recommendations_df)}개의 3대장별 추천이 있습니다! (recommend_priority4 테이블)")
             
             # 3대장 점수 통계 표시
@@ -2177,12 +1854,12 @@ def render_recommendations2_tab():
         else:
             st.info("3대장별 추천 데이터가 없습니다.")
     
-    with tab7:
+    elif view == "필터 옵션":
         # 필터 옵션 탭
         st.subheader("🔍 필터 옵션")
         
-        # 전체 추천 데이터 로드
-        recommendations2_df = load_recommendations2(company['id'])
+        # 전체 추천 데이터 (미리 로드된 데이터 사용)
+        recommendations2_df = get_recommendation_frame(recommendation_frames, 'recommend3', company['id'])
         
         if not recommendations2_df.empty:
             # 상태별 필터링 옵션 (간단하게)
@@ -2194,82 +1871,30 @@ def render_recommendations2_tab():
             with col2:
                 show_rejected = st.checkbox("반려된 공고", value=False, key="filter_rejected")
             
-            # 필터 적용
-            filtered_df = recommendations2_df.copy()
+            # 필터 적용 (회사 상태를 한 번에 조회해 status 컬럼에 매핑)
+            filtered_df = apply_recommendation_statuses(recommendations2_df, company['id'])
             
-            # 상태별 필터링 (세션 상태 기반)
+            # 상태별 필터링
             if show_approved or show_rejected:
-                # 세션 상태에서 필터링
-                company_name = company.get('company_name', company.get('name', ''))
-                filtered_rows = []
-                
-                for idx, row in filtered_df.iterrows():
-                    current_status = get_recommendation_status(company_name, row['공고제목'])
-                    
-                    if show_approved and current_status == 'approved':
-                        filtered_rows.append(idx)
-                    elif show_rejected and current_status == 'rejected':
-                        filtered_rows.append(idx)
-                
-                if filtered_rows:
-                    filtered_df = filtered_df.loc[filtered_rows]
-                else:
-                    filtered_df = pd.DataFrame()  # 빈 결과
+                selected_statuses = [status for status, selected in [('approved', show_approved), ('rejected', show_rejected)] if selected]
+                filtered_df = filtered_df[filtered_df['status'].isin(selected_statuses)]
             else:
                 # 아무것도 선택하지 않으면 모든 공고 표시
                 pass
             
+            # 점수 기준 필터링
+            if '총점수' in filtered_df.columns:
+                scores = pd.to_numeric(filtered_df['총점수'], errors='coerce')
+                max_score = int(scores.max()) if scores.notna().any() else 0
+                min_score = st.slider("최소 점수", 0, max(max_score, 1), 0, key="review_min_score")
+                if min_score > 0:
+                    filtered_df = filtered_df[scores >= min_score]
+            
             # 결과 표시
             st.write(f"**필터링 결과: {len(filtered_df)}개 공고**")
             
             if not filtered_df.empty:
-                # 각 공고에 대해 승인/반려 버튼과 함께 표시
-                for i, (idx, row) in enumerate(filtered_df.iterrows()):
-                    with st.container():
-                        # 세션 상태에서 현재 상태 확인
-                        company_name = company.get('company_name', company.get('name', ''))
-                        current_status = get_recommendation_status(company_name, row['공고제목'])
-                        
-                        # 상태에 따른 색깔 표시
-                        if current_status == 'approved':
-                            st.success(f"✅ 승인됨: {row['공고제목']}")
-                        elif current_status == 'rejected':
-                            st.error(f"❌ 반려됨: {row['공고제목']}")
-                        else:
-                            st.info(f"⏳ 대기중: {row['공고제목']}")
-                        
-                        # 공고 정보 표시
-                        col1, col2, col3 = st.columns([6, 1, 1])
-                        
-                        with col1:
-                            st.write(f"**공고명**: {row['공고제목']}")
-                            st.write(f"**접수기간**: {row.get('접수시작일', 'N/A')} ~ {row.get('접수마감일', 'N/A')}")
-                            st.write(f"**총점수**: {row.get('총점수', 'N/A')}")
-                            st.write(f"**매칭이유**: {row.get('매칭이유', 'N/A')}")
-                            if '공고보기' in row and pd.notna(row['공고보기']):
-                                st.write(f"**공고보기**: [링크]({row['공고보기']})")
-                        
-                        with col2:
-                            if current_status == 'approved':
-                                if st.button("✅ 승인됨", key=f"approve_{i}", type="primary"):
-                                    if update_recommendation_status(company_name, row['공고제목'], 'pending'):
-                                        st.rerun()
-                            else:
-                                if st.button("승인", key=f"approve_{i}", type="primary"):
-                                    if update_recommendation_status(company_name, row['공고제목'], 'approved'):
-                                        st.rerun()
-                        
-                        with col3:
-                            if current_status == 'rejected':
-                                if st.button("❌ 반려됨", key=f"reject_{i}", type="secondary"):
-                                    if update_recommendation_status(company_name, row['공고제목'], 'pending'):
-                                        st.rerun()
-                            else:
-                                if st.button("반려", key=f"reject_{i}", type="secondary"):
-                                    if update_recommendation_status(company_name, row['공고제목'], 'rejected'):
-                                        st.rerun()
-                        
-                        st.divider()
+                render_status_review(filtered_df, company['id'])
             else:
                 st.info("필터 조건에 맞는 공고가 없습니다.")
         else:
@@ -2310,17 +1935,18 @@ def main():
             else:
                 st.metric("업종", company.get('industry', 'N/A'))
         
-        # 탭 구성
-        tab1, tab2, tab3 = st.tabs(["📊 추천 데이터", "🔔 신규 공고 알림", "🗓️ 12개월 로드맵"])
+        # 화면 선택 (선택된 화면만 렌더링, 숨겨진 화면의 조회 결과는 캐시에 유지)
+        view = select_view(MAIN_VIEWS, key='main_view')
         
-        with tab1:
-            render_recommendations2_tab()
+        # 통합 추천 뷰가 있으면 요청 1회로 로드, 없으면 화면마다 필요한 테이블만 조회
+        recommendation_frames = load_shared_recommendations(company['id'])
         
-        with tab2:
-            render_alerts_tab()
-        
-        with tab3:
-            render_roadmap_tab()
+        if view == MAIN_VIEWS[0]:
+            render_recommendations2_tab(recommendation_frames)
+        elif view == MAIN_VIEWS[1]:
+            render_alerts_tab(recommendation_frames)
+        else:
+            render_roadmap_tab(recommendation_frames)
     else:
         st.info("👈 사이드바에서 회사를 선택해주세요.")
 
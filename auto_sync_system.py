@@ -7,150 +7,192 @@ from supabase import create_client
 from config import SUPABASE_URL, SUPABASE_KEY
 import os
 import time
+import json
+import threading
 from datetime import datetime
-import re
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from entity_resolver import EntityResolver
+from text_normalization import COMPANY_KEYWORD_PATTERN, ANNOUNCEMENT_KEYWORD_PATTERN
+from supabase_loader import fetch_frame
 
 supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# 마지막 저장 이후 이 시간(초) 동안 추가 저장이 없으면 동기화 (연속 저장은 한 번으로 합침)
+DEBOUNCE_SECONDS = 2.0
+
+# 추천 행 식별 컬럼과 동기화 대상 값 컬럼
+SYNC_KEY_COLUMNS = ['기업명', '공고이름']
+SYNC_VALUE_COLUMNS = ['추천이유', '투자금액', '마감일', '공고상태']
+
 class CSVChangeHandler(FileSystemEventHandler):
-    """CSV 파일 변경 감지 핸들러"""
+    """CSV 파일 변경 감지 핸들러 (디바운스 타이머로 연속 저장을 한 번의 동기화로 합침)"""
     
-    def __init__(self, csv_path):
+    def __init__(self, csv_path, debounce_seconds=DEBOUNCE_SECONDS):
         self.csv_path = csv_path
-        self.last_modified = 0
+        self.debounce_seconds = debounce_seconds
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        # 동기화는 한 번에 하나만 실행
+        self._sync_lock = threading.Lock()
         
     def on_modified(self, event):
         if event.is_directory:
             return
             
         if event.src_path == self.csv_path:
-            current_time = time.time()
-            # 중복 실행 방지 (1초 내 중복 실행 방지)
-            if current_time - self.last_modified < 1:
-                return
-            self.last_modified = current_time
-            
-            print(f"\n🔄 CSV 파일 변경 감지: {event.src_path}")
+            self._schedule_sync(event.src_path)
+    
+    def on_moved(self, event):
+        # 임시 파일에 쓴 뒤 이름을 바꾸는 방식으로 저장하는 편집기 대응
+        if not event.is_directory and getattr(event, 'dest_path', None) == self.csv_path:
+            self._schedule_sync(event.dest_path)
+    
+    def _schedule_sync(self, path):
+        """저장 이벤트마다 타이머를 다시 시작 (마지막 저장 후 debounce_seconds 뒤 1회 실행)"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._run_sync, args=(path,))
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _run_sync(self, path):
+        with self._sync_lock:
+            print(f"\n🔄 CSV 파일 변경 감지: {path}")
             print(f"   시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
-            # 잠시 대기 (파일 쓰기 완료 대기)
-            time.sleep(2)
-            
-            # Supabase 동기화 실행
+            # Supabase 동기화 실행 (변경된 행만)
             sync_csv_to_supabase(self.csv_path)
 
-def find_best_company_match(csv_company_name, companies_df):
-    """최적의 회사 매칭 찾기 (100% 성공률)"""
-    # 1. 정확한 매칭
-    exact_match = companies_df[companies_df['name'] == csv_company_name]
-    if not exact_match.empty:
-        return exact_match.iloc[0]['id']
-    
-    # 2. 부분 매칭 (정규식 이스케이프)
-    escaped_name = re.escape(csv_company_name)
-    partial_match = companies_df[companies_df['name'].str.contains(escaped_name, case=False, na=False, regex=True)]
-    if not partial_match.empty:
-        return partial_match.iloc[0]['id']
-    
-    # 3. 퍼지 매칭
-    from fuzzywuzzy import fuzz, process
-    best_match = process.extractOne(csv_company_name, companies_df['name'].tolist(), scorer=fuzz.ratio)
-    if best_match and best_match[1] >= 70:
-        matched_company = companies_df[companies_df['name'] == best_match[0]]
-        if not matched_company.empty:
-            return matched_company.iloc[0]['id']
-    
-    # 4. 키워드 매칭
-    csv_keywords = re.findall(r'[가-힣]{2,4}', csv_company_name)
-    for keyword in csv_keywords:
-        keyword_match = companies_df[companies_df['name'].str.contains(keyword, case=False, na=False)]
-        if not keyword_match.empty:
-            return keyword_match.iloc[0]['id']
-    
-    return None
+def sync_state_path(csv_path):
+    """마지막 동기화 시점의 행별 해시 저장 파일 경로"""
+    return f"{csv_path}.sync_state.json"
 
-def find_best_announcement_match(csv_announcement_title, announcements_df):
-    """최적의 공고 매칭 찾기 (100% 성공률)"""
-    # 1. 정확한 매칭
-    exact_match = announcements_df[announcements_df['title'] == csv_announcement_title]
-    if not exact_match.empty:
-        return exact_match.iloc[0]['id']
-    
-    # 2. 부분 매칭 (정규식 이스케이프)
-    escaped_title = re.escape(csv_announcement_title)
-    partial_match = announcements_df[announcements_df['title'].str.contains(escaped_title, case=False, na=False, regex=True)]
-    if not partial_match.empty:
-        return partial_match.iloc[0]['id']
-    
-    # 3. 퍼지 매칭
-    from fuzzywuzzy import fuzz, process
-    best_match = process.extractOne(csv_announcement_title, announcements_df['title'].tolist(), scorer=fuzz.ratio)
-    if best_match and best_match[1] >= 70:
-        matched_announcement = announcements_df[announcements_df['title'] == best_match[0]]
-        if not matched_announcement.empty:
-            return matched_announcement.iloc[0]['id']
+def load_sync_state(csv_path):
+    """마지막 동기화 상태 로드 ({행 키: 내용 해시})"""
+    path = sync_state_path(csv_path)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('row_hashes', {})
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️ 동기화 상태 파일을 읽을 수 없어 전체 동기화합니다: {e}")
+        return {}
+
+def save_sync_state(csv_path, row_hashes):
+    """동기화 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = sync_state_path(csv_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'updated_at': datetime.now().isoformat(), 'row_hashes': row_hashes}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def compute_row_hashes(df):
+    """행 키(기업명+공고이름) -> 동기화 대상 컬럼 내용 해시 (벡터 연산)"""
+    value_columns = [c for c in SYNC_KEY_COLUMNS + SYNC_VALUE_COLUMNS if c in df.columns]
+    hashes = pd.util.hash_pandas_object(df[value_columns].fillna('').astype(str), index=False)
+    keys = df['기업명'].astype(str) + '\x1f' + df['공고이름'].astype(str)
+    return pd.Series(hashes.astype(str).values, index=keys.values)
+
+def diff_csv_rows(df, previous_hashes):
+    """이전 동기화 대비 추가/변경/삭제된 행 계산
+
+    반환: (동기화할 행 DataFrame, 추가 키, 변경 키, 삭제 키, 현재 해시)
+    """
+    hashes = compute_row_hashes(df)
+    # 같은 기업/공고 행이 여러 번 있으면 마지막 행 기준
+    last_rows = ~hashes.index.duplicated(keep='last')
+    df = df[last_rows]
+    hashes = hashes[last_rows]
     
-    # 4. 키워드 매칭
-    csv_keywords = re.findall(r'[가-힣]{2,6}', csv_announcement_title)
-    for keyword in csv_keywords:
-        keyword_match = announcements_df[announcements_df['title'].str.contains(keyword, case=False, na=False)]
-        if not keyword_match.empty:
-            return keyword_match.iloc[0]['id']
+    previous = pd.Series(previous_hashes, dtype=object)
+    is_new = ~hashes.index.isin(previous.index)
+    is_changed = ~is_new & (hashes != previous.reindex(hashes.index)).values
+    deleted = previous.index[~previous.index.isin(hashes.index)].tolist()
     
-    return None
+    dirty = is_new | is_changed
+    return (
+        df[dirty],
+        hashes.index[is_new].tolist(),
+        hashes.index[is_changed].tolist(),
+        deleted,
+        hashes
+    )
+
+def find_best_company_match(csv_company_name, companies_df, resolver=None):
+    """최적의 회사 매칭 찾기 (100% 성공률)
+
+    정확/정규화/부분/퍼지/키워드 매칭을 색인(EntityResolver)으로 수행합니다.
+    여러 행을 매칭할 때는 build_company_resolver()로 만든 resolver를 넘겨 재사용하세요.
+    """
+    resolver = resolver or build_company_resolver(companies_df)
+    return resolver.resolve(csv_company_name)
 
-def sync_csv_to_supabase(csv_path):
-    """CSV 파일을 Supabase에 동기화 (100% 성공률) - 새로운 컬럼명 지원"""
+def find_best_announcement_match(csv_announcement_title, announcements_df, resolver=None):
+    """최적의 공고 매칭 찾기 (100% 성공률)
+
+    여러 행을 매칭할 때는 build_announcement_resolver()로 만든 resolver를 넘겨 재사용하세요.
+    """
+    resolver = resolver or build_announcement_resolver(announcements_df)
+    return resolver.resolve(csv_announcement_title)
+
+def build_company_resolver(companies_df):
+    """회사명 매칭 색인 구축"""
+    return EntityResolver.from_frame(companies_df, 'name', keyword_pattern=COMPANY_KEYWORD_PATTERN)
+
+def build_announcement_resolver(announcements_df):
+    """공고명 매칭 색인 구축"""
+    return EntityResolver.from_frame(announcements_df, 'title', keyword_pattern=ANNOUNCEMENT_KEYWORD_PATTERN)
+
+def sync_csv_to_supabase(csv_path, full_sync=False):
+    """CSV 파일을 Supabase에 동기화 (100% 성공률) - 새로운 컬럼명 지원
+
+    마지막으로 성공한 동기화의 행별 해시와 비교하여 추가/변경된 행만 반영합니다.
+    full_sync=True이면 모든 행을 다시 반영합니다.
+    """
     try:
         print("   📊 CSV 파일 읽는 중...")
         df = pd.read_csv(csv_path, encoding='utf-8-sig')
         
-        # 컬럼명 확인 및 매핑
+        # 컬럼명 확인
         print(f"   📋 CSV 컬럼명: {list(df.columns)}")
         
-        # 컬럼명 매핑 (기존 vs 새로운)
-        column_mapping = {
-            '기업명': '기업명',
-            '공고이름': '공고이름', 
-            '추천이유': '추천이유',
-            '추천점수': '추천점수',
-            '투자금액': '투자금액',
-            '마감일': '마감일',
-            '공고상태': '공고상태'
-        }
+        # 이전 동기화 대비 변경분 계산
+        previous_hashes = {} if full_sync else load_sync_state(csv_path)
+        changed_df, added_keys, changed_keys, deleted_keys, current_hashes = diff_csv_rows(df, previous_hashes)
+        print(f"   🧮 변경 분석: 추가 {len(added_keys)}개, 변경 {len(changed_keys)}개, 삭제 {len(deleted_keys)}개")
         
-        # 컬럼명이 다른 경우 매핑
-        if '투자금액' in df.columns:
-            column_mapping['투자금액'] = '투자금액'
-        elif '투자금액' in df.columns:
-            column_mapping['투자금액'] = '투자금액'
-            
-        if '마감일' in df.columns:
-            column_mapping['마감일'] = '마감일'
-        elif '마감일' in df.columns:
-            column_mapping['마감일'] = '마감일'
-            
-        if '공고상태' in df.columns:
-            column_mapping['공고상태'] = '공고상태'
-        elif '공고상태' in df.columns:
-            column_mapping['공고상태'] = '공고상태'
+        # 삭제된 행은 기록만 하고 데이터베이스에서 지우지 않음 (추천 이유 동기화 전용)
+        for key in deleted_keys[:10]:
+            company_name, announcement_title = key.split('\x1f', 1)
+            print(f"      🗑️ CSV에서 삭제됨: {company_name[:20]}... - {announcement_title[:30]}...")
+        
+        # 반영된 행의 해시만 상태에 남김 (실패한 행은 다음 동기화에서 다시 시도)
+        synced_hashes = {key: h for key, h in previous_hashes.items() if key in current_hashes.index}
+        
+        if changed_df.empty:
+            save_sync_state(csv_path, synced_hashes)
+            print("   ✅ 변경된 행이 없습니다.")
+            return
         
         print("   🔍 데이터베이스 데이터 로드 중...")
-        # 데이터베이스 데이터 가져오기
-        companies = supabase.table('companies').select('*').execute()
-        companies_df = pd.DataFrame(companies.data)
+        # 매칭에 필요한 컬럼만 기본키 순 페이지 단위로 끝까지 조회 (PostgREST 최대 행 수에서 잘리지 않음)
+        companies_df = fetch_frame(supabase, 'companies', ['id', 'name'], order='id')
+        announcements_df = fetch_frame(supabase, 'announcements', ['id', 'title'], order='id')
         
-        announcements = supabase.table('announcements').select('*').execute()
-        announcements_df = pd.DataFrame(announcements.data)
+        # 매칭 색인은 동기화마다 한 번만 구축하고 모든 행에 재사용
+        company_resolver = build_company_resolver(companies_df)
+        announcement_resolver = build_announcement_resolver(announcements_df)
         
         updated_count = 0
         failed_count = 0
         
-        print(f"   🔄 {len(df)}개 추천 데이터 동기화 시작...")
+        print(f"   🔄 {len(changed_df)}개 추천 데이터 동기화 시작...")
         
-        for idx, row in df.iterrows():
+        row_keys = changed_df['기업명'].astype(str) + '\x1f' + changed_df['공고이름'].astype(str)
+        for row_key, (idx, row) in zip(row_keys, changed_df.iterrows()):
             company_name = row['기업명']
             announcement_title = row['공고이름']
             improved_reason = str(row['추천이유']).strip()
@@ -161,42 +203,32 @@ def sync_csv_to_supabase(csv_path):
             announcement_status = str(row.get('공고상태', '')).strip() if pd.notna(row.get('공고상태')) else ''
             
             # 최적의 회사 매칭 (100% 성공률)
-            company_id = find_best_company_match(company_name, companies_df)
+            company_id = find_best_company_match(company_name, companies_df, company_resolver)
             
             # 최적의 공고 매칭 (100% 성공률)
-            announcement_id = find_best_announcement_match(announcement_title, announcements_df)
+            announcement_id = find_best_announcement_match(announcement_title, announcements_df, announcement_resolver)
             
             if company_id and announcement_id:
                 # 추천 데이터 업데이트
                 try:
-                    update_data = {'reason': improved_reason}
-                    
-                    # 공고 데이터도 함께 업데이트 (투자금액, 마감일, 상태)
-                    if investment_amount:
-                        update_data['amount_text'] = investment_amount
-                    if due_date:
-                        update_data['due_date'] = due_date
-                    if announcement_status:
-                        update_data['update_type'] = announcement_status
-                    
                     # 추천 데이터 업데이트
                     supabase.table('recommendations').update({
                         'reason': improved_reason
                     }).eq('company_id', company_id).eq('announcement_id', announcement_id).execute()
                     
                     # 공고 데이터 업데이트 (투자금액, 마감일, 상태)
-                    if investment_amount or due_date or announcement_status:
-                        announcement_update = {}
-                        if investment_amount:
-                            announcement_update['amount_text'] = investment_amount
-                        if due_date:
-                            announcement_update['due_date'] = due_date
-                        if announcement_status:
-                            announcement_update['update_type'] = announcement_status
-                        
-                        if announcement_update:
-                            supabase.table('announcements').update(announcement_update).eq('id', announcement_id).execute()
+                    announcement_update = {}
+                    if investment_amount:
+                        announcement_update['amount_text'] = investment_amount
+                    if due_date:
+                        announcement_update['due_date'] = due_date
+                    if announcement_status:
+                        announcement_update['update_type'] = announcement_status
                     
+                    if announcement_update:
+                        supabase.table('announcements').update(announcement_update).eq('id', announcement_id).execute()
+                    
+                    synced_hashes[row_key] = current_hashes[row_key]
                     updated_count += 1
                     
                 except Exception as e:
@@ -206,6 +238,8 @@ def sync_csv_to_supabase(csv_path):
                 failed_count += 1
                 print(f"      ❌ 매칭 실패: {company_name[:20]}... - {announcement_title[:30]}...")
         
+        save_sync_state(csv_path, synced_hashes)
+        
         print(f"   ✅ 동기화 완료!")
         print(f"      📊 성공: {updated_count}개")
         print(f"      ❌ 실패: {failed_count}개")
@@ -241,10 +275,10 @@ def start_auto_sync(csv_path):
     
     observer.join()
 
-def manual_sync(csv_path):
-    """수동 동기화"""
+def manual_sync(csv_path, full_sync=False):
+    """수동 동기화 (full_sync=True이면 변경 여부와 관계없이 전체 반영)"""
     print("🔄 수동 동기화 실행")
-    sync_csv_to_supabase(csv_path)
+    sync_csv_to_supabase(csv_path, full_sync=full_sync)
 
 if __name__ == "__main__":
     # 새로운 CSV 파일 경로
@@ -253,8 +287,8 @@ if __name__ == "__main__":
     import sys
     
     if len(sys.argv) > 1 and sys.argv[1] == "manual":
-        # 수동 동기화
-        manual_sync(csv_path)
+        # 수동 동기화 (python auto_sync_system.py manual full -> 전체 재동기화)
+        manual_sync(csv_path, full_sync=len(sys.argv) > 2 and sys.argv[2] == "full")
     else:
         # 자동 동기화
         start_auto_sync(csv_path)
@@ -0,0 +1,58 @@
+"""
+Supabase 일괄 쓰기
+- 행을 모아서 다중 행 upsert 한 번으로 전송 (행마다 insert/select 왕복 제거)
+- on_conflict 키로 중복 행은 갱신 (supabase_batch_writes.sql의 유니크 인덱스 필요)
+- 유니크 인덱스가 아직 없는 테이블(마이그레이션 전)은 호출 측 선택에 따라 일반 insert로 대체
+"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# PostgREST 요청 본문이 너무 커지지 않도록 나누는 기본 행 수
+DEFAULT_BATCH_SIZE = 500
+
+# 테이블별 on_conflict 키 (supabase_batch_writes.sql의 유니크 인덱스와 동일)
+RECOMMENDATION_CONFLICT_COLUMNS = 'company_id,announcement_title'
+NOTIFICATION_CONFLICT_COLUMNS = 'company_id'
+# recommendation_status 기본키 (supabase_recommendation_status.sql)
+STATUS_CONFLICT_COLUMNS = 'company_id,announcement_id'
+# ON CONFLICT 대상에 맞는 유니크 인덱스/제약이 없을 때의 PostgreSQL 오류 코드
+MISSING_CONSTRAINT_CODE = '42P10'
+
+def _chunks(rows: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def is_missing_constraint_error(error: Exception) -> bool:
+    """on_conflict 키에 맞는 유니크 인덱스가 없어 upsert가 실패했는지 (supabase_batch_writes.sql 미적용)"""
+    message = str(error)
+    return (getattr(error, 'code', None) == MISSING_CONSTRAINT_CODE
+            or MISSING_CONSTRAINT_CODE in message
+            or 'ON CONFLICT specification' in message)
+
+def upsert_rows(client, table: str, rows: List[Dict], on_conflict: Optional[str] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE, insert_fallback: bool = False) -> int:
+    """여러 행을 다중 행 upsert로 저장 (batch_size 행마다 요청 1회)
+
+    on_conflict가 없으면 일반 다중 행 insert로 저장합니다.
+    insert_fallback=True이면 유니크 인덱스가 없어 upsert가 실패할 때
+    남은 행을 일반 insert로 저장합니다 (중복 행은 갱신되지 않고 추가됨).
+    """
+    if not rows:
+        return 0
+    written = 0
+    for chunk in _chunks(rows, batch_size):
+        if on_conflict:
+            try:
+                client.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+            except Exception as e:
+                if not (insert_fallback and is_missing_constraint_error(e)):
+                    raise
+                logger.warning(f"'{table}'에 ({on_conflict}) 유니크 인덱스가 없어 insert로 저장합니다: {e}")
+                on_conflict = None
+                client.table(table).insert(chunk).execute()
+        else:
+            client.table(table).insert(chunk).execute()
+        written += len(chunk)
+    return written
@@ -0,0 +1,351 @@
+"""
+데이터 로드/추천 경로 벤치마크
+- fake_supabase.FakeSupabase에 합성 데이터(alpha_companies2, companies, biz2, kstartup2, recommend*)를 채워
+  app_supabase3의 로더/추천 생성/탭 렌더링 단계를 규모별로 측정
+- 단계별 소요 시간, 초당 처리 행 수, 최대 메모리(tracemalloc), Supabase 요청 수 보고
+
+사용 예:
+    python benchmark_supabase.py                      # 1k / 10k / 100k
+    python benchmark_supabase.py --sizes 1000 10000 --latency-ms 30 --json result.json
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from fake_supabase import FakeSupabase
+from announcement_keys import content_key
+from company_keys import normalize_company_name
+from shared_cache import clear_shared_caches
+from table_watermarks import clear_table_versions
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+# 회사 1곳당 추천 행 수 (실제 recommend 테이블 평균과 비슷하게)
+RECOMMENDATIONS_PER_COMPANY = 300
+RANDOM_SEED = 42
+
+REGIONS = ['서울', '경기', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+INDUSTRIES = ['IT', '제조', '바이오', '에너지', '콘텐츠', '농식품', '유통', '교육', '헬스케어', '핀테크']
+KEYWORDS = ['AI', '빅데이터', '플랫폼', '자동화', '로봇', '반도체', '친환경', '수출', 'R&D', '클라우드', '모빌리티', '메타버스']
+CATEGORIES = ['사업화', '기술개발', '창업교육', '시설·공간', '멘토링', '글로벌', '융자', '인력']
+AGENCIES = ['중소벤처기업부', '과학기술정보통신부', '산업통상자원부', '서울특별시', '경기도', '창업진흥원']
+PRIORITY_TYPES = ['일반', '우선', '3대장']
+
+def _dates(rng: np.random.Generator, n: int, base: date = date(2025, 1, 1)):
+    """접수시작일/마감일 문자열 (YYYY-MM-DD)"""
+    start_offsets = rng.integers(0, 540, n)
+    durations = rng.integers(7, 60, n)
+    starts = [(base + timedelta(days=int(o))).isoformat() for o in start_offsets]
+    ends = [(base + timedelta(days=int(o + d))).isoformat() for o, d in zip(start_offsets, durations)]
+    return starts, ends
+
+def _titles(rng: np.random.Generator, n: int, prefix: str) -> List[str]:
+    regions = rng.choice(REGIONS, n)
+    keywords = rng.choice(KEYWORDS, n)
+    categories = rng.choice(CATEGORIES, n)
+    return [f"{prefix} {r} {k} {c} 지원사업 {i}" for i, (r, k, c) in enumerate(zip(regions, keywords, categories))]
+
+def make_alpha_companies(n: int, rng: np.random.Generator) -> List[Dict]:
+    names = [f"테스트기업{i}" for i in range(n)]
+    industries = rng.choice(INDUSTRIES, n)
+    keywords = rng.choice(KEYWORDS, n)
+    return [{
+        'No.': i + 1,
+        '기업명': name,
+        '사업아이템 한 줄 소개': f"{name} - {keyword} 기반 {industry} 솔루션",
+        '기업형태': '법인',
+        '소재지': str(rng.choice(REGIONS)),
+        '주업종 (사업자등록증 상)': industry,
+        '특화분야': keyword,
+        '설립연월일': '2020-01-01',
+        '#매출': '10억',
+        '#고용': '10',
+        '#기술특허(등록)': '1',
+        '#기업인증': '벤처',
+        '주요 산업': industry
+    } for i, (name, industry, keyword) in enumerate(zip(names, industries, keywords))]
+
+def make_companies(n: int, rng: np.random.Generator) -> List[Dict]:
+    industries = rng.choice(INDUSTRIES, n)
+    return [{
+        'id': i + 1,
+        'name': f"신규기업{i}",
+        'business_type': '법인',
+        'region': str(rng.choice(REGIONS)),
+        'years': int(rng.integers(0, 15)),
+        'stage': '초기',
+        'industry': industry,
+        'keywords': [str(k) for k in rng.choice(KEYWORDS, 2, replace=False)],
+        'preferred_uses': ['R&D'],
+        'preferred_budget': '중간'
+    } for i, industry in enumerate(industries)]
+
+def make_biz2(n: int, rng: np.random.Generator) -> List[Dict]:
+    titles = _titles(rng, n, '[기업마당]')
+    starts, ends = _dates(rng, n)
+    return [{
+        '번호': i + 1,
+        '공고명': title,
+        '지원분야': str(rng.choice(INDUSTRIES)),
+        '소관부처': str(rng.choice(AGENCIES + REGIONS)),
+        '사업수행기관': str(rng.choice(AGENCIES)),
+        '신청시작일자': start,
+        '신청종료일자': end,
+        '공고상세URL': f"https://www.bizinfo.go.kr/{i + 1}"
+    } for i, (title, start, end) in enumerate(zip(titles, starts, ends))]
+
+def make_kstartup2(n: int, rng: np.random.Generator) -> List[Dict]:
+    titles = _titles(rng, n, '[K-Startup]')
+    starts, ends = _dates(rng, n)
+    return [{
+        '공고일련번호': i + 1,
+        '사업공고명': title,
+        '공고내용': f"{title} - {rng.choice(KEYWORDS)} 분야 {rng.choice(INDUSTRIES)} 기업 대상 " * 5,
+        '지원사업분류': str(rng.choice(CATEGORIES + INDUSTRIES)),
+        '주관기관': str(rng.choice(AGENCIES)),
+        '지원지역': str(rng.choice(REGIONS)),
+        '공고접수시작일시': start,
+        '공고접수종료일시': end,
+        '상세페이지 url': f"https://www.k-startup.go.kr/{i + 1}",
+        '사업업력': '7년미만'
+    } for i, (title, start, end) in enumerate(zip(titles, starts, ends))]
+
+def make_recommend_rows(n: int, company_names: List[str], rng: np.random.Generator) -> List[Dict]:
+    """모든 recommend 테이블 컬럼을 합친 추천 행 (테이블마다 필요한 컬럼만 사용)"""
+    company_ids = {name: -(i + 1) for i, name in enumerate(company_names)}
+    titles = _titles(rng, n, '추천공고')
+    starts, ends = _dates(rng, n)
+    companies = rng.choice(company_names, n)
+    scores = rng.integers(10, 100, n)
+    rows = []
+    for i, (company, title, start, end, score) in enumerate(zip(companies, titles, starts, ends, scores)):
+        rows.append({
+            'company_id': company_ids[company],
+            'company_name': company,
+            'company_key': normalize_company_name(company),
+            'program_id': i + 1,
+            'announcement_key': content_key(title),
+            'title': title, 'title_x': title, 'title_y': title,
+            'source': 'kstartup',
+            'final_score': int(score), 'final_score_10': round(score / 10, 1), 'final_level': '중',
+            'description': f"{title} 매칭 이유", 'doc_text': f"{title} 상세 " * 20,
+            'apply_start': start, 'apply_end': end,
+            'apply_start_x': start, 'apply_end_x': end,
+            'apply_start_y': start, 'apply_end_y': end,
+            'url': f"https://example.com/{i + 1}",
+            'priority_type': str(rng.choice(PRIORITY_TYPES)), 'priority_type_x': '일반', 'priority_type_y': '일반',
+            'company_province': '서울', 'program_provinces': "{'전국'}", 'region_match': True,
+            'base_score': 50, 'sim_raw': 0.5, 'sim_points': 5, 'priority_boost_points': 0,
+            'base_score_10': 5, 'score_stage': 1, 'score_industry': 0.2, 'score_region': 1,
+            'score_timing': 0.6, 'score_bonus': 0, 'score_penalty': 0, 'sim': 0.5,
+            'region': '서울', 'years': 5, 'raw_text': title, 'industry_primary': 'IT',
+            'category': '사업화', 'program_region': '전국', 'base_score_recomputed': 44,
+            'region_prog': '전국', 'title_prog': title, 'description_prog': title,
+            'category_prog': '사업화', 'doc_text_prog': title,
+            'kw_intersection': 2, 'kw_tfidf': 0.3, 'kw_bm25': 1.2, 'kw_phrase_hit': 1,
+            'kw_must_have_hits': 1, 'kw_forbid_hit': 0, 'kw_gate': True, 'kw_reason': 'AI',
+            'keyword_points': int(score),
+            'company_years': 5, 'company_section': 'IT', 'program_years_min': 0, 'program_years_max': 7,
+            'program_section': 'IT', 'passed': True, 'reason': '조건 통과'
+        })
+    return rows
+
+RECOMMEND_TABLES = [
+    'recommend3', 'recommend_active3', 'recommend_region4',
+    'recommend_keyword4', 'recommend_rules4', 'recommend_priority4'
+]
+
+def build_dataset(size: int, seed: int = RANDOM_SEED) -> Dict[str, List[Dict]]:
+    """규모별 합성 데이터 (공고/추천 테이블은 size행, 회사 테이블은 size/10행)"""
+    rng = np.random.default_rng(seed)
+    company_count = max(10, size // 10)
+    alpha = make_alpha_companies(company_count, rng)
+    # 추천 행은 회사당 RECOMMENDATIONS_PER_COMPANY행이 되도록 일부 회사에 배분
+    recommended_companies = [row['기업명'] for row in alpha[:max(1, size // RECOMMENDATIONS_PER_COMPANY)]]
+    recommend_rows = make_recommend_rows(size, recommended_companies, rng)
+    dataset = {
+        'alpha_companies2': alpha,
+        'companies': make_companies(company_count, rng),
+        'biz2': make_biz2(size, rng),
+        'kstartup2': make_kstartup2(size, rng),
+        'notification_states': [],
+        'company_keys': [],
+        'recommendation_status': []
+    }
+    for table in RECOMMEND_TABLES:
+        dataset[table] = recommend_rows
+    return dataset
+
+def measure(stage: str, fn: Callable, rows: int, setup: Optional[Callable] = None,
+            client: Optional[FakeSupabase] = None, track_memory: bool = True) -> Dict:
+    """단계 1개 측정 (시간 측정 실행과 메모리 측정 실행을 분리하여 tracemalloc 오버헤드 제외)"""
+    if setup:
+        setup()
+    if client:
+        client.reset_counters()
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    requests = client.request_count if client else None
+
+    peak_mb = None
+    if track_memory:
+        if setup:
+            setup()
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / (1024 * 1024)
+
+    return {
+        'stage': stage,
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else None,
+        'peak_mb': peak_mb,
+        'requests': requests
+    }
+
+def run_size(size: int, latency: float = 0.0, track_memory: bool = True, include_render: bool = True) -> List[Dict]:
+    """규모 1개에 대한 전체 단계 측정"""
+    import streamlit as st
+    import streamlit.logger
+    import app_supabase3 as app
+    import announcement_index
+    import supabase_loader
+    
+    # 벤치마크 중 Streamlit bare mode 경고 숨김 (앱 import 이후 생성된 로거 포함)
+    streamlit.logger.set_log_level('error')
+
+    dataset = build_dataset(size)
+    client = FakeSupabase(dataset, latency=latency)
+    app.supabase = client
+    # 로컬 스냅샷은 임시 디렉터리에 저장
+    snapshot_dir = tempfile.mkdtemp(prefix='benchmark_snapshots_')
+    os.environ['SNAPSHOT_DIR'] = snapshot_dir
+
+    def clear_memory_caches():
+        st.cache_data.clear()
+        clear_shared_caches()
+        clear_table_versions()
+        announcement_index._INDEXES.clear()
+        supabase_loader._available_columns.clear()
+
+    def clear_caches():
+        clear_memory_caches()
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+    def warm_snapshots():
+        # 스냅샷 파일만 남기고 메모리 캐시를 비운 상태 (프로세스 재시작 직후)
+        clear_caches()
+        app.load_companies()
+        app.load_announcements()
+        clear_memory_caches()
+
+    results = []
+    company_rows = len(dataset['alpha_companies2']) + len(dataset['companies'])
+    announcement_rows = len(dataset['biz2']) + len(dataset['kstartup2'])
+
+    results.append(measure('load_companies', app.load_companies, company_rows,
+                           setup=clear_caches, client=client, track_memory=track_memory))
+    results.append(measure('load_announcements', app.load_announcements, announcement_rows,
+                           setup=clear_caches, client=client, track_memory=track_memory))
+    results.append(measure('cold_start_from_snapshot', lambda: (app.load_companies(), app.load_announcements()),
+                           company_rows + announcement_rows, setup=warm_snapshots, client=client,
+                           track_memory=track_memory))
+
+    company_data = {
+        'name': '벤치마크기업', 'industry': 'IT', 'region': '서울',
+        'keywords': ['AI', '플랫폼'], 'description': 'AI 기반 데이터 플랫폼'
+    }
+    results.append(measure('generate_company_recommendations',
+                           lambda: app.generate_company_recommendations(company_data, 0),
+                           announcement_rows, setup=clear_caches, client=client, track_memory=track_memory))
+    # 공고 공유 캐시/역색인이 이미 로드된 상태에서 회사 저장 시 추천 생성 (원격 조회 없음)
+    results.append(measure('generate_company_recommendations_warm',
+                           lambda: app.generate_company_recommendations(company_data, 0),
+                           announcement_rows, setup=lambda: (clear_caches(), app.load_announcements()),
+                           client=client, track_memory=track_memory))
+
+    # 추천 행이 있는 첫 번째 회사 기준 탭 데이터 로드
+    company_id = -1
+    company_recommend_rows = sum(1 for row in dataset['recommend3'] if row['company_key'] == normalize_company_name('테스트기업0'))
+    def load_recommendation_tables(company_id: int):
+        # 통합 뷰가 없을 때 모든 추천 화면을 한 번씩 여는 것과 같은 조회 (화면별 테이블 버전 캐시 경유)
+        return {key: app.get_recommendation_frame(None, key, company_id) for key in app.RECOMMENDATION_LOADERS}
+
+    results.append(measure('load_recommendation_tables', lambda: load_recommendation_tables(company_id),
+                           company_recommend_rows * len(RECOMMEND_TABLES), setup=clear_caches,
+                           client=client, track_memory=track_memory))
+
+    if include_render:
+        companies_df = app.load_companies()
+        selected = companies_df[companies_df['id'] == company_id]
+        if not selected.empty:
+            st.session_state['selected_company'] = selected.iloc[0].to_dict()
+            frames = load_recommendation_tables(company_id)
+            for stage, render in [
+                ('render_recommendations2_tab', app.render_recommendations2_tab),
+                ('render_alerts_tab', app.render_alerts_tab),
+                ('render_roadmap_tab', app.render_roadmap_tab),
+            ]:
+                results.append(measure(stage, lambda render=render: render(frames), company_recommend_rows,
+                                       client=client, track_memory=track_memory))
+            # 통합 뷰 없이 선택된 화면의 테이블만 조회하는 경로 (캐시 비운 상태)
+            results.append(measure('render_recommendations2_tab_lazy', lambda: app.render_recommendations2_tab(None),
+                                   company_recommend_rows, setup=clear_caches, client=client,
+                                   track_memory=track_memory))
+
+    clear_caches()
+    for result in results:
+        result['size'] = size
+    return results
+
+def print_report(results: List[Dict]):
+    header = f"{'규모':>8} | {'단계':<34} | {'행 수':>9} | {'시간(초)':>9} | {'행/초':>11} | {'최대메모리(MB)':>13} | {'요청 수':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        rows_per_second = f"{r['rows_per_second']:,.0f}" if r['rows_per_second'] else '-'
+        peak = f"{r['peak_mb']:.1f}" if r['peak_mb'] is not None else '-'
+        requests = r['requests'] if r['requests'] is not None else '-'
+        print(f"{r['size']:>8,} | {r['stage']:<34} | {r['rows']:>9,} | {r['seconds']:>9.3f} | {rows_per_second:>11} | {peak:>13} | {requests:>7}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase 데이터 경로 벤치마크 (로컬 대체 클라이언트 사용)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="공고/추천 테이블 행 수")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Supabase 요청 1건당 가상 지연 (ms)")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument('--no-render', action='store_true', help="탭 렌더링 단계 생략")
+    parser.add_argument('--json', help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    os.environ.setdefault('SUPABASE_URL', 'https://demo.supabase.co')
+    os.environ.setdefault('SUPABASE_KEY', 'demo-key')
+
+    all_results = []
+    for size in args.sizes:
+        print(f"\n📊 규모 {size:,}행 측정 중...")
+        all_results.extend(run_size(
+            size, latency=args.latency_ms / 1000, track_memory=not args.no_memory,
+            include_render=not args.no_render
+        ))
+
+    print()
+    print_report(all_results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(all_results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+대용량 CSV -> Supabase 공용 업로더
+- CSV를 청크 단위로 스트리밍 읽기 (전체 파일을 메모리에 올리지 않음)
+- NaN/inf 정리와 정수 변환을 벡터 연산으로 처리 (레코드별 파이썬 루프 제거)
+- 제한된 작업자 풀로 청크를 동시에 전송하고, 일시적 실패는 재시도
+- 완료된 청크 번호를 체크포인트 파일에 기록하여 중단 후 재실행 시 이어서 업로드
+"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+# 재시도 대기 시간 (초, 시도마다 2배)
+DEFAULT_RETRY_BACKOFF = 1.0
+
+def clean_frame(df: pd.DataFrame, int_columns=None) -> pd.DataFrame:
+    """JSON 전송용 정리 (inf -> None, NaN -> None, 지정 컬럼은 정수 변환)
+
+    int_columns는 컬럼 목록 또는 DataFrame을 받아 컬럼 목록을 반환하는 함수입니다.
+    """
+    df = df.replace([np.inf, -np.inf], np.nan)
+    if callable(int_columns):
+        int_columns = int_columns(df)
+    for column in int_columns or []:
+        if column in df.columns:
+            values = pd.to_numeric(df[column], errors='coerce').astype('float64')
+            df[column] = np.trunc(values).astype('Int64')
+    df = df.astype(object)
+    return df.where(df.notna(), None)
+
+def frame_records(df: pd.DataFrame, int_columns=None) -> List[Dict]:
+    """정리된 DataFrame -> insert용 레코드 목록"""
+    return clean_frame(df, int_columns).to_dict('records')
+
+def numeric_columns(df: pd.DataFrame, exclude: Optional[List[str]] = None) -> List[str]:
+    """숫자형 컬럼 목록 (모든 실수를 정수로 저장하는 테이블용)"""
+    exclude = set(exclude or [])
+    return [column for column in df.select_dtypes(include='number').columns if column not in exclude]
+
+class UploadCheckpoint:
+    """완료된 청크 번호를 JSON 파일로 기록
+
+    CSV 파일 크기/수정시각, 대상 테이블, 청크 크기가 같을 때만 이어서 업로드합니다.
+    """
+
+    def __init__(self, path: str, csv_path: str, table: str, chunk_size: int):
+        self.path = path
+        self._lock = threading.Lock()
+        stat = os.stat(csv_path)
+        self.signature = {
+            'csv_path': os.path.abspath(csv_path),
+            'csv_size': stat.st_size,
+            'csv_mtime': int(stat.st_mtime),
+            'table': table,
+            'chunk_size': chunk_size
+        }
+        self.completed = self._load()
+
+    def _load(self) -> set:
+        if not os.path.exists(self.path):
+            return set()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"체크포인트 파일을 읽을 수 없어 처음부터 업로드합니다: {e}")
+            return set()
+        if state.get('signature') != self.signature:
+            logger.warning("CSV 파일 또는 업로드 설정이 바뀌어 체크포인트를 무시합니다.")
+            return set()
+        return set(state.get('completed_chunks', []))
+
+    def mark(self, chunk_num: int):
+        """청크 완료 기록 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 파일이 깨지지 않음)"""
+        with self._lock:
+            self.completed.add(chunk_num)
+            state = {'signature': self.signature, 'completed_chunks': sorted(self.completed)}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def default_checkpoint_path(csv_path: str, table: str) -> str:
+    return f"{csv_path}.{table}.checkpoint.json"
+
+def has_checkpoint(csv_path: str, table: str, checkpoint_path: Optional[str] = None) -> bool:
+    """이어서 업로드할 체크포인트가 있는지 (기존 데이터를 지우고 올리는 스크립트는 이때 삭제를 건너뜀)"""
+    return os.path.exists(checkpoint_path or default_checkpoint_path(csv_path, table))
+
+def _send_chunk(client, table: str, records: List[Dict], on_conflict: Optional[str],
+                max_retries: int, retry_backoff: float):
+    """청크 1개 전송 (실패 시 지수 백오프로 재시도)"""
+    for attempt in range(max_retries + 1):
+        try:
+            if on_conflict:
+                client.table(table).upsert(records, on_conflict=on_conflict).execute()
+            else:
+                client.table(table).insert(records).execute()
+            return
+        except Exception as e:
+            if attempt >= max_retries:
+                raise
+            wait_seconds = retry_backoff * (2 ** attempt)
+            logger.warning(f"청크 전송 실패, {wait_seconds:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(wait_seconds)
+
+def upload_csv(client, csv_path: str, table: str,
+               transform: Optional[Callable[[pd.DataFrame, int], pd.DataFrame]] = None,
+               int_columns=None,
+               on_conflict: Optional[str] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               max_retries: int = DEFAULT_MAX_RETRIES,
+               retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+               checkpoint_path: Optional[str] = None,
+               nrows: Optional[int] = None,
+               read_csv_kwargs: Optional[Dict] = None) -> int:
+    """CSV를 청크 단위로 병렬 업로드하고 업로드한 행 수 반환
+
+    transform(chunk, row_offset)은 CSV 청크를 테이블 컬럼에 맞춘 DataFrame으로 변환합니다.
+    row_offset은 파일 전체에서 청크 첫 행의 위치로, 순번 id 생성 등에 사용합니다.
+    재시도 시 이미 반영된 청크가 중복 저장되지 않도록 가능하면 on_conflict를 지정하세요.
+    실패한 청크가 있으면 예외를 던지며, 체크포인트는 남겨 두어 재실행 시 이어서 업로드합니다.
+    """
+    checkpoint = UploadCheckpoint(
+        checkpoint_path or default_checkpoint_path(csv_path, table), csv_path, table, chunk_size
+    )
+    if checkpoint.completed:
+        logger.info(f"체크포인트에서 이어서 업로드합니다: 완료된 청크 {len(checkpoint.completed)}개 건너뜀")
+
+    uploaded = 0
+    uploaded_lock = threading.Lock()
+    pending = set()
+    # 읽기가 전송보다 너무 앞서 나가 메모리가 커지지 않도록 대기 중인 청크 수 제한
+    max_pending = max_workers * 2
+
+    def run(chunk_num: int, records: List[Dict]):
+        nonlocal uploaded
+        _send_chunk(client, table, records, on_conflict, max_retries, retry_backoff)
+        checkpoint.mark(chunk_num)
+        with uploaded_lock:
+            uploaded += len(records)
+        logger.info(f"청크 {chunk_num + 1} 완료: {len(records)}행 (총 {uploaded}행)")
+
+    reader = pd.read_csv(csv_path, chunksize=chunk_size, nrows=nrows, **(read_csv_kwargs or {}))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for chunk_num, chunk in enumerate(reader):
+                if chunk_num in checkpoint.completed:
+                    continue
+                frame = transform(chunk, chunk_num * chunk_size) if transform else chunk
+                records = frame_records(frame, int_columns)
+                if not records:
+                    checkpoint.mark(chunk_num)
+                    continue
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(run, chunk_num, records))
+            for future in pending:
+                future.result()
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+
+    checkpoint.clear()
+    logger.info(f"전체 업로드 완료: 총 {uploaded}행이 '{table}' 테이블에 업로드되었습니다.")
+    return uploaded
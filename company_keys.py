@@ -0,0 +1,40 @@
+"""
+회사 키(company_key) 매핑
+- 기업명을 정규화한 company_key와 안정적인 회사 ID(alpha_companies2는 음수)를 연결
+- 모든 recommend 테이블은 company_key 컬럼으로 조회 (supabase_company_keys.sql 참고)
+- 정규화 규칙은 SQL 함수 normalize_company_name()과 동일하게 유지해야 함
+"""
+from typing import Dict, Optional
+
+import pandas as pd
+
+# 정규화 규칙은 text_normalization 공용 모듈 (SQL normalize_company_name()과 동일)
+from text_normalization import normalize_company_name, normalize_company_names
+
+def build_company_key_map(companies_df: pd.DataFrame) -> Dict[int, Dict]:
+    """회사 ID -> {company_key, company_name, source_table} 매핑"""
+    if companies_df is None or companies_df.empty or 'id' not in companies_df.columns:
+        return {}
+    columns = [c for c in ['id', 'company_key', 'company_name', 'source_table'] if c in companies_df.columns]
+    frame = companies_df[columns].drop_duplicates(subset=['id'])
+    if 'company_key' not in frame.columns:
+        frame = frame.assign(company_key=normalize_company_names(frame.get('company_name', pd.Series('', index=frame.index))))
+    return {int(row['id']): row for row in frame.to_dict('records')}
+
+def lookup_company(company_key_map: Dict[int, Dict], company_id) -> Optional[Dict]:
+    """회사 ID로 company_key/기업명 조회 (메모리 내 조회, 추가 네트워크 요청 없음)"""
+    if company_id is None:
+        return None
+    company = company_key_map.get(int(company_id))
+    if not company or not company.get('company_key'):
+        return None
+    return company
+
+def company_key_row(company_id: int, company_name: str, source_table: str) -> Dict:
+    """company_keys 테이블 upsert용 행"""
+    return {
+        'company_key': normalize_company_name(company_name),
+        'company_id': company_id,
+        'company_name': company_name,
+        'source_table': source_table
+    }
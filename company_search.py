@@ -0,0 +1,128 @@
+"""
+회사 검색 색인 (사이드바 회사 선택)
+- 기업명/사업 아이템 소개를 text_normalization 규칙(법인 표기/공백/특수문자 제거, 영문 소문자)으로 정규화해 색인
+- 기업명 자모 접두어('삼ㅅ' -> 삼성...), 초성 접두어('ㅅㅅ' -> 삼성...), n-gram 부분 일치 조회
+- 결과는 순위가 매겨진 회사 ID 목록 (정확 일치 > 기업명 접두어 > 초성 접두어 > 기업명 부분 일치 > 소개 부분 일치)
+- 회사 공유 캐시 버전이 바뀔 때만 다시 구축 (companies_cache.derived)
+"""
+import bisect
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from text_normalization import CHOSEONG, NGRAM_SIZE, ngrams, normalize_company_names, normalize_query, to_initials, to_jamo
+
+DEFAULT_LIMIT = 100
+
+# 순위 (작을수록 먼저)
+RANK_EXACT, RANK_PREFIX, RANK_INITIALS, RANK_NAME, RANK_DESCRIPTION = range(5)
+
+def _ngrams(text: str) -> Set[str]:
+    """검색용 n-gram (NGRAM_SIZE보다 짧은 문자열은 문자열 전체)"""
+    return ngrams(text, min(NGRAM_SIZE, len(text))) if text else set()
+
+def _prefix_range(keys: List[Tuple[str, int]], prefix: str) -> List[int]:
+    """정렬된 (키, 위치) 목록에서 prefix로 시작하는 위치 (이진 탐색)"""
+    start = bisect.bisect_left(keys, (prefix, -1))
+    positions = []
+    for key, position in keys[start:]:
+        if not key.startswith(prefix):
+            break
+        positions.append(position)
+    return positions
+
+class CompanySearchIndex:
+    """회사 ID 순위 검색 색인 (구축 후 읽기 전용)"""
+
+    def __init__(self, companies_df: pd.DataFrame):
+        self.frame = companies_df
+        name_column = 'company_name' if 'company_name' in companies_df.columns else 'name'
+        names = companies_df[name_column] if name_column in companies_df.columns else pd.Series('', index=companies_df.index)
+        descriptions = companies_df['name'] if 'name' in companies_df.columns else pd.Series('', index=companies_df.index)
+
+        self.ids: List[int] = companies_df['id'].tolist() if 'id' in companies_df.columns else []
+        self._positions: Dict[int, int] = {}
+        for position, company_id in enumerate(self.ids):
+            self._positions.setdefault(company_id, position)
+        self._labels = self._build_labels(companies_df, names, descriptions)
+
+        self._names = normalize_company_names(names).tolist()
+        self._descriptions = normalize_company_names(descriptions).tolist()
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._ngrams: Dict[str, Set[int]] = defaultdict(set)
+        for position, (name, description) in enumerate(zip(self._names, self._descriptions)):
+            self._exact[name].append(position)
+            for ngram in _ngrams(name) | _ngrams(description):
+                self._ngrams[ngram].add(position)
+            # 한 글자 검색어용 낱글자 색인
+            for char in set(name) | set(description):
+                self._ngrams[char].add(position)
+        self._jamo = sorted((to_jamo(name), position) for position, name in enumerate(self._names))
+        self._initials = sorted((to_initials(name), position) for position, name in enumerate(self._names))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _build_labels(df: pd.DataFrame, names: pd.Series, descriptions: pd.Series) -> Dict[int, str]:
+        """선택 상자 표시 문자열 (기업명 - 사업 아이템, 신규 회사는 🆕 신규 표시)"""
+        if 'id' not in df.columns:
+            return {}
+        if 'company_name' not in df.columns:
+            return dict(zip(df['id'], names.astype(str)))
+        source = df['source_table'] if 'source_table' in df.columns else pd.Series('', index=df.index)
+        is_new = (source == 'companies') | (df['id'] > 0)
+        labels = names.astype(str) + ' - ' + descriptions.astype(str)
+        labels = labels.where(~is_new, '🆕 신규 ' + labels)
+        return dict(zip(df['id'], labels))
+
+    def label(self, company_id: int) -> str:
+        return self._labels.get(company_id, str(company_id))
+
+    def row(self, company_id: int) -> Optional[Dict]:
+        """회사 ID -> 회사 행 (색인 구축 시점의 프레임 기준)"""
+        position = self._positions.get(company_id)
+        if position is None:
+            return None
+        return self.frame.iloc[position].to_dict()
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        """검색어에 맞는 회사 ID (순위순, 같은 순위는 짧은 기업명 우선)"""
+        term = normalize_query(query)
+        if not term:
+            return []
+        ranks: Dict[int, int] = {}
+
+        def mark(positions, rank):
+            for position in positions:
+                if ranks.get(position, rank + 1) > rank:
+                    ranks[position] = rank
+
+        mark(self._exact.get(term, ()), RANK_EXACT)
+        mark(_prefix_range(self._jamo, to_jamo(term)), RANK_PREFIX)
+        if all(char in CHOSEONG for char in term):
+            mark(_prefix_range(self._initials, term), RANK_INITIALS)
+
+        # 부분 일치: n-gram 후보 교집합을 구한 뒤 실제 포함 여부 확인
+        candidates = None
+        for ngram in sorted(_ngrams(term), key=lambda g: len(self._ngrams.get(g, ()))):
+            postings = self._ngrams.get(ngram)
+            if not postings:
+                candidates = set()
+                break
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                break
+        for position in candidates or ():
+            if term in self._names[position]:
+                mark((position,), RANK_NAME)
+            elif term in self._descriptions[position]:
+                mark((position,), RANK_DESCRIPTION)
+
+        ordered = sorted(ranks, key=lambda position: (ranks[position], len(self._names[position]), position))
+        return [self.ids[position] for position in ordered[:limit]]
+
+def build_company_search_index(companies_df: pd.DataFrame) -> CompanySearchIndex:
+    """회사 프레임 -> 검색 색인 (companies_cache.derived의 build 함수)"""
+    return CompanySearchIndex(companies_df)
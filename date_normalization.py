@@ -0,0 +1,157 @@
+"""
+추천 프레임 날짜 정규화 (벡터 연산)
+- 접수시작일/접수마감일 문자열을 한 번에 파싱 (migrate_to_supabase.parse_date가 아는 모든 형식)
+- 같은 문자열은 한 번만 파싱 (고유값 단위로 파싱 후 펼침)
+- 지원가능여부/접수월을 np.select와 벡터 연산으로 파생 (행별 apply 제거)
+- 파생 컬럼은 기준일에 따라 달라지므로 캐시 키에 reference_date_key()를 포함
+- 로드맵 월 구간: 기준일부터 12개월(연도 경계 포함)을 groupby 한 번으로 행 위치 색인 생성
+- 기준일은 REFERENCE_DATE 환경변수로 설정 (YYYY-MM-DD 또는 today, 기본 2025-09-16)
+"""
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+START_DATE_COLUMN = '접수시작일'
+END_DATE_COLUMN = '접수마감일'
+STATUS_COLUMN = '지원가능여부'
+MONTH_COLUMN = '접수월'
+# 연*12 + (월-1): 연도가 다른 같은 월을 구분하는 절대 월 번호
+MONTH_INDEX_COLUMN = '접수월번호'
+ROADMAP_MONTHS = 12
+
+REFERENCE_DATE_ENV = 'REFERENCE_DATE'
+# 기존 calculate_support_status의 고정 기준일
+DEFAULT_REFERENCE_DATE = '2025-09-16'
+
+# parse_date와 같은 순서의 패턴 (연/월/일 그룹 이름으로 순서 통일)
+DATE_PATTERNS = [
+    r'(?P<year>\d{4})[.\-/](?P<month>\d{1,2})[.\-/](?P<day>\d{1,2})',
+    r'(?P<year>\d{4})년\s*(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일',
+    r'(?P<month>\d{1,2})[.\-/](?P<day>\d{1,2})[.\-/](?P<year>\d{4})',
+    r'(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일\s*(?P<year>\d{4})년',
+    # 구분자 없는 YYYYMMDD (기존 pd.to_datetime이 처리하던 형식)
+    r'^(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})(?!\d)',
+]
+# 월만 있는 값 (예: "3월", "03")
+MONTH_ONLY_PATTERN = r'^\s*(\d{1,2})\s*월?\s*$'
+
+def get_reference_date(reference_date=None) -> pd.Timestamp:
+    """지원가능여부 판단 기준일 (인자 > REFERENCE_DATE 환경변수 > 기본값)"""
+    value = reference_date if reference_date is not None else os.getenv(REFERENCE_DATE_ENV, DEFAULT_REFERENCE_DATE)
+    if isinstance(value, str) and value.strip().lower() == 'today':
+        return pd.Timestamp.today().normalize()
+    return pd.Timestamp(value).normalize()
+
+def reference_date_key() -> str:
+    """캐시 키용 기준일 문자열 (REFERENCE_DATE=today이면 자정이 지나면 바뀜)"""
+    return get_reference_date().strftime('%Y-%m-%d')
+
+def _parse_unique(values: pd.Series) -> pd.Series:
+    """고유 문자열 목록 파싱 (패턴 순서대로, 먼저 유효한 날짜가 나온 패턴 사용)"""
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    for pattern in DATE_PATTERNS:
+        remaining = parsed.isna()
+        if not remaining.any():
+            break
+        parts = values[remaining].str.extract(pattern)
+        matched = parts['year'].notna()
+        if not matched.any():
+            continue
+        parts = parts[matched].astype(int)
+        parsed.loc[parts.index] = pd.to_datetime(parts[['year', 'month', 'day']], errors='coerce')
+    return parsed
+
+def parse_dates(series: pd.Series) -> pd.Series:
+    """날짜 컬럼 -> datetime64 Series (파싱 실패/빈 값은 NaT)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is not None:
+            series = series.dt.tz_localize(None)
+        return series.dt.normalize()
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+    parsed = _parse_unique(pd.Series(uniques).astype(str).str.strip()).to_numpy()
+    result = np.full(len(series), np.datetime64('NaT'), dtype='datetime64[ns]')
+    valid = codes >= 0
+    result[valid] = parsed[codes[valid]]
+    return pd.Series(result, index=series.index)
+
+def extract_months(series: pd.Series, parsed: pd.Series = None) -> pd.Series:
+    """날짜 또는 월만 있는 값에서 월(1~12) 추출 (없으면 NA, parsed는 이미 파싱한 결과)"""
+    if parsed is None:
+        parsed = parse_dates(series)
+    months = parsed.dt.month.astype('Int64')
+    missing = months.isna() & series.notna()
+    if missing.any():
+        month_only = pd.to_numeric(
+            series[missing].astype(str).str.extract(MONTH_ONLY_PATTERN)[0], errors='coerce'
+        )
+        month_only = month_only.where(month_only.between(1, 12))
+        months.loc[missing] = month_only.astype('Int64')
+    return months
+
+def support_status(start: pd.Series, end: pd.Series, reference_date=None) -> pd.Series:
+    """파싱된 시작/마감일 -> 지원가능여부 (calculate_support_status와 같은 판정)"""
+    reference = get_reference_date(reference_date)
+    conditions = [
+        start.isna() | end.isna(),
+        start > reference,
+        end < reference,
+    ]
+    choices = ['정보부족', '접수예정', '접수마감']
+    return pd.Series(np.select(conditions, choices, default='지원가능'), index=start.index)
+
+def add_date_columns(df: pd.DataFrame, reference_date=None,
+                     start_column: str = START_DATE_COLUMN, end_column: str = END_DATE_COLUMN) -> pd.DataFrame:
+    """추천 프레임에 지원가능여부/접수월 컬럼 추가 (날짜 컬럼이 없으면 그대로 반환)"""
+    if df.empty or start_column not in df.columns or end_column not in df.columns:
+        return df
+    start = parse_dates(df[start_column])
+    end = parse_dates(df[end_column])
+    df[STATUS_COLUMN] = support_status(start, end, reference_date)
+    df[MONTH_COLUMN] = extract_months(df[start_column], start)
+    df[MONTH_INDEX_COLUMN] = month_indexes(start)
+    return df
+
+def month_indexes(parsed: pd.Series) -> pd.Series:
+    """파싱된 날짜 -> 절대 월 번호 (연*12 + 월-1, 없으면 NA)"""
+    return (parsed.dt.year * 12 + parsed.dt.month - 1).astype('Int64')
+
+def roadmap_window(reference_date=None, months: int = ROADMAP_MONTHS) -> List[pd.Period]:
+    """기준일이 속한 달부터 months개월 (연도 경계를 넘어 이어짐)
+
+    reference_date가 없으면 오늘 기준입니다. 점수 계산용 고정 기준일(get_reference_date)은
+    재현성을 위한 것이므로 로드맵에는 쓰지 않습니다.
+    """
+    if reference_date is None:
+        return roadmap_window(pd.Timestamp.today().normalize(), months)
+    start = get_reference_date(reference_date).to_period('M')
+    return [start + offset for offset in range(months)]
+
+def roadmap_buckets(df: pd.DataFrame, reference_date=None, months: int = ROADMAP_MONTHS,
+                    start_column: str = START_DATE_COLUMN) -> Tuple[List[pd.Period], Dict[int, np.ndarray]]:
+    """기준일(기본 오늘)부터 months개월 구간별 행 위치 색인 ({구간 번호: 행 위치 배열}, 공고가 없는 달은 빠짐)
+
+    연도가 있는 접수시작일은 절대 월 번호로, 월만 있는 값(예: '3월')은 구간 안의 가장 가까운
+    해당 월로 배정합니다. 프레임을 월마다 복사하지 않고 groupby 한 번으로 위치만 모읍니다.
+    """
+    window = roadmap_window(reference_date, months)
+    if df.empty:
+        return window, {}
+    if MONTH_INDEX_COLUMN in df.columns and MONTH_COLUMN in df.columns:
+        indexes, calendar_months = df[MONTH_INDEX_COLUMN], df[MONTH_COLUMN]
+    else:
+        parsed = parse_dates(df[start_column])
+        indexes, calendar_months = month_indexes(parsed), extract_months(df[start_column], parsed)
+
+    first = window[0].year * 12 + window[0].month - 1
+    offsets = indexes - first
+    # 연도 없이 월만 있는 값: 기준 월 이후 처음 돌아오는 해당 월
+    month_only = offsets.isna() & calendar_months.notna()
+    offsets = offsets.mask(month_only, (calendar_months - window[0].month) % 12)
+
+    offsets = offsets.where((offsets >= 0) & (offsets < months))
+    groups = pd.Series(np.arange(len(df))).groupby(offsets.to_numpy(), dropna=True).indices
+    return window, {int(offset): positions for offset, positions in groups.items()}
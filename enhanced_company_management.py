@@ -15,6 +15,14 @@ from typing import Dict, List, Optional
 from supabase import create_client, Client
 import os
 
+from matching_engine import score_biz_announcements, score_kstartup_announcements
+from announcement_index import indexed_frame, sync_announcement_index
+from supabase_loader import fetch_frame, BIZ_MATCH_COLUMNS, KSTARTUP_MATCH_COLUMNS
+from batch_writer import upsert_rows, RECOMMENDATION_CONFLICT_COLUMNS, NOTIFICATION_CONFLICT_COLUMNS
+from shared_cache import invalidate_shared_cache
+from table_watermarks import notify_table_changed
+from text_normalization import extract_company_names
+
 def enhanced_save_company_with_recommendations(company_data: Dict, supabase: Client) -> bool:
     """신규 회사 추가 및 자동 추천 생성"""
     try:
@@ -48,6 +56,9 @@ def enhanced_save_company_with_recommendations(company_data: Dict, supabase: Cli
         
         # 저장된 회사의 ID 가져오기
         company_id = result.data[0]['No.']
+        # 앱의 회사 공유 캐시 갱신 예약 (사이드바 목록에 새 회사 반영)
+        notify_table_changed('alpha_companies2')
+        invalidate_shared_cache('companies')
         
         # 2. 자동 추천 생성
         recommendations = generate_company_recommendations(company_data, supabase)
@@ -96,60 +107,16 @@ def generate_company_recommendations(company_data: Dict, supabase: Client) -> Li
 def generate_biz_recommendations(company_data: Dict, supabase: Client) -> List[Dict]:
     """기업마당(biz2) 데이터 기반 추천 생성"""
     try:
-        # biz2 데이터 로드
-        result = supabase.table('biz2').select('*').execute()
-        if not result.data:
+        # 공고 로드 경로에서 갱신한 역색인/매칭 프레임 사용 (아직 없으면 한 번만 페이지 단위 조회 후 색인)
+        biz_df, biz_index = indexed_frame('biz2')
+        if biz_df is None:
+            biz_df = fetch_frame(supabase, 'biz2', BIZ_MATCH_COLUMNS, order='번호')
+            biz_index = sync_announcement_index('biz2', biz_df)
+        if biz_df.empty:
             return []
         
-        biz_df = pd.DataFrame(result.data)
-        recommendations = []
-        
-        # 업종 매칭
-        industry = company_data.get('industry', '')
-        keywords = company_data.get('keywords', [])
-        
-        for _, announcement in biz_df.iterrows():
-            score = 0
-            matching_reasons = []
-            
-            # 업종 매칭
-            if industry and '지원분야' in announcement:
-                if industry in str(announcement['지원분야']):
-                    score += 80
-                    matching_reasons.append(f"업종 매칭: {industry}")
-            
-            # 키워드 매칭
-            for keyword in keywords:
-                if keyword and '공고명' in announcement:
-                    if keyword in str(announcement['공고명']):
-                        score += 70
-                        matching_reasons.append(f"키워드 매칭: {keyword}")
-                        break
-            
-            # 지역 매칭
-            region = company_data.get('region', '')
-            if region and '소관부처' in announcement:
-                if region in str(announcement['소관부처']):
-                    score += 60
-                    matching_reasons.append(f"지역 매칭: {region}")
-            
-            if score > 0:
-                recommendations.append({
-                    'company_id': company_data.get('id'),
-                    'company_name': company_data['name'],
-                    'announcement_title': announcement.get('공고명', ''),
-                    'announcement_source': '기업마당',
-                    'total_score': score,
-                    'matching_reason': '; '.join(matching_reasons),
-                    'application_start_date': announcement.get('신청시작일자', ''),
-                    'application_end_date': announcement.get('신청종료일자', ''),
-                    'detail_page_url': announcement.get('공고상세URL', ''),
-                    'announcement_details': f"소관부처: {announcement.get('소관부처', 'N/A')}, 사업수행기관: {announcement.get('사업수행기관', 'N/A')}",
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                })
-        
-        return recommendations
+        # 후보 공고만 벡터 연산으로 채점
+        return score_biz_announcements(biz_df, company_data, company_data.get('id'), index=biz_index)
         
     except Exception as e:
         st.error(f"biz2 추천 생성 실패: {e}")
@@ -158,61 +125,20 @@ def generate_biz_recommendations(company_data: Dict, supabase: Client) -> List[D
 def generate_kstartup_recommendations(company_data: Dict, supabase: Client) -> List[Dict]:
     """K-스타트업(kstartup2) 데이터 기반 추천 생성"""
     try:
-        # kstartup2 데이터 로드
-        result = supabase.table('kstartup2').select('*').execute()
-        if not result.data:
+        # 공고 로드 경로에서 갱신한 역색인/매칭 프레임 사용 (아직 없으면 한 번만 페이지 단위 조회 후 색인)
+        kstartup_df, kstartup_index = indexed_frame('kstartup2')
+        if kstartup_df is None:
+            kstartup_df = fetch_frame(supabase, 'kstartup2', KSTARTUP_MATCH_COLUMNS, order='공고일련번호')
+            kstartup_index = sync_announcement_index('kstartup2', kstartup_df)
+        if kstartup_df.empty:
             return []
         
-        kstartup_df = pd.DataFrame(result.data)
-        recommendations = []
-        
-        # 업종 및 키워드 매칭
-        industry = company_data.get('industry', '')
-        keywords = company_data.get('keywords', [])
-        
-        for _, announcement in kstartup_df.iterrows():
-            score = 0
-            matching_reasons = []
-            
-            # 업종 매칭
-            if industry and '지원사업분류' in announcement:
-                if industry in str(announcement['지원사업분류']):
-                    score += 80
-                    matching_reasons.append(f"업종 매칭: {industry}")
-            
-            # 키워드 매칭 (공고내용에서)
-            for keyword in keywords:
-                if keyword and '공고내용' in announcement:
-                    if keyword in str(announcement['공고내용']):
-                        score += 70
-                        matching_reasons.append(f"키워드 매칭: {keyword}")
-                        break
-            
-            # 사업아이템 매칭
-            if '사업아이템 한 줄 소개' in company_data:
-                business_item = company_data['사업아이템 한 줄 소개']
-                if business_item and '공고내용' in announcement:
-                    if business_item in str(announcement['공고내용']):
-                        score += 90
-                        matching_reasons.append("사업아이템 매칭")
-            
-            if score > 0:
-                recommendations.append({
-                    'company_id': company_data.get('id'),
-                    'company_name': company_data['name'],
-                    'announcement_title': announcement.get('사업공고명', ''),
-                    'announcement_source': 'K-스타트업',
-                    'total_score': score,
-                    'matching_reason': '; '.join(matching_reasons),
-                    'application_start_date': announcement.get('공고접수시작일시', ''),
-                    'application_end_date': announcement.get('공고접수종료일시', ''),
-                    'detail_page_url': announcement.get('상세페이지 url', ''),
-                    'announcement_details': announcement.get('공고내용', '')[:200] + '...' if len(str(announcement.get('공고내용', ''))) > 200 else announcement.get('공고내용', ''),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                })
-        
-        return recommendations
+        # 후보 공고만 벡터 연산으로 채점 (사업아이템은 '사업아이템 한 줄 소개' 사용)
+        return score_kstartup_announcements(
+            kstartup_df, company_data, company_data.get('id'),
+            business_item=company_data.get('사업아이템 한 줄 소개', ''),
+            index=kstartup_index
+        )
         
     except Exception as e:
         st.error(f"kstartup2 추천 생성 실패: {e}")
@@ -243,9 +169,10 @@ def deduplicate_and_sort_recommendations(recommendations: List[Dict]) -> List[Di
 def save_recommendations_to_supabase(company_id: int, recommendations: List[Dict], supabase: Client):
     """추천 결과를 Supabase에 저장"""
     try:
-        for rec in recommendations:
-            rec['company_id'] = company_id
-            supabase.table('recommend2').insert(rec).execute()
+        # 다중 행 upsert 한 번으로 저장 (같은 회사/공고는 갱신, 유니크 인덱스가 없으면 insert)
+        rows = [{**rec, 'company_id': company_id} for rec in recommendations]
+        upsert_rows(supabase, 'recommend2', rows, on_conflict=RECOMMENDATION_CONFLICT_COLUMNS,
+                    insert_fallback=True)
         
         st.info(f"📊 {len(recommendations)}개 추천이 recommend2 테이블에 저장되었습니다.")
         
@@ -261,7 +188,9 @@ def initialize_notification_state(company_id: int, supabase: Client):
             'last_updated': datetime.now().isoformat()
         }
         
-        supabase.table('notification_states').insert(notification_data).execute()
+        upsert_rows(supabase, 'notification_states', [notification_data], on_conflict=NOTIFICATION_CONFLICT_COLUMNS,
+                    insert_fallback=True)
+        notify_table_changed('notification_states')
         st.info(f"🔔 알림 상태가 초기화되었습니다.")
         
     except Exception as e:
@@ -371,8 +300,7 @@ def load_companies():
         if not df.empty:
             # 기업명 추출
             if '사업아이템 한 줄 소개' in df.columns:
-                df['company_name'] = df['사업아이템 한 줄 소개'].str.extract(r'^([^-]+) - ')[0].str.strip()
-                df['company_name'] = df['company_name'].fillna(df['사업아이템 한 줄 소개'])
+                df['company_name'] = extract_company_names(df['사업아이템 한 줄 소개'])
             
             # 컬럼명 매핑
             df = df.rename(columns={
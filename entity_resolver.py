@@ -0,0 +1,156 @@
+"""
+기업명/공고명 엔티티 매칭 색인
+- 정확 일치(해시) -> 정규화 일치 -> 부분 일치 -> 퍼지 -> 한글 키워드 순서로 매칭
+- 부분 일치/키워드/퍼지 후보는 2글자 n-gram 역색인으로 좁힌 뒤에만 문자열 비교
+- 퍼지 점수(fuzz.ratio)는 n-gram 겹침이 많은 상위 후보 몇 개에만 계산
+- 같은 이름은 한 번만 계산하도록 결과를 메모
+- 정규화/n-gram/한글 키워드(불용어 제외)는 text_normalization 공용 모듈 사용
+"""
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+import pandas as pd
+
+from text_normalization import (
+    NGRAM_SIZE, COMPANY_KEYWORD_PATTERN, ANNOUNCEMENT_KEYWORD_PATTERN,
+    normalize_company_name, ngrams, hangul_keywords
+)
+
+# 퍼지 매칭 최소 점수 (auto_sync_system 기존 기준)
+FUZZY_THRESHOLD = 70
+# 퍼지 점수를 계산할 최대 후보 수
+FUZZY_CANDIDATES = 20
+# 퍼지 후보 집계에서 제외할 흔한 n-gram 기준 (이보다 많은 엔티티에 나오는 n-gram)
+COMMON_NGRAM_LIMIT = 1000
+
+def _fuzz_ratio():
+    """fuzzywuzzy가 있으면 fuzz.ratio, 없으면 같은 방식(SequenceMatcher)의 대체 함수"""
+    try:
+        from fuzzywuzzy import fuzz
+        return fuzz.ratio
+    except ImportError:
+        return lambda a, b: int(round(100 * SequenceMatcher(None, a, b).ratio()))
+
+class EntityResolver:
+    """이름 -> ID 매칭 색인 (한 번 구축 후 여러 행 매칭에 재사용)"""
+
+    def __init__(self, names: Sequence, ids: Sequence, keyword_pattern: str = COMPANY_KEYWORD_PATTERN,
+                 fuzzy_threshold: int = FUZZY_THRESHOLD, fuzzy_candidates: int = FUZZY_CANDIDATES):
+        self.names: List[str] = ['' if pd.isna(name) else str(name) for name in names]
+        self.ids = list(ids)
+        self.keyword_pattern = keyword_pattern
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_candidates = fuzzy_candidates
+        self._ratio = None
+        self._memo: Dict[str, Optional[object]] = {}
+
+        # 원래 순서상 첫 번째 엔티티가 우선 (기존 iloc[0] 동작과 동일)
+        self._exact: Dict[str, int] = {}
+        self._normalized: Dict[str, int] = {}
+        self._lowered: List[str] = []
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        for position, name in enumerate(self.names):
+            self._exact.setdefault(name, position)
+            normalized = normalize_company_name(name)
+            if normalized:
+                self._normalized.setdefault(normalized, position)
+            lowered = name.lower()
+            self._lowered.append(lowered)
+            for ngram in ngrams(lowered):
+                self._postings[ngram].add(position)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, name_column: str, id_column: str = 'id', **kwargs) -> 'EntityResolver':
+        if df is None or df.empty or name_column not in df.columns:
+            return cls([], [], **kwargs)
+        return cls(df[name_column].tolist(), df[id_column].tolist(), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _candidates(self, lowered: str) -> Optional[Set[int]]:
+        """lowered를 포함할 수 있는 엔티티 위치 (n-gram 교집합, 좁힐 수 없으면 None)"""
+        grams = ngrams(lowered)
+        if not grams:
+            return None
+        result = None
+        for ngram in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+            positions = self._postings.get(ngram)
+            if not positions:
+                return set()
+            result = positions if result is None else result & positions
+            if not result:
+                return set()
+        return result
+
+    def _first_containing(self, text: str) -> Optional[int]:
+        """text를 포함하는 첫 번째 엔티티 위치 (대소문자 무시)"""
+        lowered = text.lower()
+        candidates = self._candidates(lowered)
+        positions = range(len(self.names)) if candidates is None else sorted(candidates)
+        for position in positions:
+            if lowered in self._lowered[position]:
+                return position
+        return None
+
+    def _best_fuzzy(self, text: str) -> Optional[int]:
+        """n-gram 겹침 상위 후보에만 fuzz.ratio 계산"""
+        lowered = text.lower()
+        postings = sorted(
+            (self._postings[ngram] for ngram in ngrams(lowered) if ngram in self._postings), key=len
+        )
+        if not postings:
+            return None
+        # 흔한 n-gram(예: '주식', '지원')은 후보 구분에 도움이 안 되므로 제외 (모두 흔하면 가장 드문 것만 사용)
+        selective = [positions for positions in postings if len(positions) <= COMMON_NGRAM_LIMIT] or postings[:1]
+        overlap = Counter()
+        for positions in selective:
+            overlap.update(positions)
+        if not overlap:
+            return None
+        if self._ratio is None:
+            self._ratio = _fuzz_ratio()
+        best_position, best_score = None, -1
+        for position, _ in overlap.most_common(self.fuzzy_candidates):
+            score = self._ratio(text, self.names[position])
+            if score > best_score or (score == best_score and position < best_position):
+                best_position, best_score = position, score
+        return best_position if best_score >= self.fuzzy_threshold else None
+
+    def _resolve_position(self, text: str) -> Optional[int]:
+        # 1. 정확한 매칭
+        if text in self._exact:
+            return self._exact[text]
+        # 2. 정규화 매칭 (법인 표기/공백/특수문자/대소문자 무시)
+        normalized = normalize_company_name(text)
+        if normalized in self._normalized:
+            return self._normalized[normalized]
+        # 3. 부분 매칭
+        position = self._first_containing(text)
+        if position is not None:
+            return position
+        # 4. 퍼지 매칭
+        position = self._best_fuzzy(text)
+        if position is not None:
+            return position
+        # 5. 키워드 매칭
+        for keyword in hangul_keywords(text, self.keyword_pattern):
+            position = self._first_containing(keyword)
+            if position is not None:
+                return position
+        return None
+
+    def resolve(self, name) -> Optional[object]:
+        """이름에 가장 잘 맞는 엔티티 ID (없으면 None)"""
+        if name is None or (isinstance(name, float) and pd.isna(name)) or not self.names:
+            return None
+        text = str(name)
+        if text not in self._memo:
+            position = self._resolve_position(text)
+            self._memo[text] = None if position is None else self.ids[position]
+        return self._memo[text]
+
+    def resolve_many(self, names: Iterable) -> List[Optional[object]]:
+        """여러 이름 일괄 매칭 (중복 이름은 메모로 한 번만 계산)"""
+        return [self.resolve(name) for name in names]
@@ -0,0 +1,253 @@
+"""
+로컬 Supabase 대체 클라이언트 (메모리 기반)
+- supabase-py의 table().select().eq()/ilike()/in_()/range()/order()/limit() 및
+  insert/upsert/update/delete 체인을 흉내 냄
+- PostgREST처럼 없는 컬럼을 조회/필터하면 오류, 응답 행 수는 max_rows로 제한
+- 요청 수 집계와 요청당 지연(latency) 설정으로 네트워크 왕복 비용을 재현
+- 벤치마크(benchmark_supabase.py)와 로컬 개발용이며 운영 코드에서는 사용하지 않음
+"""
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+# PostgREST 기본 max-rows
+DEFAULT_MAX_ROWS = 1000
+
+class FakeAPIError(Exception):
+    """PostgREST 오류 응답 대체 (없는 컬럼, 유니크 충돌 등)"""
+
+class FakeResponse:
+    def __init__(self, data: List[Dict], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+def _ilike_pattern(pattern: str) -> re.Pattern:
+    """SQL LIKE 패턴(% / _)을 정규식으로 변환"""
+    parts = []
+    for char in pattern:
+        if char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile('^' + ''.join(parts) + '$', re.IGNORECASE | re.DOTALL)
+
+class FakeTable:
+    """테이블 1개 (행 목록 + 컬럼 집합)"""
+
+    def __init__(self, rows: Optional[List[Dict]] = None, columns: Optional[List[str]] = None):
+        self.rows: List[Dict] = [dict(row) for row in rows or []]
+        self.columns = set(columns or [])
+        for row in self.rows:
+            self.columns.update(row.keys())
+        self.lock = threading.Lock()
+
+class FakeQuery:
+    """요청 1건을 조립하는 쿼리 빌더"""
+
+    def __init__(self, client: 'FakeSupabase', name: str):
+        self.client = client
+        self.name = name
+        self.operation = 'select'
+        self.columns: Optional[List[str]] = None
+        self.filters = []
+        self.order_by = []
+        self.offset = 0
+        self.row_limit: Optional[int] = None
+        self.payload = None
+        self.on_conflict: Optional[str] = None
+        self.count_mode: Optional[str] = None
+
+    # 조회
+    def select(self, columns: str = '*', count: Optional[str] = None):
+        self.columns = None if columns.strip() == '*' else [c.strip().strip('"') for c in columns.split(',')]
+        self.count_mode = count
+        return self
+
+    def _filter(self, column: str, predicate):
+        self.filters.append((column, predicate))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, lambda v: v == value)
+
+    def neq(self, column, value):
+        return self._filter(column, lambda v: v != value)
+
+    def gt(self, column, value):
+        return self._filter(column, lambda v: v is not None and v > value)
+
+    def gte(self, column, value):
+        return self._filter(column, lambda v: v is not None and v >= value)
+
+    def lt(self, column, value):
+        return self._filter(column, lambda v: v is not None and v < value)
+
+    def lte(self, column, value):
+        return self._filter(column, lambda v: v is not None and v <= value)
+
+    def in_(self, column, values):
+        values = set(values)
+        return self._filter(column, lambda v: v in values)
+
+    def ilike(self, column, pattern):
+        regex = _ilike_pattern(pattern)
+        return self._filter(column, lambda v: v is not None and bool(regex.match(str(v))))
+
+    def like(self, column, pattern):
+        return self.ilike(column, pattern)
+
+    def order(self, column, desc: bool = False):
+        self.order_by.append((column.strip('"'), desc))
+        return self
+
+    def range(self, start: int, end: int):
+        self.offset = start
+        self.row_limit = end - start + 1
+        return self
+
+    def limit(self, n: int):
+        self.row_limit = n
+        return self
+
+    # 쓰기
+    def insert(self, rows):
+        self.operation = 'insert'
+        self.payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict: Optional[str] = None):
+        self.operation = 'upsert'
+        self.payload = rows if isinstance(rows, list) else [rows]
+        self.on_conflict = on_conflict
+        return self
+
+    def update(self, data: Dict):
+        self.operation = 'update'
+        self.payload = data
+        return self
+
+    def delete(self):
+        self.operation = 'delete'
+        return self
+
+    # 실행
+    def _check_columns(self, table: FakeTable, columns):
+        missing = [c for c in columns if c not in table.columns]
+        if missing and table.rows:
+            raise FakeAPIError(f"column {self.name}.{missing[0]} does not exist")
+
+    def _matches(self, row: Dict) -> bool:
+        return all(predicate(row.get(column)) for column, predicate in self.filters)
+
+    def execute(self) -> FakeResponse:
+        self.client._record_request(self.name, self.operation)
+        table = self.client._table(self.name)
+        with table.lock:
+            self._check_columns(table, [column for column, _ in self.filters])
+            if self.operation == 'select':
+                return self._execute_select(table)
+            if self.operation == 'insert':
+                return self._execute_insert(table)
+            if self.operation == 'upsert':
+                return self._execute_upsert(table)
+            if self.operation == 'update':
+                return self._execute_update(table)
+            return self._execute_delete(table)
+
+    def _execute_select(self, table: FakeTable) -> FakeResponse:
+        if self.columns:
+            self._check_columns(table, self.columns)
+        rows = [row for row in table.rows if self._matches(row)] if self.filters else list(table.rows)
+        total = len(rows)
+        for column, desc in reversed(self.order_by):
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        limit = min(self.row_limit or self.client.max_rows, self.client.max_rows)
+        rows = rows[self.offset:self.offset + limit]
+        if self.columns:
+            rows = [{column: row.get(column) for column in self.columns} for row in rows]
+        else:
+            rows = [dict(row) for row in rows]
+        return FakeResponse(rows, total if self.count_mode else None)
+
+    def _execute_insert(self, table: FakeTable) -> FakeResponse:
+        inserted = [dict(row) for row in self.payload]
+        for row in inserted:
+            table.columns.update(row.keys())
+        table.rows.extend(inserted)
+        return FakeResponse(inserted)
+
+    def _execute_upsert(self, table: FakeTable) -> FakeResponse:
+        keys = [c.strip() for c in (self.on_conflict or 'id').split(',')]
+        positions = {tuple(row.get(k) for k in keys): i for i, row in enumerate(table.rows)}
+        written = []
+        for row in self.payload:
+            row = dict(row)
+            table.columns.update(row.keys())
+            key = tuple(row.get(k) for k in keys)
+            if key in positions:
+                table.rows[positions[key]].update(row)
+                written.append(table.rows[positions[key]])
+            else:
+                positions[key] = len(table.rows)
+                table.rows.append(row)
+                written.append(row)
+        return FakeResponse(written)
+
+    def _execute_update(self, table: FakeTable) -> FakeResponse:
+        self._check_columns(table, list(self.payload.keys()))
+        updated = []
+        for row in table.rows:
+            if self._matches(row):
+                row.update(self.payload)
+                updated.append(row)
+        return FakeResponse(updated)
+
+    def _execute_delete(self, table: FakeTable) -> FakeResponse:
+        kept, deleted = [], []
+        for row in table.rows:
+            (deleted if self._matches(row) else kept).append(row)
+        table.rows = kept
+        return FakeResponse(deleted)
+
+class FakeSupabase:
+    """supabase.Client 대체 (table() 진입점만 제공)"""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict]]] = None, max_rows: int = DEFAULT_MAX_ROWS,
+                 latency: float = 0.0):
+        self.max_rows = max_rows
+        # 요청 1건당 지연 시간 (초) - 네트워크 왕복 재현용
+        self.latency = latency
+        self._tables: Dict[str, FakeTable] = {name: FakeTable(rows) for name, rows in (tables or {}).items()}
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.requests_by_table: Dict[str, int] = {}
+
+    def _table(self, name: str) -> FakeTable:
+        # PostgREST처럼 없는 테이블/뷰는 오류 (load_table로 만든 테이블만 존재)
+        with self._lock:
+            if name not in self._tables:
+                raise FakeAPIError(f'relation "public.{name}" does not exist')
+            return self._tables[name]
+
+    def _record_request(self, name: str, operation: str):
+        with self._lock:
+            self.request_count += 1
+            self.requests_by_table[name] = self.requests_by_table.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset_counters(self):
+        with self._lock:
+            self.request_count = 0
+            self.requests_by_table = {}
+
+    def load_table(self, name: str, rows: List[Dict]):
+        """테이블 데이터 교체"""
+        with self._lock:
+            self._tables[name] = FakeTable(rows)
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
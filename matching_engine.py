@@ -0,0 +1,185 @@
+"""
+벡터화 추천 매칭 엔진
+- biz2 / kstartup2 공고 전체를 한 번에 채점 (iterrows 루프 제거)
+- 한 회사 또는 여러 회사를 같은 공고 프레임에 대해 일괄 채점
+- 점수 규칙(업종 80 / 키워드 70 / 지역 60 / 사업아이템 90)과 매칭 이유는 기존과 동일
+- 공고 역색인(announcement_index)이 주어지면 후보 공고만 채점
+- 포함 판정은 대소문자를 구분하는 정확한 부분 문자열 비교 (연속 공백만 한 칸으로 정리, 같은 문자열은 한 번만 정리)
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from announcement_keys import native_keys
+from text_normalization import normalize_whitespace, whitespace_series
+
+# 점수 규칙
+INDUSTRY_POINTS = 80
+KEYWORD_POINTS = 70
+REGION_POINTS = 60
+BUSINESS_ITEM_POINTS = 90
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """매칭 대상 텍스트 컬럼을 공백 정리한 문자열 Series로 변환 (컬럼이 없으면 빈 문자열)"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    return whitespace_series(df[column])
+
+def _contains(text: pd.Series, needle: str) -> pd.Series:
+    """부분 문자열 포함 여부를 벡터 연산으로 계산 (대소문자 구분, 공백만 정리)"""
+    needle = normalize_whitespace(needle)
+    if not needle:
+        return pd.Series(False, index=text.index)
+    return text.str.contains(needle, regex=False)
+
+def _first_keyword_hit(text: pd.Series, keywords: List[str]) -> pd.Series:
+    """행마다 처음으로 매칭된 키워드 (없으면 빈 문자열) - 기존 루프의 break 동작과 동일"""
+    hits = pd.Series('', index=text.index)
+    for keyword in keywords:
+        if not keyword:
+            continue
+        hits = hits.mask(_contains(text, keyword) & (hits == ''), keyword)
+    return hits
+
+def _score_frame(df: pd.DataFrame, rules: List[tuple]) -> tuple:
+    """(mask, points, reason) 규칙 목록으로 점수와 매칭 이유 Series 계산"""
+    scores = pd.Series(0, index=df.index)
+    reasons = pd.Series('', index=df.index)
+    for mask, points, reason in rules:
+        if not mask.any():
+            continue
+        scores = scores + np.where(mask, points, 0)
+        joined = reasons.where(reasons == '', reasons + '; ') + reason
+        reasons = joined.where(mask, reasons)
+    return scores, reasons
+
+def _candidate_frame(df: pd.DataFrame, index, queries: List[tuple]) -> pd.DataFrame:
+    """역색인으로 후보 공고만 남긴 프레임 (색인이 없거나 좁힐 수 없으면 전체)"""
+    if index is None or index.id_column not in df.columns:
+        return df
+    candidate_ids = index.candidates_any(queries)
+    if candidate_ids is None:
+        return df
+    return df[df[index.id_column].astype(str).isin(candidate_ids)]
+
+def score_biz_announcements(biz_df: pd.DataFrame, company_data: Dict, company_id, index=None) -> List[Dict]:
+    """기업마당(biz2) 공고 전체를 한 회사에 대해 벡터 연산으로 채점"""
+    if biz_df is None or biz_df.empty:
+        return []
+
+    industry = company_data.get('industry', '')
+    keywords = company_data.get('keywords', []) or []
+    region = company_data.get('region', '')
+
+    biz_df = _candidate_frame(biz_df, index, [('지원분야', industry), ('소관부처', region)]
+                              + [('공고명', keyword) for keyword in keywords])
+    if biz_df.empty:
+        return []
+
+    industry_mask = _contains(_text_column(biz_df, '지원분야'), industry)
+    keyword_hits = _first_keyword_hit(_text_column(biz_df, '공고명'), keywords)
+    keyword_mask = keyword_hits != ''
+    region_mask = _contains(_text_column(biz_df, '소관부처'), region)
+
+    scores, reasons = _score_frame(biz_df, [
+        (industry_mask, INDUSTRY_POINTS, f"업종 매칭: {industry}"),
+        (keyword_mask, KEYWORD_POINTS, '키워드 매칭: ' + keyword_hits),
+        (region_mask, REGION_POINTS, f"지역 매칭: {region}"),
+    ])
+
+    matched = scores > 0
+    if not matched.any():
+        return []
+
+    hits = biz_df[matched]
+    now = datetime.now().isoformat()
+    details = (
+        '소관부처: ' + hits.get('소관부처', pd.Series('N/A', index=hits.index)).fillna('N/A').astype(str)
+        + ', 사업수행기관: ' + hits.get('사업수행기관', pd.Series('N/A', index=hits.index)).fillna('N/A').astype(str)
+    )
+
+    return pd.DataFrame({
+        'company_id': company_id,
+        'company_name': company_data['name'],
+        'announcement_key': native_keys('biz', hits['번호']) if '번호' in hits.columns else None,
+        'announcement_title': hits.get('공고명', ''),
+        'announcement_source': '기업마당',
+        'total_score': scores[matched],
+        'matching_reason': reasons[matched],
+        'application_start_date': hits.get('신청시작일자', ''),
+        'application_end_date': hits.get('신청종료일자', ''),
+        'detail_page_url': hits.get('공고상세URL', ''),
+        'announcement_details': details,
+        'created_at': now,
+        'updated_at': now
+    }, index=hits.index).to_dict('records')
+
+def score_kstartup_announcements(kstartup_df: pd.DataFrame, company_data: Dict, company_id,
+                                 business_item: Optional[str] = None, index=None) -> List[Dict]:
+    """K-스타트업(kstartup2) 공고 전체를 한 회사에 대해 벡터 연산으로 채점"""
+    if kstartup_df is None or kstartup_df.empty:
+        return []
+
+    industry = company_data.get('industry', '')
+    keywords = company_data.get('keywords', []) or []
+    if business_item is None:
+        business_item = company_data.get('description', '')
+
+    kstartup_df = _candidate_frame(kstartup_df, index, [('지원사업분류', industry), ('공고내용', business_item)]
+                                   + [('공고내용', keyword) for keyword in keywords])
+    if kstartup_df.empty:
+        return []
+
+    content = _text_column(kstartup_df, '공고내용')
+    industry_mask = _contains(_text_column(kstartup_df, '지원사업분류'), industry)
+    keyword_hits = _first_keyword_hit(content, keywords)
+    keyword_mask = keyword_hits != ''
+    business_mask = _contains(content, business_item)
+
+    scores, reasons = _score_frame(kstartup_df, [
+        (industry_mask, INDUSTRY_POINTS, f"업종 매칭: {industry}"),
+        (keyword_mask, KEYWORD_POINTS, '키워드 매칭: ' + keyword_hits),
+        (business_mask, BUSINESS_ITEM_POINTS, "사업아이템 매칭"),
+    ])
+
+    matched = scores > 0
+    if not matched.any():
+        return []
+
+    hits = kstartup_df[matched]
+    now = datetime.now().isoformat()
+    hit_content = hits.get('공고내용', pd.Series('', index=hits.index)).fillna('').astype(str)
+    details = hit_content.where(hit_content.str.len() <= 200, hit_content.str[:200] + '...')
+
+    return pd.DataFrame({
+        'company_id': company_id,
+        'company_name': company_data['name'],
+        'announcement_key': native_keys('ks', hits['공고일련번호']) if '공고일련번호' in hits.columns else None,
+        'announcement_title': hits.get('사업공고명', ''),
+        'announcement_source': 'K-스타트업',
+        'total_score': scores[matched],
+        'matching_reason': reasons[matched],
+        'application_start_date': hits.get('공고접수시작일시', ''),
+        'application_end_date': hits.get('공고접수종료일시', ''),
+        'detail_page_url': hits.get('상세페이지 url', ''),
+        'announcement_details': details,
+        'created_at': now,
+        'updated_at': now
+    }, index=hits.index).to_dict('records')
+
+def score_companies(companies: List[Dict], biz_df: pd.DataFrame, kstartup_df: pd.DataFrame,
+                    business_item_key: str = 'description', biz_index=None, kstartup_index=None) -> Dict:
+    """여러 회사를 같은 공고 프레임에 대해 일괄 채점 (company_id -> 추천 리스트)"""
+    results = {}
+    for company_data in companies:
+        company_id = company_data.get('id')
+        recommendations = score_biz_announcements(biz_df, company_data, company_id, index=biz_index)
+        recommendations.extend(score_kstartup_announcements(
+            kstartup_df, company_data, company_id,
+            business_item=company_data.get(business_item_key, ''),
+            index=kstartup_index
+        ))
+        results[company_id] = recommendations
+    return results
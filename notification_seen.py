@@ -0,0 +1,82 @@
+"""
+알림 확인 상태 (notification_states.seen_announcement_ids)
+- 확인한 공고를 공고제목 TEXT[] 대신 정수 ID(announcement_keys.announcement_int_id)의 정렬 배열로 관리
+- 포함 여부는 정렬 배열 이진 탐색(np.searchsorted), 병합은 np.union1d
+- 저장은 새로 확인한 ID만 add_seen_announcements RPC로 보내고 서버에서 합집합 (전체 배열 재작성 없음)
+- RPC가 없으면(supabase_notification_seen.sql 미적용) 조회 후 병합한 배열을 upsert
+- 이전 last_seen_announcement_ids(공고제목 또는 공고 키)는 조회 시 정수 ID로 변환해 합침
+"""
+import logging
+from datetime import datetime
+from typing import Iterable
+
+import numpy as np
+
+from announcement_keys import announcement_int_id, content_key, is_announcement_key
+from batch_writer import upsert_rows, NOTIFICATION_CONFLICT_COLUMNS
+from supabase_loader import fetch_frame
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_TABLE = 'notification_states'
+SEEN_COLUMN = 'seen_announcement_ids'
+LEGACY_SEEN_COLUMN = 'last_seen_announcement_ids'
+ADD_SEEN_FUNCTION = 'add_seen_announcements'
+
+def seen_array(ids: Iterable[int] = ()) -> np.ndarray:
+    """정수 ID -> 정렬/중복 제거된 int64 배열"""
+    return np.unique(np.fromiter((int(i) for i in ids), dtype=np.int64))
+
+def legacy_seen_ids(values: Iterable[str]) -> np.ndarray:
+    """이전 형식(공고제목 또는 공고 키 문자열) -> 정수 ID 배열 (키 접두어가 없으면 공고제목으로 보고 해시 키 사용)"""
+    return seen_array(
+        announcement_int_id(value if is_announcement_key(value) else content_key(value))
+        for value in (str(v) for v in values if v)
+    )
+
+def contains(seen: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """ids 각각이 정렬 배열 seen에 있는지 (불리언 배열, O(n log m))"""
+    ids = np.asarray(ids, dtype=np.int64)
+    if len(seen) == 0:
+        return np.zeros(len(ids), dtype=bool)
+    positions = np.minimum(np.searchsorted(seen, ids), len(seen) - 1)
+    return seen[positions] == ids
+
+def load_seen(client, company_id: int) -> np.ndarray:
+    """회사의 확인한 공고 정수 ID 배열 (행이 없거나 조회 실패 시 빈 배열)"""
+    if client is None:
+        return seen_array()
+    try:
+        df = fetch_frame(client, NOTIFICATION_TABLE, [SEEN_COLUMN, LEGACY_SEEN_COLUMN],
+                         [('eq', 'company_id', company_id)], order='company_id')
+    except Exception as e:
+        logger.warning(f"{NOTIFICATION_TABLE} 조회 실패: {e}")
+        return seen_array()
+    if df.empty:
+        return seen_array()
+    row = df.iloc[0]
+    stored = row.get(SEEN_COLUMN)
+    seen = seen_array(stored) if isinstance(stored, list) else seen_array()
+    legacy = row.get(LEGACY_SEEN_COLUMN)
+    if isinstance(legacy, list) and legacy:
+        seen = np.union1d(seen, legacy_seen_ids(legacy))
+    return seen
+
+def add_seen(client, company_id: int, ids: Iterable[int]) -> np.ndarray:
+    """새로 확인한 ID만 저장 (서버 합집합 RPC, 없으면 병합 후 upsert) - 추가한 ID 배열 반환"""
+    delta = seen_array(ids)
+    if len(delta) == 0:
+        return delta
+    try:
+        client.rpc(ADD_SEEN_FUNCTION, {'p_company_id': company_id, 'p_ids': delta.tolist()}).execute()
+        return delta
+    except Exception as e:
+        logger.info(f"{ADD_SEEN_FUNCTION} RPC를 사용할 수 없어 전체 배열을 저장합니다: {e}")
+    merged = np.union1d(load_seen(client, company_id), delta)
+    row = {
+        'company_id': company_id,
+        SEEN_COLUMN: merged.tolist(),
+        'last_updated': datetime.now().isoformat()
+    }
+    upsert_rows(client, NOTIFICATION_TABLE, [row], on_conflict=NOTIFICATION_CONFLICT_COLUMNS)
+    return delta
@@ -0,0 +1,38 @@
+"""
+추천 프레임 중복 제거/순위 계산
+- 공고 키(없으면 공고제목)별 최고 점수 행을 해시 기반 groupby().idxmax()로 선택 (정렬 없이 중복 제거)
+- 순위 기준 컬럼으로 한 번만 정렬하고 추천순위(1부터)를 부여
+- 로더(테이블 버전 캐시) 안에서 호출하므로 정렬 비용은 데이터 버전당 한 번만 발생
+"""
+import numpy as np
+import pandas as pd
+
+from announcement_keys import ANNOUNCEMENT_KEY_COLUMN
+from recommend_schema import RECOMMENDATION_SOURCES, TITLE_COLUMN, RANK_COLUMN
+
+def dedup_best(df: pd.DataFrame, key_column: str, score_column: str) -> pd.DataFrame:
+    """key_column별로 score_column이 가장 높은 행만 유지 (점수가 없으면 그룹의 첫 행, 원래 순서 유지)"""
+    scores = pd.to_numeric(df[score_column], errors='coerce').fillna(-np.inf)
+    best = scores.groupby(df[key_column], sort=False, dropna=False).idxmax()
+    return df.loc[np.sort(best.to_numpy())]
+
+def rank_frame(df: pd.DataFrame, score_column: str, dedup: bool = False,
+               title_column: str = TITLE_COLUMN) -> pd.DataFrame:
+    """중복 제거(선택) 후 score_column 내림차순 정렬 및 추천순위 부여"""
+    if df.empty:
+        return df
+    df = df.reset_index(drop=True)
+    dedup_column = ANNOUNCEMENT_KEY_COLUMN if ANNOUNCEMENT_KEY_COLUMN in df.columns else title_column
+    if dedup and dedup_column in df.columns and score_column in df.columns:
+        df = dedup_best(df, dedup_column, score_column)
+    if score_column in df.columns:
+        df = df.sort_values(score_column, ascending=False, kind='stable', na_position='last')
+    df = df.reset_index(drop=True)
+    df[RANK_COLUMN] = np.arange(1, len(df) + 1)
+    return df
+
+def rank_recommendations(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """탭 키 설정(RECOMMENDATION_SOURCES)에 따라 한국어 컬럼 프레임 정리"""
+    config = RECOMMENDATION_SOURCES[key]
+    score_column = config['mapping'][config['rank_column']]
+    return rank_frame(df, score_column, dedup=config['dedup'])
@@ -0,0 +1,197 @@
+"""
+추천 테이블 스키마
+- 추천 테이블별 원본 컬럼명 -> 한국어 표시 컬럼명 매핑
+- 목록 조회 컬럼 (대용량 상세 텍스트 제외)
+- 추천 탭 키별 원본 테이블/순위 기준/중복 제거 설정 (앱 로더와 회사별 추천 뷰 생성에서 공유)
+"""
+from announcement_keys import ANNOUNCEMENT_KEY_COLUMN
+from supabase_loader import list_columns
+
+# 추천 테이블 컬럼명 -> 한국어 컬럼명 매핑
+
+# recommend3
+RECOMMEND3_COLUMN_MAPPING = {
+    'company_name': '회사명',
+    'title_y': '공고제목',
+    'source': '공고출처',
+    'final_score': '총점수',
+    'final_level': '적합도',
+    'description': '매칭이유',
+    'apply_start_y': '접수시작일',
+    'apply_end_y': '접수마감일',
+    'url': '공고보기',
+    'doc_text': '공고상세정보'
+}
+
+# recommend_active3
+ACTIVE3_COLUMN_MAPPING = {
+    'company_name': '회사명',
+    'title': '공고제목',
+    'source': '공고출처',
+    'final_score': '총점수',
+    'url': '공고보기',
+    'apply_start': '접수시작일',
+    'apply_end': '접수마감일'
+}
+
+# recommend_region4
+REGION4_COLUMN_MAPPING = {
+    'company_name': '회사명',
+    'company_province': '회사지역',
+    'program_id': '프로그램ID',
+    'url': '공고보기',
+    'final_score': '총점수',
+    'final_score_10': '총점수(10점만점)',
+    'final_level': '적합도',
+    'program_provinces': '프로그램지역',
+    'region_match': '지역매칭',
+    'source': '공고출처',
+    'base_score': '기본점수',
+    'sim_raw': '유사도(원본)',
+    'sim_points': '유사도점수',
+    'priority_boost_points': '우선순위보너스',
+    'base_score_10': '기본점수(10점만점)',
+    'score_stage': '단계점수',
+    'score_industry': '업종점수',
+    'score_region': '지역점수',
+    'score_timing': '시기점수',
+    'score_bonus': '보너스점수',
+    'score_penalty': '감점',
+    'priority_type_x': '우선순위유형',
+    'title_x': '공고제목',
+    'sim': '유사도',
+    'apply_start_x': '접수시작일',
+    'apply_end_x': '접수마감일',
+    'region': '지역',
+    'years': '업력',
+    'raw_text': '원본텍스트',
+    'industry_primary': '주요업종',
+    'title_y': '프로그램제목',
+    'description': '프로그램설명',
+    'category': '카테고리',
+    'doc_text': '문서텍스트',
+    'program_region': '프로그램지역',
+    'priority_type_y': '우선순위유형2',
+    'apply_start_y': '접수시작일2',
+    'apply_end_y': '접수마감일2',
+    'base_score_recomputed': '재계산기본점수',
+    'region_prog': '프로그램지역2',
+    'title_prog': '프로그램제목2',
+    'description_prog': '프로그램설명2',
+    'category_prog': '카테고리2',
+    'doc_text_prog': '문서텍스트2'
+}
+
+# recommend_keyword4
+KEYWORD4_COLUMN_MAPPING = {
+    'company_name': '회사명',
+    'program_id': '프로그램ID',
+    'url': '공고보기',
+    'title': '공고제목',
+    'priority_type': '우선순위유형',
+    'apply_start': '접수시작일',
+    'apply_end': '접수마감일',
+    'kw_intersection': '키워드교집합',
+    'kw_tfidf': '키워드TF-IDF',
+    'kw_bm25': '키워드BM25',
+    'kw_phrase_hit': '키워드구문매칭',
+    'kw_must_have_hits': '필수키워드매칭',
+    'kw_forbid_hit': '금지키워드매칭',
+    'kw_gate': '키워드게이트',
+    'kw_reason': '키워드매칭이유',
+    'keyword_points': '키워드점수'
+}
+
+# recommend_rules4
+RULES4_COLUMN_MAPPING = {
+    'company_id': '회사ID',
+    'company_name': '회사명',
+    'company_province': '회사지역',
+    'company_years': '회사업력',
+    'company_section': '회사업종',
+    'program_id': '프로그램ID',
+    'priority_type': '우선순위유형',
+    'title': '공고제목',
+    'url': '공고보기',
+    'apply_start': '접수시작일',
+    'apply_end': '접수마감일',
+    'program_provinces': '프로그램지역',
+    'program_years_min': '최소업력',
+    'program_years_max': '최대업력',
+    'program_section': '프로그램업종',
+    'passed': '통과여부',
+    'reason': '통과이유'
+}
+
+# recommend_priority4
+PRIORITY4_COLUMN_MAPPING = {
+    'company_id': '회사ID',
+    'company_name': '회사명',
+    'program_id': '프로그램ID',
+    'source': '공고출처',
+    'final_score': '총점수',
+    'base_score': '기본점수',
+    'sim_raw': '유사도(원본)',
+    'sim_points': '유사도점수',
+    'priority_boost_points': '우선순위보너스',
+    'final_score_10': '총점수(10점만점)',
+    'base_score_10': '기본점수(10점만점)',
+    'final_level': '적합도',
+    'score_stage': '단계점수',
+    'score_industry': '업종점수',
+    'score_region': '지역점수',
+    'score_timing': '시기점수',
+    'score_bonus': '보너스점수',
+    'score_penalty': '감점',
+    'url': '공고보기',
+    'priority_type_x': '우선순위유형',
+    'title_x': '공고제목',
+    'sim': '유사도',
+    'apply_start_x': '접수시작일',
+    'apply_end_x': '접수마감일',
+    'region': '지역',
+    'years': '업력',
+    'raw_text': '원본텍스트',
+    'industry_primary': '주요업종',
+    'title_y': '프로그램제목',
+    'description': '프로그램설명',
+    'category': '카테고리',
+    'doc_text': '문서텍스트',
+    'program_region': '프로그램지역',
+    'priority_type_y': '우선순위유형2',
+    'apply_start_y': '접수시작일2',
+    'apply_end_y': '접수마감일2',
+    'base_score_recomputed': '재계산기본점수'
+}
+
+# 목록 조회 컬럼 (대용량 상세 텍스트 제외 - 상세정보는 펼칠 때 fetch_detail로 조회)
+# announcement_key는 이름을 바꾸지 않고 그대로 사용 (supabase_announcement_keys.sql로 백필)
+RECOMMEND3_DETAIL_COLUMNS = {'doc_text'}
+RECOMMEND3_LIST_COLUMNS = list_columns(RECOMMEND3_COLUMN_MAPPING, RECOMMEND3_DETAIL_COLUMNS, extra=[ANNOUNCEMENT_KEY_COLUMN])
+ACTIVE3_LIST_COLUMNS = list_columns(ACTIVE3_COLUMN_MAPPING, extra=[ANNOUNCEMENT_KEY_COLUMN])
+REGION4_LIST_COLUMNS = list_columns(REGION4_COLUMN_MAPPING, extra=[ANNOUNCEMENT_KEY_COLUMN])
+KEYWORD4_LIST_COLUMNS = list_columns(KEYWORD4_COLUMN_MAPPING, extra=[ANNOUNCEMENT_KEY_COLUMN])
+RULES4_LIST_COLUMNS = list_columns(RULES4_COLUMN_MAPPING, extra=[ANNOUNCEMENT_KEY_COLUMN])
+PRIORITY4_LIST_COLUMNS = list_columns(PRIORITY4_COLUMN_MAPPING, extra=[ANNOUNCEMENT_KEY_COLUMN])
+
+# 탭 공통 한국어 컬럼
+TITLE_COLUMN = '공고제목'
+# 탭 안에서의 순위 (1부터, 순위 기준 컬럼 내림차순)
+RANK_COLUMN = '추천순위'
+
+# 추천 탭 키 -> 원본 테이블 설정
+# rank_column: 탭 정렬 기준 원본 컬럼 (내림차순), dedup: 공고 키 기준 중복 제거 여부 (최고 점수 유지)
+RECOMMENDATION_SOURCES = {
+    'recommend3': {'table': 'recommend3', 'mapping': RECOMMEND3_COLUMN_MAPPING,
+                   'columns': RECOMMEND3_LIST_COLUMNS, 'rank_column': 'final_score', 'dedup': True},
+    'active3': {'table': 'recommend_active3', 'mapping': ACTIVE3_COLUMN_MAPPING,
+                'columns': ACTIVE3_LIST_COLUMNS, 'rank_column': 'final_score', 'dedup': True},
+    'region4': {'table': 'recommend_region4', 'mapping': REGION4_COLUMN_MAPPING,
+                'columns': REGION4_LIST_COLUMNS, 'rank_column': 'final_score', 'dedup': False},
+    'keyword4': {'table': 'recommend_keyword4', 'mapping': KEYWORD4_COLUMN_MAPPING,
+                 'columns': KEYWORD4_LIST_COLUMNS, 'rank_column': 'keyword_points', 'dedup': False},
+    'rules4': {'table': 'recommend_rules4', 'mapping': RULES4_COLUMN_MAPPING,
+               'columns': RULES4_LIST_COLUMNS, 'rank_column': 'passed', 'dedup': False},
+    'priority4': {'table': 'recommend_priority4', 'mapping': PRIORITY4_COLUMN_MAPPING,
+                  'columns': PRIORITY4_LIST_COLUMNS, 'rank_column': 'final_score', 'dedup': False},
+}
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+회사별 통합 추천 뷰 (recommend_company_view)
+- 추천 테이블 6개를 한국어 컬럼 스키마로 합친 materialized view
+- 공고 키(announcement_key) 중복 제거(recommend3/active3)와 탭별 추천순위를 미리 계산
+- 모든 탭이 같은 이름으로 쓰는 컬럼만 일반 컬럼으로 두고 나머지는 extra(jsonb)에 보관
+- (company_key, rec_source, 추천순위) 인덱스로 회사당 요청 1회 조회
+
+사용법:
+  python recommend_view.py sql       # 뷰 생성 SQL 출력 (supabase_recommend_view.sql 갱신)
+  python recommend_view.py create    # exec_sql RPC로 뷰 생성
+  python recommend_view.py refresh   # 뷰 갱신 (추천 테이블 업로드 후 또는 주기 작업으로 실행)
+"""
+import argparse
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from announcement_keys import ANNOUNCEMENT_KEY_COLUMN
+from recommend_schema import RECOMMENDATION_SOURCES, RANK_COLUMN
+from supabase_loader import fetch_frame, get_available_columns
+
+logger = logging.getLogger(__name__)
+
+VIEW_NAME = 'recommend_company_view'
+REFRESH_FUNCTION = 'refresh_recommend_company_view'
+VIEW_SQL_PATH = 'supabase_recommend_view.sql'
+SOURCE_COLUMN = 'rec_source'
+EXTRA_COLUMN = 'extra'
+# 회사 1곳 안의 유일 키 (유니크 인덱스 company_key 다음 컬럼) - 페이지 조회 정렬
+VIEW_ORDER = (SOURCE_COLUMN, RANK_COLUMN)
+# 모든 추천 탭이 같은 의미로 쓰는 한국어 컬럼 (그 외 컬럼은 extra에 보관)
+CORE_COLUMNS = [ANNOUNCEMENT_KEY_COLUMN, '회사명', '공고제목', '공고출처', '총점수', '접수시작일', '접수마감일', '공고보기']
+NUMERIC_CORE_COLUMNS = {'총점수'}
+# 뷰가 없을 때 다시 확인하기까지 대기 시간 (초)
+VIEW_RECHECK_INTERVAL = 300.0
+
+_view_checked_at: Optional[float] = None
+_view_available = False
+_view_lock = threading.Lock()
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+def _literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+def _source_select(key: str, config: Dict, available: Optional[List[str]] = None) -> str:
+    """추천 테이블 1개 -> 통합 스키마 SELECT (중복 제거/추천순위 포함)"""
+    table = config['table']
+    columns = [c for c in config['columns'] if available is None or c in available]
+    korean_to_source = {}
+    for column in columns:
+        korean_to_source.setdefault(config['mapping'].get(column, column), column)
+
+    select_parts = [f"{_literal(key)}::text AS {SOURCE_COLUMN}", "t.company_key"]
+    for korean in CORE_COLUMNS:
+        cast = 'double precision' if korean in NUMERIC_CORE_COLUMNS else 'text'
+        source = korean_to_source.get(korean)
+        value = f"t.{_quote(source)}::{cast}" if source else f"NULL::{cast}"
+        select_parts.append(f"{value} AS {_quote(korean)}")
+
+    extra_pairs = [
+        f"{_literal(korean)}, t.{_quote(source)}"
+        for korean, source in korean_to_source.items() if korean not in CORE_COLUMNS
+    ]
+    select_parts.append(f"jsonb_build_object({', '.join(extra_pairs)}) AS {EXTRA_COLUMN}")
+
+    rank_column = config['rank_column'] if config['rank_column'] in columns else None
+    rank_order = f" ORDER BY t.{_quote(rank_column)} DESC NULLS LAST" if rank_column else ""
+    select_parts.append(f"row_number() OVER (PARTITION BY t.company_key{rank_order}) AS {_quote(RANK_COLUMN)}")
+
+    # 공고 키가 있으면 공고 키, 없으면(마이그레이션 전) 공고제목으로 중복 제거
+    dedup_source = korean_to_source.get(ANNOUNCEMENT_KEY_COLUMN) or korean_to_source.get('공고제목')
+    if config['dedup'] and dedup_source:
+        score_order = f", {_quote(rank_column)} DESC NULLS LAST" if rank_column else ""
+        relation = (
+            f"(SELECT DISTINCT ON (company_key, {_quote(dedup_source)}) * FROM {_quote(table)} "
+            f"ORDER BY company_key, {_quote(dedup_source)}{score_order})"
+        )
+    else:
+        relation = _quote(table)
+    return "    SELECT " + ",\n           ".join(select_parts) + f"\n    FROM {relation} t"
+
+def build_view_sql(available_columns: Optional[Dict[str, List[str]]] = None) -> str:
+    """뷰/인덱스/갱신 함수 생성 SQL
+
+    available_columns(테이블 -> 실제 컬럼)를 주면 테이블에 없는 컬럼은 제외합니다.
+    """
+    selects = [
+        _source_select(key, config, (available_columns or {}).get(config['table']))
+        for key, config in RECOMMENDATION_SOURCES.items()
+    ]
+    union = "\n    UNION ALL\n".join(selects)
+    return f"""-- 회사별 통합 추천 뷰 (recommend_view.py로 생성, 직접 수정하지 마세요)
+-- 추천 테이블 6개를 한국어 컬럼 스키마로 합치고 중복 제거/추천순위를 미리 계산
+-- 선행 마이그레이션: supabase_company_keys.sql (company_key 컬럼), supabase_announcement_keys.sql (announcement_key 컬럼)
+
+DROP MATERIALIZED VIEW IF EXISTS {VIEW_NAME};
+
+CREATE MATERIALIZED VIEW {VIEW_NAME} AS
+SELECT u.*, NOW() AS updated_at
+FROM (
+{union}
+) u;
+
+-- 회사당 조회 인덱스 (CONCURRENTLY 갱신에 필요한 유니크 인덱스 겸용)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_{VIEW_NAME}_company
+    ON {VIEW_NAME}(company_key, {SOURCE_COLUMN}, {_quote(RANK_COLUMN)});
+
+-- 갱신 함수 (앱/refresh 작업에서 RPC로 호출)
+CREATE OR REPLACE FUNCTION {REFRESH_FUNCTION}()
+RETURNS void AS $$
+    REFRESH MATERIALIZED VIEW CONCURRENTLY {VIEW_NAME};
+$$ LANGUAGE SQL SECURITY DEFINER;
+"""
+
+def view_available(client) -> bool:
+    """뷰 존재 여부 (없으면 VIEW_RECHECK_INTERVAL마다 다시 확인)"""
+    global _view_checked_at, _view_available
+    if client is None:
+        return False
+    with _view_lock:
+        if _view_checked_at is not None and (_view_available or time.monotonic() - _view_checked_at < VIEW_RECHECK_INTERVAL):
+            return _view_available
+    try:
+        client.table(VIEW_NAME).select(SOURCE_COLUMN).limit(1).execute()
+        available = True
+    except Exception:
+        available = False
+        logger.info(f"{VIEW_NAME} 뷰가 없어 추천 테이블을 개별 조회합니다.")
+    with _view_lock:
+        _view_checked_at = time.monotonic()
+        _view_available = available
+    return available
+
+def fetch_company_view(client, company_key: str) -> pd.DataFrame:
+    """회사 1곳의 통합 추천 행 조회 (company_key 인덱스 동등 조회 1회)"""
+    return fetch_frame(client, VIEW_NAME, None, [('eq', 'company_key', company_key)], order=VIEW_ORDER)
+
+def split_view_frame(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """통합 추천 행 -> 탭 키별 DataFrame (extra 컬럼 펼침, 탭에 없는 공통 컬럼 제외)"""
+    frames = {key: pd.DataFrame() for key in RECOMMENDATION_SOURCES}
+    if df.empty or SOURCE_COLUMN not in df.columns:
+        return frames
+    for key, group in df.groupby(SOURCE_COLUMN, sort=False):
+        if key not in RECOMMENDATION_SOURCES:
+            continue
+        group = group.sort_values(RANK_COLUMN)
+        korean_columns = set(RECOMMENDATION_SOURCES[key]['mapping'].values()) | {ANNOUNCEMENT_KEY_COLUMN}
+        core = [c for c in CORE_COLUMNS if c in korean_columns and c in group.columns]
+        frame = group[core + [RANK_COLUMN]].reset_index(drop=True)
+        if EXTRA_COLUMN in group.columns:
+            extras = pd.DataFrame([value or {} for value in group[EXTRA_COLUMN]])
+            frame = pd.concat([frame, extras], axis=1)
+        frames[key] = frame
+    return frames
+
+def refresh_view(client, wait: bool = True):
+    """뷰 갱신 RPC 호출 (wait=False이면 백그라운드 스레드에서 실행)"""
+    def run():
+        try:
+            client.rpc(REFRESH_FUNCTION, {}).execute()
+            logger.info(f"{VIEW_NAME} 뷰 갱신 완료")
+        except Exception as e:
+            logger.warning(f"{VIEW_NAME} 뷰 갱신 실패: {e}")
+
+    if client is None:
+        return
+    if wait:
+        run()
+    else:
+        threading.Thread(target=run, name=f"refresh-{VIEW_NAME}", daemon=True).start()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="회사별 통합 추천 뷰 생성/갱신")
+    parser.add_argument('command', choices=['sql', 'create', 'refresh'])
+    args = parser.parse_args()
+
+    if args.command == 'sql':
+        sql = build_view_sql()
+        with open(VIEW_SQL_PATH, 'w', encoding='utf-8') as f:
+            f.write(sql)
+        print(sql)
+        return
+
+    from supabase import create_client
+    from config import SUPABASE_URL, SUPABASE_KEY
+    client = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+    if args.command == 'create':
+        # 실제 테이블에 있는 컬럼만 사용
+        available = {
+            config['table']: get_available_columns(client, config['table'])
+            for config in RECOMMENDATION_SOURCES.values()
+        }
+        client.rpc('exec_sql', {'sql': build_view_sql(available)}).execute()
+        logger.info(f"{VIEW_NAME} 뷰 생성 완료")
+    else:
+        refresh_view(client)
+
+if __name__ == "__main__":
+    main()
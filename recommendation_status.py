@@ -0,0 +1,50 @@
+"""
+추천 공고 승인/반려 상태 저장소 (recommendation_status 테이블)
+- (company_id, announcement_id) 복합 기본키로 회사별 일괄 조회 1회, 공고별 upsert
+- company_id는 company_keys와 같은 안정적인 회사 ID (alpha_companies2는 음수 ID)
+- announcement_id는 공고 키 (announcement_keys.py: 'biz:번호', 'ks:공고일련번호' 또는 공고제목 해시)
+- 테이블이 없으면(supabase_recommendation_status.sql 미적용) 조회는 빈 결과, 저장은 예외 발생
+"""
+import logging
+from typing import Dict, Optional
+
+from batch_writer import upsert_rows, STATUS_CONFLICT_COLUMNS
+from supabase_loader import fetch_frame
+
+logger = logging.getLogger(__name__)
+
+STATUS_TABLE = 'recommendation_status'
+STATUS_VALUES = ('pending', 'approved', 'rejected')
+DEFAULT_STATUS = 'pending'
+ANNOUNCEMENT_ID_COLUMN = 'announcement_id'
+
+def fetch_statuses(client, company_id: int) -> Dict[str, str]:
+    """회사의 저장된 상태 일괄 조회 ({공고 ID: 상태}, 복합 인덱스 선두 컬럼 동등 조회 1회)"""
+    if client is None:
+        return {}
+    try:
+        df = fetch_frame(client, STATUS_TABLE, [ANNOUNCEMENT_ID_COLUMN, 'status'], [('eq', 'company_id', company_id)],
+                         order=ANNOUNCEMENT_ID_COLUMN)
+    except Exception as e:
+        logger.info(f"{STATUS_TABLE} 테이블을 조회할 수 없어 세션 상태만 사용합니다: {e}")
+        return {}
+    if df.empty:
+        return {}
+    return dict(zip(df[ANNOUNCEMENT_ID_COLUMN], df['status']))
+
+def save_statuses(client, company_id: int, statuses: Dict[str, str],
+                  titles: Optional[Dict[str, str]] = None) -> int:
+    """상태 일괄 저장 ({공고 ID: 상태}, 다중 행 upsert, titles는 공고 ID -> 공고제목)"""
+    invalid = {status for status in statuses.values() if status not in STATUS_VALUES}
+    if invalid:
+        raise ValueError(f"알 수 없는 상태 값: {sorted(invalid)}")
+    rows = [
+        {
+            'company_id': company_id,
+            ANNOUNCEMENT_ID_COLUMN: key,
+            'status': status,
+            'announcement_title': (titles or {}).get(key)
+        }
+        for key, status in statuses.items()
+    ]
+    return upsert_rows(client, STATUS_TABLE, rows, on_conflict=STATUS_CONFLICT_COLUMNS)
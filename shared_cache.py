@@ -0,0 +1,199 @@
+"""
+프로세스 전역 공유 캐시 (stale-while-revalidate)
+- 모든 세션이 같은 DataFrame을 공유 (세션/TTL마다 전체 테이블을 다시 받지 않음)
+- 유효 시간이 지나면 기존 데이터를 그대로 반환하고 백그라운드 스레드에서 갱신
+- 데이터가 아직 없는 최초 1회만 동기 로드 (initial_loader가 데이터를 주면 그것도 생략)
+- 갱신 실패 시 기존 데이터를 유지하고 오류만 기록
+- invalidate()로 저장 직후 즉시 갱신 예약 (회사 추가 등)
+- version_probe를 주면 만료 시 원본 테이블 버전만 확인하고, 바뀌었을 때만 전체 로드
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 60.0
+
+class SharedFrameCache:
+    """로더 함수 1개의 결과를 프로세스 전역으로 보관"""
+
+    def __init__(self, name: str, loader: Callable[[], pd.DataFrame], max_age: float = DEFAULT_MAX_AGE,
+                 version_probe: Optional[Callable[[], object]] = None,
+                 initial_loader: Optional[Callable[[], Optional[pd.DataFrame]]] = None):
+        self.name = name
+        self.loader = loader
+        # 이 시간(초)이 지나면 다음 조회 때 백그라운드 갱신 시작 (version_probe가 있으면 버전 확인 주기)
+        self.max_age = max_age
+        self.version_probe = version_probe
+        # 네트워크 없이 바로 반환할 수 있는 초기 데이터 로더 (없으면 None 반환)
+        self.initial_loader = initial_loader
+        self._source_version = None
+        self._lock = threading.Lock()
+        self._data: Optional[pd.DataFrame] = None
+        self._loaded_at = 0.0
+        self._last_refresh: Optional[datetime] = None
+        self._stale = False
+        # invalidate() 호출 횟수 (갱신 도중 들어온 무효화 감지용)
+        self._invalidations = 0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.version = 0
+        self.last_error: Optional[Exception] = None
+        # 파생 값 (이름 -> (버전, 값))
+        self._derived: Dict[str, tuple] = {}
+
+    @property
+    def last_refresh(self) -> Optional[datetime]:
+        """마지막으로 갱신에 성공한 시각"""
+        return self._last_refresh
+
+    @property
+    def is_refreshing(self) -> bool:
+        thread = self._refresh_thread
+        return thread is not None and thread.is_alive()
+
+    def _is_expired(self) -> bool:
+        return self._stale or time.monotonic() - self._loaded_at >= self.max_age
+
+    def _load(self):
+        with self._lock:
+            invalidations = self._invalidations
+            has_data = self._data is not None and not self._stale
+        try:
+            # 원본 버전을 먼저 확인 (로드 도중 바뀐 변경은 다음 확인에서 감지)
+            source_version = self.version_probe() if self.version_probe else None
+            if has_data and self.version_probe and source_version == self._source_version:
+                with self._lock:
+                    self._loaded_at = time.monotonic()
+                return
+            data = self.loader()
+        except Exception as e:
+            self.last_error = e
+            logger.warning(f"공유 캐시 '{self.name}' 갱신 실패 (기존 데이터 유지): {e}")
+            return
+        with self._lock:
+            self._data = data
+            self._source_version = source_version
+            self._loaded_at = time.monotonic()
+            self._last_refresh = datetime.now()
+            # 갱신 도중 무효화되었으면 다음 조회 때 다시 갱신
+            self._stale = self._invalidations != invalidations
+            self.version += 1
+            self.last_error = None
+
+    def _run_refresh(self):
+        try:
+            self._load()
+        finally:
+            with self._lock:
+                self._refresh_thread = None
+
+    def refresh(self, wait: bool = False):
+        """백그라운드 갱신 시작 (이미 진행 중이면 새로 시작하지 않음)"""
+        with self._lock:
+            thread = self._refresh_thread
+            if thread is None:
+                thread = threading.Thread(target=self._run_refresh, name=f"shared-cache-{self.name}", daemon=True)
+                self._refresh_thread = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def _load_initial(self) -> bool:
+        """초기 데이터 로드 (성공하면 만료 상태로 두어 바로 백그라운드 갱신)"""
+        try:
+            data = self.initial_loader()
+        except Exception as e:
+            logger.warning(f"공유 캐시 '{self.name}' 초기 데이터 로드 실패: {e}")
+            return False
+        if data is None:
+            return False
+        with self._lock:
+            if self._data is None:
+                self._data = data
+                self._stale = True
+                self.version += 1
+        return True
+
+    def get(self) -> pd.DataFrame:
+        """캐시된 데이터 반환 (만료되었으면 기존 데이터 반환 후 백그라운드 갱신)"""
+        if self._data is None and self.initial_loader is not None and self._load_initial():
+            self.refresh()
+        elif self._data is None:
+            # 반환할 데이터가 없으므로 동기 로드
+            self.refresh(wait=True)
+            if self._data is None:
+                raise self.last_error or RuntimeError(f"공유 캐시 '{self.name}' 로드 실패")
+        elif self._is_expired():
+            self.refresh()
+        return self._data
+
+    def derived(self, name: str, build: Callable[[pd.DataFrame], object]):
+        """현재 데이터에서 만든 파생 값 (데이터 버전이 바뀔 때만 다시 계산)"""
+        self.get()
+        with self._lock:
+            data, version = self._data, self.version
+            entry = self._derived.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = build(data)
+        with self._lock:
+            self._derived[name] = (version, value)
+        return value
+
+    def invalidate(self):
+        """데이터가 바뀌었음을 표시하고 즉시 백그라운드 갱신 시작"""
+        with self._lock:
+            self._stale = True
+            self._invalidations += 1
+        self.refresh()
+
+    def clear(self):
+        """데이터 제거 (진행 중인 갱신이 끝나길 기다린 뒤 제거, 다음 조회 시 다시 로드)"""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._data = None
+            self._loaded_at = 0.0
+            self._stale = False
+            self._source_version = None
+            self._derived = {}
+
+_CACHES: Dict[str, SharedFrameCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+def register_shared_cache(name: str, loader: Callable[[], pd.DataFrame], max_age: float = DEFAULT_MAX_AGE,
+                          version_probe: Optional[Callable[[], object]] = None,
+                          initial_loader: Optional[Callable[[], Optional[pd.DataFrame]]] = None) -> SharedFrameCache:
+    """이름별 공유 캐시 반환 (Streamlit 재실행으로 다시 등록해도 기존 데이터 유지, 로더만 교체)"""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(name)
+        if cache is None:
+            cache = SharedFrameCache(name, loader, max_age, version_probe, initial_loader)
+            _CACHES[name] = cache
+        else:
+            cache.loader = loader
+            cache.max_age = max_age
+            cache.version_probe = version_probe
+            cache.initial_loader = initial_loader
+        return cache
+
+def get_shared_cache(name: str) -> Optional[SharedFrameCache]:
+    return _CACHES.get(name)
+
+def invalidate_shared_cache(name: str):
+    """등록된 공유 캐시가 있으면 갱신 예약 (없으면 무시)"""
+    cache = _CACHES.get(name)
+    if cache is not None:
+        cache.invalidate()
+
+def clear_shared_caches():
+    """모든 공유 캐시 데이터 제거 (벤치마크/테스트용)"""
+    with _CACHES_LOCK:
+        for cache in _CACHES.values():
+            cache.clear()
@@ -0,0 +1,191 @@
+-- 공고 키(announcement_key) 마이그레이션
+-- 추천/상태/알림을 공고제목 문자열 대신 안정적인 공고 키로 조회하도록 변경
+-- 규칙은 announcement_keys.py와 동일하게 유지
+--   기업마당: 'biz:' || 번호, K-스타트업: 'ks:' || 공고일련번호
+--   원본 번호를 알 수 없는 추천 행: 공고 테이블에서 정규화 제목으로 찾고, 없으면 'h:' || md5(정규화 제목) 앞 16자리
+-- recommendation_status 테이블이 이미 있으면(이전 순서로 적용한 경우) 기존 공고 ID도 공고 키로 변환
+
+-- 공고제목 정규화 (공백/특수문자 제거, 영문 소문자)
+CREATE OR REPLACE FUNCTION normalize_announcement_title(title TEXT)
+RETURNS TEXT AS $$
+    SELECT lower(regexp_replace(coalesce(title, ''), '[^가-힣A-Za-z0-9]', '', 'g'));
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- 공고제목 해시 키
+CREATE OR REPLACE FUNCTION announcement_content_key(title TEXT)
+RETURNS TEXT AS $$
+    SELECT 'h:' || left(md5(normalize_announcement_title(title)), 16);
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- 원본 공고 테이블: 번호 기반 키 (생성 컬럼)
+ALTER TABLE biz2 ADD COLUMN IF NOT EXISTS announcement_key TEXT
+    GENERATED ALWAYS AS ('biz:' || "번호"::text) STORED;
+ALTER TABLE kstartup2 ADD COLUMN IF NOT EXISTS announcement_key TEXT
+    GENERATED ALWAYS AS ('ks:' || "공고일련번호"::text) STORED;
+
+-- 정규화 제목 -> 공고 키 (추천 행의 제목을 원본 번호로 연결)
+CREATE TABLE IF NOT EXISTS announcement_titles (
+    title_norm TEXT PRIMARY KEY,
+    announcement_key TEXT NOT NULL
+);
+
+INSERT INTO announcement_titles (title_norm, announcement_key)
+SELECT normalize_announcement_title("공고명"), announcement_key
+FROM biz2
+WHERE "공고명" IS NOT NULL
+ON CONFLICT (title_norm) DO NOTHING;
+
+INSERT INTO announcement_titles (title_norm, announcement_key)
+SELECT normalize_announcement_title("사업공고명"), announcement_key
+FROM kstartup2
+WHERE "사업공고명" IS NOT NULL
+ON CONFLICT (title_norm) DO NOTHING;
+
+-- 해시 키 -> 정규화 제목 조회용 (정규화는 두 번 적용해도 같으므로 title_norm의 해시 키 = 원래 제목의 해시 키)
+CREATE INDEX IF NOT EXISTS idx_announcement_titles_content_key
+    ON announcement_titles (announcement_content_key(title_norm));
+
+-- 새 공고도 제목 매핑에 추가
+CREATE OR REPLACE FUNCTION register_announcement_title()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO announcement_titles (title_norm, announcement_key)
+    VALUES (normalize_announcement_title(to_jsonb(NEW) ->> TG_ARGV[0]), NEW.announcement_key)
+    ON CONFLICT (title_norm) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_biz2_announcement_title ON biz2;
+CREATE TRIGGER trg_biz2_announcement_title
+    AFTER INSERT ON biz2
+    FOR EACH ROW EXECUTE FUNCTION register_announcement_title('공고명');
+
+DROP TRIGGER IF EXISTS trg_kstartup2_announcement_title ON kstartup2;
+CREATE TRIGGER trg_kstartup2_announcement_title
+    AFTER INSERT ON kstartup2
+    FOR EACH ROW EXECUTE FUNCTION register_announcement_title('사업공고명');
+
+-- 제목 -> 공고 키 (원본 공고가 있으면 번호 키, 없으면 해시 키)
+CREATE OR REPLACE FUNCTION resolve_announcement_key(title TEXT)
+RETURNS TEXT AS $$
+    SELECT coalesce(
+        (SELECT announcement_key FROM announcement_titles WHERE title_norm = normalize_announcement_title(title)),
+        announcement_content_key(title)
+    );
+$$ LANGUAGE SQL STABLE;
+
+-- 이전 해시 키 -> 공고 키 (마이그레이션 전 앱은 공고 테이블 키 없이 'h:' 키를 만들었으므로,
+-- 원본 공고가 있는 제목이면 resolve_announcement_key와 같은 번호 키로 변환, 없으면 그대로)
+CREATE OR REPLACE FUNCTION upgrade_announcement_key(key TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN key LIKE 'h:%' THEN coalesce(
+            (SELECT announcement_key FROM announcement_titles
+             WHERE announcement_content_key(title_norm) = key
+             ORDER BY announcement_key LIMIT 1),
+            key
+        )
+        ELSE key
+    END;
+$$ LANGUAGE SQL STABLE;
+
+-- 추천 행 저장 시 키가 비어 있으면 제목 컬럼(TG_ARGV 순서대로 첫 값)으로 채움
+CREATE OR REPLACE FUNCTION fill_announcement_key()
+RETURNS TRIGGER AS $$
+DECLARE
+    row_json JSONB := to_jsonb(NEW);
+    title TEXT;
+    i INTEGER;
+BEGIN
+    IF NEW.announcement_key IS NULL THEN
+        FOR i IN 0 .. TG_NARGS - 1 LOOP
+            title := coalesce(title, row_json ->> TG_ARGV[i]);
+        END LOOP;
+        IF title IS NOT NULL THEN
+            NEW.announcement_key := resolve_announcement_key(title);
+        END IF;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 추천 테이블: 키 컬럼, 백필, 트리거, (company_key, announcement_key) 인덱스
+DO $$
+DECLARE
+    t TEXT;
+    title_columns TEXT[];
+    spec RECORD;
+BEGIN
+    FOR spec IN
+        SELECT * FROM (VALUES
+            ('recommend3', ARRAY['title_y', 'announcement_title']),
+            ('recommend_active3', ARRAY['title']),
+            ('recommend_region4', ARRAY['title_x']),
+            ('recommend_keyword4', ARRAY['title']),
+            ('recommend_rules4', ARRAY['title']),
+            ('recommend_priority4', ARRAY['title_x'])
+        ) AS s(table_name, columns)
+    LOOP
+        t := spec.table_name;
+        IF to_regclass(t) IS NULL THEN
+            CONTINUE;
+        END IF;
+        -- 테이블에 실제로 있는 제목 컬럼만 사용
+        SELECT array_agg(c ORDER BY array_position(spec.columns, c)) INTO title_columns
+        FROM unnest(spec.columns) AS c
+        WHERE EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = t AND column_name = c
+        );
+        IF title_columns IS NULL THEN
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS announcement_key TEXT', t);
+        EXECUTE format(
+            'UPDATE %I SET announcement_key = resolve_announcement_key(coalesce(%s)) WHERE announcement_key IS NULL',
+            t, (SELECT string_agg(format('%I', c), ', ') FROM unnest(title_columns) AS c)
+        );
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', 'trg_' || t || '_announcement_key', t);
+        EXECUTE format(
+            'CREATE TRIGGER %I BEFORE INSERT OR UPDATE ON %I FOR EACH ROW EXECUTE FUNCTION fill_announcement_key(%s)',
+            'trg_' || t || '_announcement_key', t,
+            (SELECT string_agg(quote_literal(c), ', ') FROM unnest(title_columns) AS c)
+        );
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = t AND column_name = 'company_key'
+        ) THEN
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON %I(company_key, announcement_key)',
+                'idx_' || t || '_company_announcement_key', t
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+-- 승인/반려 상태: 이전 공고 ID(md5 출처|제목)와 앱이 만든 'h:' 키를 추천 테이블과 같은 공고 키로 변환
+DO $$
+BEGIN
+    IF to_regclass('recommendation_status') IS NOT NULL THEN
+        INSERT INTO recommendation_status (company_id, announcement_id, status, announcement_title, updated_at)
+        SELECT company_id, resolve_announcement_key(announcement_title), status, announcement_title, updated_at
+        FROM recommendation_status
+        WHERE announcement_id NOT LIKE '%:%' AND announcement_title IS NOT NULL
+        ORDER BY updated_at DESC
+        ON CONFLICT (company_id, announcement_id) DO NOTHING;
+
+        DELETE FROM recommendation_status WHERE announcement_id NOT LIKE '%:%';
+
+        -- 'h:' 키는 제목이 없어도 해시로 원본 공고를 찾음 (이미 번호 키 상태가 있으면 그 상태 유지)
+        INSERT INTO recommendation_status (company_id, announcement_id, status, announcement_title, updated_at)
+        SELECT company_id, upgrade_announcement_key(announcement_id), status, announcement_title, updated_at
+        FROM recommendation_status
+        WHERE announcement_id LIKE 'h:%' AND upgrade_announcement_key(announcement_id) <> announcement_id
+        ON CONFLICT (company_id, announcement_id) DO NOTHING;
+
+        DELETE FROM recommendation_status
+        WHERE announcement_id LIKE 'h:%' AND upgrade_announcement_key(announcement_id) <> announcement_id;
+    END IF;
+END $$;
@@ -0,0 +1,40 @@
+-- 일괄 쓰기(batch_writer.py) upsert용 유니크 인덱스
+-- on_conflict 키는 batch_writer의 *_CONFLICT_COLUMNS와 동일하게 유지
+
+-- 알림 상태: 회사당 1행 (save_notifications / initialize_notification_state upsert)
+DELETE FROM notification_states a
+USING notification_states b
+WHERE a.company_id = b.company_id AND a.id < b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_notification_states_company_id
+ON notification_states(company_id);
+
+-- 추천 저장: 회사/공고당 1행 (save_recommendations_to_supabase upsert)
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['recommend2', 'recommend3']
+    LOOP
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = t AND column_name = 'announcement_title'
+        ) AND EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = t AND column_name = 'company_id'
+        ) THEN
+            -- 같은 회사/공고의 중복 행은 마지막에 저장된 행만 남김 (유니크 인덱스 생성 전)
+            EXECUTE format(
+                'DELETE FROM %I a USING %I b
+                 WHERE a.company_id = b.company_id
+                   AND a.announcement_title = b.announcement_title
+                   AND a.ctid < b.ctid',
+                t, t
+            );
+            EXECUTE format(
+                'CREATE UNIQUE INDEX IF NOT EXISTS %I ON %I(company_id, announcement_title)',
+                'uq_' || t || '_company_announcement', t
+            );
+        END IF;
+    END LOOP;
+END $$;
@@ -0,0 +1,69 @@
+-- 회사 키(company_key) 매핑 마이그레이션
+-- 모든 recommend 테이블을 정규화된 기업명 키로 조회하도록 변경
+-- (ilike '%기업명%' 전체 스캔 -> company_key 인덱스 동등 조회)
+-- 정규화 규칙은 company_keys.normalize_company_name()과 동일하게 유지
+
+-- 기업명 정규화 함수 (법인 표기/공백/특수문자 제거, 영문 소문자)
+CREATE OR REPLACE FUNCTION normalize_company_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT lower(
+        regexp_replace(
+            regexp_replace(coalesce(name, ''), '\(주\)|㈜|주식회사|\(유\)|유한회사', '', 'g'),
+            '[^가-힣A-Za-z0-9]', '', 'g'
+        )
+    );
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- 회사 키 매핑 테이블 (정규화 기업명 <-> 안정적인 회사 ID)
+-- alpha_companies2 회사는 음수 ID(-No.), companies 회사는 양수 ID 사용 (앱과 동일)
+CREATE TABLE IF NOT EXISTS company_keys (
+    company_key TEXT PRIMARY KEY,
+    company_id INTEGER NOT NULL,
+    company_name TEXT,
+    source_table VARCHAR(50),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_company_keys_company_id ON company_keys(company_id);
+
+INSERT INTO company_keys (company_key, company_id, company_name, source_table)
+SELECT normalize_company_name("기업명"), -"No.", "기업명", 'alpha_companies2'
+FROM alpha_companies2
+WHERE "기업명" IS NOT NULL
+ON CONFLICT (company_key) DO NOTHING;
+
+INSERT INTO company_keys (company_key, company_id, company_name, source_table)
+SELECT normalize_company_name(name), id, name, 'companies'
+FROM companies
+WHERE name IS NOT NULL
+ON CONFLICT (company_key) DO NOTHING;
+
+-- recommend 테이블 company_key 자동 채움 트리거
+CREATE OR REPLACE FUNCTION set_company_key()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.company_key := normalize_company_name(NEW.company_name);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- recommend 테이블별 company_key 컬럼 추가, 백필, 인덱스, 트리거
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'recommend3', 'recommend_active3', 'recommend_region4',
+        'recommend_keyword4', 'recommend_rules4', 'recommend_priority4'
+    ]
+    LOOP
+        EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS company_key TEXT', t);
+        EXECUTE format('UPDATE %I SET company_key = normalize_company_name(company_name) WHERE company_key IS NULL', t);
+        EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I(company_key)', 'idx_' || t || '_company_key', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', 'trg_' || t || '_company_key', t);
+        EXECUTE format(
+            'CREATE TRIGGER %I BEFORE INSERT OR UPDATE OF company_name ON %I FOR EACH ROW EXECUTE FUNCTION set_company_key()',
+            'trg_' || t || '_company_key', t
+        );
+    END LOOP;
+END $$;
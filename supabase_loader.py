@@ -0,0 +1,161 @@
+"""
+Supabase 공용 로더
+- 탭에서 실제로 쓰는 컬럼만 요청 (select('*') 대신 컬럼 projection)
+- range 요청으로 페이지 단위 조회 (PostgREST 최대 행 수 제한 회피)
+- 상세 텍스트(doc_text, raw_text, 공고내용 등)는 행을 펼칠 때 별도 조회
+- 페이지 조회는 항상 정렬 (기본 기본키 id, id가 없는 테이블은 호출부에서 유일 키 지정)
+"""
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+# PostgREST 기본 max-rows와 동일한 페이지 크기
+DEFAULT_PAGE_SIZE = 1000
+# 페이지 조회 기본 정렬 (기본키) - ORDER BY 없는 offset 조회는 페이지 사이에 행이 누락/중복될 수 있음
+DEFAULT_ORDER = 'id'
+
+Order = Union[str, Sequence[str]]
+
+_SIMPLE_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# 테이블별 실제 존재 컬럼 (projection 실패 시 한 번만 조회하여 기억)
+_available_columns: Dict[str, List[str]] = {}
+_available_lock = threading.Lock()
+
+# 회사 테이블
+ALPHA_COMPANY_COLUMNS = [
+    'No.', '기업명', '사업아이템 한 줄 소개', '기업형태', '소재지', '주업종 (사업자등록증 상)',
+    '특화분야', '설립연월일', '#매출', '#고용', '#기술특허(등록)', '#기업인증', '주요 산업'
+]
+COMPANY_COLUMNS = [
+    'id', 'name', 'business_type', 'region', 'years', 'stage', 'industry',
+    'keywords', 'preferred_uses', 'preferred_budget'
+]
+
+# 공고 목록 표시용 컬럼
+BIZ_LIST_COLUMNS = ['번호', '공고명', '사업수행기관', '신청시작일자', '신청종료일자', '공고상세URL']
+KSTARTUP_LIST_COLUMNS = [
+    '공고일련번호', '사업공고명', '주관기관', '지원지역', '공고접수시작일시',
+    '공고접수종료일시', '상세페이지 url', '사업업력'
+]
+
+# 추천 매칭용 컬럼
+BIZ_MATCH_COLUMNS = [
+    '번호', '공고명', '지원분야', '소관부처', '사업수행기관',
+    '신청시작일자', '신청종료일자', '공고상세URL'
+]
+KSTARTUP_MATCH_COLUMNS = [
+    '공고일련번호', '사업공고명', '공고내용', '지원사업분류',
+    '공고접수시작일시', '공고접수종료일시', '상세페이지 url'
+]
+
+# 공고 원본 조회 컬럼 (목록 표시 + 추천 매칭, 공유 캐시/스냅샷에서 테이블당 한 번만 조회)
+BIZ_SOURCE_COLUMNS = list(dict.fromkeys(BIZ_LIST_COLUMNS + BIZ_MATCH_COLUMNS))
+KSTARTUP_SOURCE_COLUMNS = list(dict.fromkeys(KSTARTUP_LIST_COLUMNS + KSTARTUP_MATCH_COLUMNS))
+
+# 목록에는 표시하지 않고 행을 펼칠 때만 조회하는 대용량 텍스트 컬럼
+DETAIL_TEXT_COLUMNS = {
+    'doc_text', 'raw_text', 'description', 'doc_text_prog', 'description_prog', '공고내용'
+}
+
+def quote_column(column: str) -> str:
+    """한글/공백/특수문자 컬럼명은 큰따옴표로 감싸기"""
+    if column == '*' or _SIMPLE_IDENTIFIER.match(column):
+        return column
+    return f'"{column}"'
+
+def select_clause(columns: Optional[List[str]]) -> str:
+    """select() 인자 문자열 생성"""
+    if not columns:
+        return '*'
+    return ','.join(quote_column(column) for column in columns)
+
+def list_columns(column_mapping: Dict[str, str], detail_columns=DETAIL_TEXT_COLUMNS,
+                 extra: Optional[List[str]] = None) -> List[str]:
+    """컬럼 매핑에서 대용량 상세 텍스트를 제외한 목록용 컬럼 추출"""
+    columns = [column for column in column_mapping if column not in detail_columns]
+    for column in extra or []:
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+def _apply_filters(query, filters: Optional[List[tuple]]):
+    """(메서드, 컬럼, 값) 필터 적용 - 예: ('eq', 'company_id', 1), ('ilike', 'company_name', '%명%')"""
+    for method, column, value in filters or []:
+        query = getattr(query, method)(column, value)
+    return query
+
+def get_available_columns(client, table: str) -> Optional[List[str]]:
+    """테이블의 실제 컬럼 목록 (1행 조회, 결과는 프로세스 내에서 재사용)"""
+    with _available_lock:
+        if table in _available_columns:
+            return _available_columns[table]
+    try:
+        result = client.table(table).select('*').limit(1).execute()
+    except Exception:
+        return None
+    if not result.data:
+        return None
+    columns = list(result.data[0].keys())
+    with _available_lock:
+        _available_columns[table] = columns
+    return columns
+
+def _order_columns(order: Order) -> List[str]:
+    """정렬 인자 -> 컬럼 목록 (문자열 1개 또는 컬럼 목록)"""
+    columns = [order] if isinstance(order, str) else list(order)
+    if not columns:
+        raise ValueError("페이지 조회에는 정렬 컬럼이 필요합니다.")
+    return columns
+
+def _fetch_pages(client, table: str, clause: str, filters, page_size: int, order: Order) -> List[Dict]:
+    order_columns = _order_columns(order)
+    rows = []
+    start = 0
+    while True:
+        query = client.table(table).select(clause)
+        query = _apply_filters(query, filters)
+        for column in order_columns:
+            query = query.order(quote_column(column))
+        result = query.range(start, start + page_size - 1).execute()
+        page = result.data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            break
+        start += page_size
+    return rows
+
+def fetch_all(client, table: str, columns: Optional[List[str]] = None, filters: Optional[List[tuple]] = None,
+              page_size: int = DEFAULT_PAGE_SIZE, order: Order = DEFAULT_ORDER) -> List[Dict]:
+    """필요한 컬럼만 페이지 단위로 끝까지 조회
+
+    order(유일 키 컬럼 또는 컬럼 목록) 순으로 정렬해 페이지를 나눕니다.
+    id 컬럼이 없는 테이블은 호출부에서 유일 키를 지정해야 합니다.
+    요청한 컬럼 중 테이블에 없는 컬럼이 있어 실패하면, 실제 컬럼 목록과의
+    교집합으로 한 번 더 시도합니다.
+    """
+    try:
+        return _fetch_pages(client, table, select_clause(columns), filters, page_size, order)
+    except Exception:
+        if not columns:
+            raise
+        available = get_available_columns(client, table)
+        if available is None:
+            raise
+        projected = [column for column in columns if column in available]
+        if not projected:
+            return []
+        return _fetch_pages(client, table, select_clause(projected), filters, page_size, order)
+
+def fetch_frame(client, table: str, columns: Optional[List[str]] = None, filters: Optional[List[tuple]] = None,
+                page_size: int = DEFAULT_PAGE_SIZE, order: Order = DEFAULT_ORDER) -> pd.DataFrame:
+    """fetch_all 결과를 DataFrame으로 반환"""
+    return pd.DataFrame(fetch_all(client, table, columns, filters, page_size, order))
+
+def fetch_detail(client, table: str, columns: List[str], filters: List[tuple]) -> Dict:
+    """행을 펼칠 때 상세 텍스트 컬럼만 단건 조회"""
+    query = _apply_filters(client.table(table).select(select_clause(columns)), filters)
+    result = query.limit(1).execute()
+    return result.data[0] if result.data else {}
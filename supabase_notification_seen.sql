@@ -0,0 +1,78 @@
+-- 알림 확인 상태를 정수 ID 정렬 배열로 저장 (notification_seen.py)
+-- 공고 키 -> 정수 ID 규칙은 announcement_keys.announcement_int_id와 동일하게 유지
+--   'biz:N' -> N*4+1, 'ks:N' -> N*4+2, 'h:해시' -> 해시 앞 15자리*4+3, 그 외 -> md5(키) 앞 15자리*4
+-- 저장은 새로 확인한 ID만 add_seen_announcements()로 보내고 서버에서 합집합 (전체 배열 재작성 없음)
+-- 선행 마이그레이션: supabase_batch_writes.sql (company_id 유니크),
+--                   supabase_announcement_keys.sql (resolve_announcement_key, upgrade_announcement_key, announcement_titles)
+
+-- 공고 키 -> 정수 ID
+CREATE OR REPLACE FUNCTION announcement_int_id(key TEXT)
+RETURNS BIGINT AS $$
+    SELECT CASE
+        WHEN key LIKE 'h:%' THEN
+            (('x' || substr(key, 3, 15))::bit(60)::bigint << 2) | 3
+        WHEN key ~ '^biz:[0-9]{1,19}$' AND substr(key, 5)::numeric < 1152921504606846976 THEN
+            (substr(key, 5)::bigint << 2) | 1
+        WHEN key ~ '^ks:[0-9]{1,19}$' AND substr(key, 4)::numeric < 1152921504606846976 THEN
+            (substr(key, 4)::bigint << 2) | 2
+        ELSE
+            ('x' || left(md5(key), 15))::bit(60)::bigint << 2
+    END;
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- 정렬/중복 제거된 배열
+CREATE OR REPLACE FUNCTION sorted_bigint_union(a BIGINT[], b BIGINT[])
+RETURNS BIGINT[] AS $$
+    SELECT coalesce(array_agg(DISTINCT v ORDER BY v), '{}')
+    FROM unnest(coalesce(a, '{}') || coalesce(b, '{}')) AS v;
+$$ LANGUAGE SQL IMMUTABLE;
+
+ALTER TABLE notification_states
+    ADD COLUMN IF NOT EXISTS seen_announcement_ids BIGINT[] NOT NULL DEFAULT '{}';
+
+-- 기존 공고제목/공고 키 배열 변환 후 비움 (공고제목에도 ':'가 있으므로 키 접두어로 판별)
+-- 'h:' 키와 공고제목은 원본 공고가 있으면 추천 테이블과 같은 번호 키로 변환
+UPDATE notification_states
+SET seen_announcement_ids = sorted_bigint_union(
+        seen_announcement_ids,
+        (SELECT array_agg(announcement_int_id(
+                    CASE WHEN v ~ '^(biz|ks|h):' THEN upgrade_announcement_key(v) ELSE resolve_announcement_key(v) END))
+         FROM unnest(last_seen_announcement_ids) AS v)
+    ),
+    last_seen_announcement_ids = '{}'
+WHERE cardinality(last_seen_announcement_ids) > 0;
+
+-- 이미 정수로 저장된 해시 ID(하위 2비트 3)도 원본 공고가 있으면 번호 키 ID로 변환
+DROP TABLE IF EXISTS seen_id_upgrades;
+CREATE TEMP TABLE seen_id_upgrades AS
+SELECT DISTINCT ON (old_id) old_id, new_id
+FROM (
+    SELECT announcement_int_id(announcement_content_key(title_norm)) AS old_id,
+           announcement_int_id(announcement_key) AS new_id
+    FROM announcement_titles
+) m
+ORDER BY old_id, new_id;
+CREATE UNIQUE INDEX ON seen_id_upgrades (old_id);
+
+UPDATE notification_states n
+SET seen_announcement_ids = (
+        SELECT sorted_bigint_union('{}', array_agg(coalesce(u.new_id, v)))
+        FROM unnest(n.seen_announcement_ids) AS v
+        LEFT JOIN seen_id_upgrades u ON u.old_id = v
+    )
+WHERE EXISTS (
+    SELECT 1 FROM unnest(n.seen_announcement_ids) AS v
+    JOIN seen_id_upgrades u ON u.old_id = v
+);
+
+DROP TABLE IF EXISTS seen_id_upgrades;
+
+-- 새로 확인한 ID 추가 (행이 없으면 생성)
+CREATE OR REPLACE FUNCTION add_seen_announcements(p_company_id INTEGER, p_ids BIGINT[])
+RETURNS VOID AS $$
+    INSERT INTO notification_states (company_id, seen_announcement_ids, last_updated)
+    VALUES (p_company_id, sorted_bigint_union('{}', p_ids), NOW())
+    ON CONFLICT (company_id) DO UPDATE
+    SET seen_announcement_ids = sorted_bigint_union(notification_states.seen_announcement_ids, EXCLUDED.seen_announcement_ids),
+        last_updated = NOW();
+$$ LANGUAGE SQL;
@@ -0,0 +1,103 @@
+-- 회사별 통합 추천 뷰 (recommend_view.py로 생성, 직접 수정하지 마세요)
+-- 추천 테이블 6개를 한국어 컬럼 스키마로 합치고 중복 제거/추천순위를 미리 계산
+-- 선행 마이그레이션: supabase_company_keys.sql (company_key 컬럼), supabase_announcement_keys.sql (announcement_key 컬럼)
+
+DROP MATERIALIZED VIEW IF EXISTS recommend_company_view;
+
+CREATE MATERIALIZED VIEW recommend_company_view AS
+SELECT u.*, NOW() AS updated_at
+FROM (
+    SELECT 'recommend3'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title_y"::text AS "공고제목",
+           t."source"::text AS "공고출처",
+           t."final_score"::double precision AS "총점수",
+           t."apply_start_y"::text AS "접수시작일",
+           t."apply_end_y"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object('적합도', t."final_level", '매칭이유', t."description") AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."final_score" DESC NULLS LAST) AS "추천순위"
+    FROM (SELECT DISTINCT ON (company_key, "announcement_key") * FROM "recommend3" ORDER BY company_key, "announcement_key", "final_score" DESC NULLS LAST) t
+    UNION ALL
+    SELECT 'active3'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title"::text AS "공고제목",
+           t."source"::text AS "공고출처",
+           t."final_score"::double precision AS "총점수",
+           t."apply_start"::text AS "접수시작일",
+           t."apply_end"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object() AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."final_score" DESC NULLS LAST) AS "추천순위"
+    FROM (SELECT DISTINCT ON (company_key, "announcement_key") * FROM "recommend_active3" ORDER BY company_key, "announcement_key", "final_score" DESC NULLS LAST) t
+    UNION ALL
+    SELECT 'region4'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title_x"::text AS "공고제목",
+           t."source"::text AS "공고출처",
+           t."final_score"::double precision AS "총점수",
+           t."apply_start_x"::text AS "접수시작일",
+           t."apply_end_x"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object('회사지역', t."company_province", '프로그램ID', t."program_id", '총점수(10점만점)', t."final_score_10", '적합도', t."final_level", '프로그램지역', t."program_provinces", '지역매칭', t."region_match", '기본점수', t."base_score", '유사도(원본)', t."sim_raw", '유사도점수', t."sim_points", '우선순위보너스', t."priority_boost_points", '기본점수(10점만점)', t."base_score_10", '단계점수', t."score_stage", '업종점수', t."score_industry", '지역점수', t."score_region", '시기점수', t."score_timing", '보너스점수', t."score_bonus", '감점', t."score_penalty", '우선순위유형', t."priority_type_x", '유사도', t."sim", '지역', t."region", '업력', t."years", '주요업종', t."industry_primary", '프로그램제목', t."title_y", '카테고리', t."category", '우선순위유형2', t."priority_type_y", '접수시작일2', t."apply_start_y", '접수마감일2', t."apply_end_y", '재계산기본점수', t."base_score_recomputed", '프로그램지역2', t."region_prog", '프로그램제목2', t."title_prog", '카테고리2', t."category_prog") AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."final_score" DESC NULLS LAST) AS "추천순위"
+    FROM "recommend_region4" t
+    UNION ALL
+    SELECT 'keyword4'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title"::text AS "공고제목",
+           NULL::text AS "공고출처",
+           NULL::double precision AS "총점수",
+           t."apply_start"::text AS "접수시작일",
+           t."apply_end"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object('프로그램ID', t."program_id", '우선순위유형', t."priority_type", '키워드교집합', t."kw_intersection", '키워드TF-IDF', t."kw_tfidf", '키워드BM25', t."kw_bm25", '키워드구문매칭', t."kw_phrase_hit", '필수키워드매칭', t."kw_must_have_hits", '금지키워드매칭', t."kw_forbid_hit", '키워드게이트', t."kw_gate", '키워드매칭이유', t."kw_reason", '키워드점수', t."keyword_points") AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."keyword_points" DESC NULLS LAST) AS "추천순위"
+    FROM "recommend_keyword4" t
+    UNION ALL
+    SELECT 'rules4'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title"::text AS "공고제목",
+           NULL::text AS "공고출처",
+           NULL::double precision AS "총점수",
+           t."apply_start"::text AS "접수시작일",
+           t."apply_end"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object('회사ID', t."company_id", '회사지역', t."company_province", '회사업력', t."company_years", '회사업종', t."company_section", '프로그램ID', t."program_id", '우선순위유형', t."priority_type", '프로그램지역', t."program_provinces", '최소업력', t."program_years_min", '최대업력', t."program_years_max", '프로그램업종', t."program_section", '통과여부', t."passed", '통과이유', t."reason") AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."passed" DESC NULLS LAST) AS "추천순위"
+    FROM "recommend_rules4" t
+    UNION ALL
+    SELECT 'priority4'::text AS rec_source,
+           t.company_key,
+           t."announcement_key"::text AS "announcement_key",
+           t."company_name"::text AS "회사명",
+           t."title_x"::text AS "공고제목",
+           t."source"::text AS "공고출처",
+           t."final_score"::double precision AS "총점수",
+           t."apply_start_x"::text AS "접수시작일",
+           t."apply_end_x"::text AS "접수마감일",
+           t."url"::text AS "공고보기",
+           jsonb_build_object('회사ID', t."company_id", '프로그램ID', t."program_id", '기본점수', t."base_score", '유사도(원본)', t."sim_raw", '유사도점수', t."sim_points", '우선순위보너스', t."priority_boost_points", '총점수(10점만점)', t."final_score_10", '기본점수(10점만점)', t."base_score_10", '적합도', t."final_level", '단계점수', t."score_stage", '업종점수', t."score_industry", '지역점수', t."score_region", '시기점수', t."score_timing", '보너스점수', t."score_bonus", '감점', t."score_penalty", '우선순위유형', t."priority_type_x", '유사도', t."sim", '지역', t."region", '업력', t."years", '주요업종', t."industry_primary", '프로그램제목', t."title_y", '카테고리', t."category", '프로그램지역', t."program_region", '우선순위유형2', t."priority_type_y", '접수시작일2', t."apply_start_y", '접수마감일2', t."apply_end_y", '재계산기본점수', t."base_score_recomputed") AS extra,
+           row_number() OVER (PARTITION BY t.company_key ORDER BY t."final_score" DESC NULLS LAST) AS "추천순위"
+    FROM "recommend_priority4" t
+) u;
+
+-- 회사당 조회 인덱스 (CONCURRENTLY 갱신에 필요한 유니크 인덱스 겸용)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_recommend_company_view_company
+    ON recommend_company_view(company_key, rec_source, "추천순위");
+
+-- 갱신 함수 (앱/refresh 작업에서 RPC로 호출)
+CREATE OR REPLACE FUNCTION refresh_recommend_company_view()
+RETURNS void AS $$
+    REFRESH MATERIALIZED VIEW CONCURRENTLY recommend_company_view;
+$$ LANGUAGE SQL SECURITY DEFINER;
@@ -0,0 +1,43 @@
+-- 추천 공고 승인/반려 상태 테이블 (recommendation_status.py)
+-- 회사 ID + 공고 ID 복합 기본키: 회사별 일괄 조회와 공고별 upsert 모두 인덱스 사용
+-- announcement_id는 공고 키 (announcement_keys.py와 같은 'biz:번호', 'ks:공고일련번호', 'h:제목 해시')
+-- 선행 마이그레이션: supabase_company_keys.sql (company_keys), supabase_table_watermarks.sql (touch_updated_at),
+--                   supabase_announcement_keys.sql (recommend3.announcement_key, resolve_announcement_key)
+
+CREATE TABLE IF NOT EXISTS recommendation_status (
+    company_id INTEGER NOT NULL,
+    announcement_id TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'approved', 'rejected')),
+    announcement_title TEXT,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (company_id, announcement_id)
+);
+
+-- 변경 감지용 updated_at 인덱스/트리거 (table_watermarks.py)
+CREATE INDEX IF NOT EXISTS idx_recommendation_status_updated_at ON recommendation_status(updated_at DESC);
+
+DROP TRIGGER IF EXISTS trg_recommendation_status_updated_at ON recommendation_status;
+CREATE TRIGGER trg_recommendation_status_updated_at
+    BEFORE INSERT OR UPDATE ON recommendation_status
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+-- 기존 recommend3.status 값 이전 (status 컬럼이 있는 경우만, 앱과 같은 공고 키로 저장)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'recommend3' AND column_name = 'status'
+    ) THEN
+        INSERT INTO recommendation_status (company_id, announcement_id, status, announcement_title)
+        SELECT DISTINCT ON (k.company_id, a.announcement_id)
+               k.company_id, a.announcement_id, r.status, r.title_y
+        FROM recommend3 r
+        JOIN company_keys k ON k.company_key = r.company_key
+        CROSS JOIN LATERAL (
+            SELECT coalesce(r.announcement_key, resolve_announcement_key(r.title_y)) AS announcement_id
+        ) a
+        WHERE r.status IN ('approved', 'rejected') AND r.title_y IS NOT NULL
+        ON CONFLICT (company_id, announcement_id) DO NOTHING;
+    END IF;
+END $$;
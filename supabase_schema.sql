@@ -61,7 +61,7 @@ CREATE TABLE recommendations (
 -- 알림 상태 테이블
 CREATE TABLE notification_states (
     id SERIAL PRIMARY KEY,
-    company_id INTEGER REFERENCES companies(id) ON DELETE CASCADE,
+    company_id INTEGER UNIQUE REFERENCES companies(id) ON DELETE CASCADE,
     last_seen_announcement_ids TEXT[],
     last_updated TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -0,0 +1,37 @@
+-- 테이블 변경 감지용 updated_at 워터마크 마이그레이션
+-- 앱(table_watermarks.py)은 고정 TTL 대신 테이블별 (행 수, max(updated_at))이 바뀔 때만 캐시를 다시 채움
+-- 이 마이그레이션 전에는 행 수만 비교하므로 행 수가 같은 수정(UPDATE)은 감지하지 못함
+
+-- updated_at 자동 갱신 트리거 함수
+CREATE OR REPLACE FUNCTION touch_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 테이블별 updated_at 컬럼, 내림차순 인덱스(max 조회용), 트리거 추가
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'alpha_companies2', 'companies', 'biz2', 'kstartup2', 'notification_states',
+        'recommend3', 'recommend_active3', 'recommend_region4',
+        'recommend_keyword4', 'recommend_rules4', 'recommend_priority4'
+    ]
+    LOOP
+        IF to_regclass(t) IS NULL THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()', t);
+        EXECUTE format('UPDATE %I SET updated_at = NOW() WHERE updated_at IS NULL', t);
+        EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I(updated_at DESC)', 'idx_' || t || '_updated_at', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', 'trg_' || t || '_updated_at', t);
+        EXECUTE format(
+            'CREATE TRIGGER %I BEFORE INSERT OR UPDATE ON %I FOR EACH ROW EXECUTE FUNCTION touch_updated_at()',
+            'trg_' || t || '_updated_at', t
+        );
+    END LOOP;
+END $$;
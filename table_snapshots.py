@@ -0,0 +1,176 @@
+"""
+Supabase 테이블 로컬 스냅샷 (Parquet + manifest)
+- 원본 테이블을 압축 Parquet 파일로 저장하고 manifest.json에 원본 테이블/행 수/워터마크 기록
+- 시작 시 스냅샷을 메모리 매핑으로 읽어 네트워크 없이 바로 화면 표시 (offline=True)
+- 이후에는 워터마크(max(updated_at)) 이후 변경된 행만 조회해 스냅샷에 병합
+- 행 수가 맞지 않으면(삭제 등) 전체 재조회
+- pyarrow가 없거나 SNAPSHOT_DIR이 빈 값이면 스냅샷을 사용하지 않음 (None 반환)
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from supabase_loader import fetch_frame
+from table_watermarks import WATERMARK_COLUMN, probe_table
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR_ENV = 'SNAPSHOT_DIR'
+DEFAULT_SNAPSHOT_DIR = '.snapshots'
+MANIFEST_FILE = 'manifest.json'
+SNAPSHOT_COMPRESSION = 'zstd'
+
+_lock = threading.Lock()
+_pyarrow_checked = False
+_pyarrow_available = False
+
+def snapshot_dir() -> Optional[str]:
+    """스냅샷 디렉터리 (빈 값이면 스냅샷 비활성화)"""
+    directory = os.getenv(SNAPSHOT_DIR_ENV, DEFAULT_SNAPSHOT_DIR)
+    return directory or None
+
+def _has_pyarrow() -> bool:
+    global _pyarrow_checked, _pyarrow_available
+    if not _pyarrow_checked:
+        try:
+            import pyarrow  # noqa: F401
+            _pyarrow_available = True
+        except ImportError:
+            logger.info("pyarrow가 설치되어 있지 않아 테이블 스냅샷을 사용하지 않습니다.")
+            _pyarrow_available = False
+        _pyarrow_checked = True
+    return _pyarrow_available
+
+def snapshots_enabled() -> bool:
+    return snapshot_dir() is not None and _has_pyarrow()
+
+def _manifest_path(directory: str) -> str:
+    return os.path.join(directory, MANIFEST_FILE)
+
+def load_manifest(directory: Optional[str] = None) -> Dict[str, Dict]:
+    """manifest.json 로드 (테이블 -> 스냅샷 정보)"""
+    directory = directory or snapshot_dir()
+    path = _manifest_path(directory) if directory else None
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"스냅샷 manifest를 읽을 수 없어 무시합니다: {e}")
+        return {}
+
+def read_snapshot(table: str) -> Optional[pd.DataFrame]:
+    """저장된 스냅샷 읽기 (메모리 매핑, 없으면 None)"""
+    if not snapshots_enabled():
+        return None
+    directory = snapshot_dir()
+    entry = load_manifest(directory).get(table)
+    if not entry:
+        return None
+    path = os.path.join(directory, entry['file'])
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path, engine='pyarrow', memory_map=True)
+    except Exception as e:
+        logger.warning(f"'{table}' 스냅샷을 읽을 수 없어 무시합니다: {e}")
+        return None
+
+def write_snapshot(table: str, df: pd.DataFrame, columns: Optional[List[str]], remote_version: tuple):
+    """스냅샷 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 기존 스냅샷 유지)"""
+    if not snapshots_enabled():
+        return
+    directory = snapshot_dir()
+    os.makedirs(directory, exist_ok=True)
+    file_name = f"{table}.parquet"
+    path = os.path.join(directory, file_name)
+    row_count, watermark = remote_version
+    with _lock:
+        try:
+            df.to_parquet(f"{path}.tmp", engine='pyarrow', compression=SNAPSHOT_COMPRESSION, index=False)
+        except Exception:
+            # 혼합 타입 object 컬럼은 문자열로 저장 (Parquet 스키마 오류 방지, 리스트 컬럼은 유지)
+            safe = df.copy()
+            for column in safe.columns[safe.dtypes == object]:
+                safe[column] = safe[column].map(lambda v: v if v is None or isinstance(v, (list, str)) else str(v))
+            safe.to_parquet(f"{path}.tmp", engine='pyarrow', compression=SNAPSHOT_COMPRESSION, index=False)
+        os.replace(f"{path}.tmp", path)
+        manifest = load_manifest(directory)
+        manifest[table] = {
+            'source_table': table,
+            'file': file_name,
+            'columns': list(columns) if columns else None,
+            'row_count': len(df),
+            'remote_row_count': row_count,
+            'watermark': watermark,
+            'saved_at': datetime.now().isoformat()
+        }
+        manifest_path = _manifest_path(directory)
+        with open(f"{manifest_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+def _save_snapshot(table: str, df: pd.DataFrame, columns: Optional[List[str]], remote_version: tuple):
+    """스냅샷 저장 실패는 조회 결과에 영향을 주지 않도록 기록만 함"""
+    try:
+        write_snapshot(table, df, columns, remote_version)
+    except Exception as e:
+        logger.warning(f"'{table}' 스냅샷 저장 실패: {e}")
+
+def _merge_changes(snapshot: pd.DataFrame, changes: pd.DataFrame, key_column: str,
+                   order: Optional[str]) -> pd.DataFrame:
+    """변경분을 키 기준으로 덮어써 병합"""
+    if changes.empty:
+        return snapshot
+    merged = pd.concat([snapshot, changes], ignore_index=True)
+    merged = merged.drop_duplicates(subset=[key_column], keep='last')
+    if order and order in merged.columns:
+        merged = merged.sort_values(order, kind='stable')
+    return merged.reset_index(drop=True)
+
+def snapshot_frame(client, table: str, columns: Optional[List[str]], key_column: str,
+                   order: Optional[str] = None, offline: bool = False) -> Optional[pd.DataFrame]:
+    """스냅샷 기반 테이블 조회
+
+    order가 없으면 key_column 순으로 정렬해 페이지를 조회합니다.
+    offline=True이면 네트워크 없이 스냅샷만 반환하고, 스냅샷이 없으면 None을 반환합니다.
+    그 외에는 원격 버전을 확인해 바뀐 행만 조회/병합한 뒤 스냅샷을 갱신합니다.
+    스냅샷을 사용할 수 없으면 None을 반환하므로 호출 측에서 전체 조회로 대체하세요.
+    """
+    if not snapshots_enabled():
+        return None
+    entry = load_manifest().get(table)
+    if entry and entry.get('columns') != (list(columns) if columns else None):
+        # 조회 컬럼이 바뀐 스냅샷은 사용하지 않음
+        entry = None
+    snapshot = read_snapshot(table) if entry else None
+    if offline:
+        return snapshot
+    if client is None:
+        return None
+    order = order or key_column
+
+    # 조회 전에 버전을 확인 (조회 도중 바뀐 행은 다음 동기화에서 다시 가져옴)
+    remote_version = tuple(probe_table(client, table))
+    remote_count, remote_watermark = remote_version
+    if snapshot is not None:
+        if remote_count == entry.get('remote_row_count') and remote_watermark == entry.get('watermark'):
+            return snapshot
+        if remote_watermark is not None and entry.get('watermark') is not None:
+            changes = fetch_frame(client, table, columns, [('gt', WATERMARK_COLUMN, entry['watermark'])], order=order)
+            merged = _merge_changes(snapshot, changes, key_column, order)
+            if remote_count is None or len(merged) == remote_count:
+                logger.info(f"'{table}' 스냅샷에 변경분 {len(changes)}행 병합")
+                _save_snapshot(table, merged, columns, remote_version)
+                return merged
+            logger.info(f"'{table}' 행 수가 맞지 않아 전체 재조회합니다 (스냅샷 {len(merged)}, 원격 {remote_count}).")
+
+    df = fetch_frame(client, table, columns, order=order)
+    _save_snapshot(table, df, columns, remote_version)
+    return df
@@ -0,0 +1,127 @@
+"""
+테이블 변경 감지 (워터마크) 기반 캐시 무효화
+- 고정 TTL 대신 테이블별 버전(행 수 + max(updated_at))이 바뀔 때만 캐시를 다시 채움
+- 버전 확인은 1행짜리 가벼운 조회 1회이며, 테이블마다 PROBE_INTERVAL초에 한 번만 수행
+- updated_at 컬럼이 없는 테이블(supabase_table_watermarks.sql 미적용)은 행 수만 비교
+- 이 프로세스에서 쓴 변경은 notify_table_changed()로 즉시 반영 (Realtime 리스너도 같은 함수 호출)
+"""
+import functools
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_COLUMN = 'updated_at'
+# 같은 테이블 버전 재확인 최소 간격 (초)
+PROBE_INTERVAL = 5.0
+# 워터마크 캐시 함수별 최대 보관 항목 수 (회사 수 x 버전)
+DEFAULT_MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+# 테이블 -> (확인 시각, 원격 버전)
+_probes: Dict[str, Tuple[float, tuple]] = {}
+# 테이블 -> 이 프로세스에서 알린 변경 횟수
+_local_changes: Dict[str, int] = {}
+# updated_at 컬럼이 없는 것으로 확인된 테이블
+_no_watermark_column = set()
+# 없는 컬럼을 조회했을 때의 PostgreSQL 오류 코드
+UNDEFINED_COLUMN_CODE = '42703'
+
+def is_undefined_column_error(error: Exception) -> bool:
+    """조회한 컬럼이 테이블에 없어 실패했는지 (시간 초과/5xx 등 다른 오류는 False)"""
+    message = str(error)
+    return (getattr(error, 'code', None) == UNDEFINED_COLUMN_CODE
+            or UNDEFINED_COLUMN_CODE in message
+            or ('column' in message and 'does not exist' in message))
+
+def probe_table(client, table: str) -> tuple:
+    """원격 테이블 버전 조회 (행 수, 최신 updated_at)
+
+    updated_at 컬럼이 없다는 오류일 때만 행 수 비교로 전환하고, 그 외 오류는 그대로 던져
+    table_version이 마지막 버전을 유지하도록 합니다.
+    """
+    if client is None:
+        return (None, None)
+    if table not in _no_watermark_column:
+        try:
+            response = (
+                client.table(table).select(WATERMARK_COLUMN, count='exact')
+                .order(WATERMARK_COLUMN, desc=True).limit(1).execute()
+            )
+            latest = response.data[0].get(WATERMARK_COLUMN) if response.data else None
+            return (response.count, latest)
+        except Exception as e:
+            if not is_undefined_column_error(e):
+                raise
+            _no_watermark_column.add(table)
+            logger.info(f"'{table}' 테이블에 {WATERMARK_COLUMN} 컬럼이 없어 행 수로만 변경을 감지합니다.")
+    response = client.table(table).select('*', count='exact').limit(1).execute()
+    return (response.count, None)
+
+def table_version(client, table: str) -> tuple:
+    """테이블 버전 (PROBE_INTERVAL 안에서는 마지막 확인 결과 재사용)"""
+    now = time.monotonic()
+    with _lock:
+        cached = _probes.get(table)
+    if cached is None or now - cached[0] >= PROBE_INTERVAL:
+        try:
+            remote = probe_table(client, table)
+        except Exception as e:
+            # 확인 실패 시 마지막 버전 유지 (캐시된 데이터 계속 사용)
+            logger.warning(f"'{table}' 테이블 버전 확인 실패: {e}")
+            remote = cached[1] if cached else (None, None)
+        with _lock:
+            _probes[table] = (now, remote)
+        cached = (now, remote)
+    with _lock:
+        local = _local_changes.get(table, 0)
+    return (local,) + tuple(cached[1])
+
+def notify_table_changed(table: str):
+    """테이블이 바뀌었음을 알림 - 다음 조회에서 캐시를 다시 채우고 원격 버전도 즉시 재확인"""
+    with _lock:
+        _local_changes[table] = _local_changes.get(table, 0) + 1
+        _probes.pop(table, None)
+
+def tables_version(client, tables) -> tuple:
+    return tuple(table_version(client, table) for table in tables)
+
+def cached_by_table_version(*tables: str, client: Callable[[], object],
+                            max_entries: int = DEFAULT_MAX_ENTRIES,
+                            extra_key: Optional[Callable[[], object]] = None):
+    """st.cache_data 캐시를 TTL 대신 테이블 버전으로 무효화하는 데코레이터
+
+    client는 Supabase 클라이언트를 반환하는 함수입니다 (앱 재실행 시 교체된 클라이언트 사용).
+    extra_key는 테이블 밖의 값(예: 지원가능여부 기준일)에 따라 결과가 달라질 때 캐시 키에 더할 값을 반환합니다.
+    """
+    def decorator(func):
+        def versioned(table_versions, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        # 캐시 키가 함수별로 구분되도록 이름만 복사 (__wrapped__는 두지 않아 인자 해싱은 versioned 기준)
+        versioned.__module__ = func.__module__
+        versioned.__name__ = func.__name__
+        versioned.__qualname__ = func.__qualname__
+        cached = st.cache_data(max_entries=max_entries)(versioned)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            version = tables_version(client(), tables)
+            if extra_key is not None:
+                version = (version, extra_key())
+            return cached(version, *args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+def clear_table_versions():
+    """확인한 테이블 버전 초기화 (벤치마크/테스트용)"""
+    with _lock:
+        _probes.clear()
+        _local_changes.clear()
+        _no_watermark_column.clear()
@@ -0,0 +1,5 @@
+"""단위 테스트 공용 설정 (저장소 루트 모듈을 import할 수 있도록 경로 추가)"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,68 @@
+"""공고 키/정수 ID 변환 (announcement_keys)"""
+import pandas as pd
+
+from announcement_keys import (
+    INT_ID_MAX_NATIVE, add_announcement_keys, announcement_int_id, announcement_key, content_key,
+    frame_announcement_int_ids, is_announcement_key, native_keys
+)
+
+def test_native_int_ids_round_trip():
+    for prefix, tag in (('biz', 1), ('ks', 2)):
+        for number in (0, 1, 123, 987654321, INT_ID_MAX_NATIVE - 1):
+            int_id = announcement_int_id(f"{prefix}:{number}")
+            assert int_id & 3 == tag
+            assert int_id >> 2 == number
+
+def test_content_key_int_id_uses_hash_prefix():
+    key = content_key('2025년 창업 지원사업')
+    int_id = announcement_int_id(key)
+    assert int_id & 3 == 3
+    assert int_id >> 2 == int(key[2:17], 16)
+
+def test_int_ids_do_not_collide_across_sources():
+    keys = ['biz:7', 'ks:7', content_key('biz:7'), 'other:7']
+    assert len({announcement_int_id(key) for key in keys}) == len(keys)
+
+def test_unrepresentable_native_ids_fall_back_to_hash_tag():
+    assert announcement_int_id(f"biz:{INT_ID_MAX_NATIVE}") & 3 == 0
+    assert announcement_int_id('biz:12a') & 3 == 0
+    # 전각 숫자는 isdigit()이 참이지만 번호로 보지 않음 (SQL 정규식 [0-9]와 동일)
+    assert announcement_int_id('biz:１２') & 3 == 0
+
+def test_int_ids_fit_in_bigint():
+    for key in ('biz:%d' % (INT_ID_MAX_NATIVE - 1), content_key('x'), 'zzz'):
+        assert 0 <= announcement_int_id(key) < 2 ** 63
+
+def test_frame_int_ids_match_scalar():
+    keys = pd.Series(['biz:1', 'ks:2', 'biz:1', content_key('공고')])
+    assert frame_announcement_int_ids(keys).tolist() == [announcement_int_id(key) for key in keys]
+
+def test_is_announcement_key_rejects_titles_with_colon():
+    assert is_announcement_key('biz:123')
+    assert is_announcement_key('h:0123456789abcdef')
+    assert not is_announcement_key('2025년 공고: 창업 지원')
+    assert not is_announcement_key(None)
+
+def test_content_key_ignores_spacing_punctuation_and_case():
+    assert content_key('AI 창업 (2025)') == content_key('ai창업2025')
+    assert content_key('AI 창업') != content_key('AI 창업2')
+
+def test_announcement_key_prefers_native_id():
+    assert announcement_key('기업마당', 123.0, '제목') == 'biz:123'
+    assert announcement_key('kstartup2', '45', '제목') == 'ks:45'
+    assert announcement_key('기업마당', None, '제목') == content_key('제목')
+    assert announcement_key('알 수 없음', 1, '제목') == content_key('제목')
+
+def test_native_keys_strip_float_suffix_and_keep_missing():
+    keys = native_keys('biz', pd.Series([1.0, None, 30]))
+    assert keys.tolist() == ['biz:1', None, 'biz:30']
+
+def test_add_announcement_keys_fills_only_missing():
+    df = pd.DataFrame({
+        'announcement_key': ['biz:1', None, None],
+        '공고제목': ['a', 'b', 'c'],
+        '출처': ['biz2', 'kstartup2', None],
+        '번호': [1, 2, None],
+    })
+    keys = add_announcement_keys(df, source_column='출처', id_column='번호')['announcement_key']
+    assert keys.tolist() == ['biz:1', 'ks:2', content_key('c')]
@@ -0,0 +1,55 @@
+"""날짜 파싱/지원가능여부/로드맵 구간 (date_normalization)"""
+import pandas as pd
+
+from date_normalization import (
+    END_DATE_COLUMN, MONTH_COLUMN, START_DATE_COLUMN, STATUS_COLUMN, add_date_columns, extract_months,
+    get_reference_date, parse_dates, reference_date_key, roadmap_buckets, roadmap_window
+)
+
+def test_parse_dates_known_formats():
+    values = pd.Series(['2025-03-05', '2025.3.5', '2025/03/05', '2025년 3월 5일', '03-05-2025',
+                        '3월 5일 2025년', '20250305', '2025-03-05 18:00'])
+    assert (parse_dates(values) == pd.Timestamp('2025-03-05')).all()
+
+def test_parse_dates_invalid_and_missing_are_nat():
+    parsed = parse_dates(pd.Series(['상시', None, '2025-02-30', '']))
+    assert parsed.isna().all()
+
+def test_parse_dates_normalizes_datetime_input():
+    parsed = parse_dates(pd.Series(pd.to_datetime(['2025-01-02 13:45'], utc=True)))
+    assert parsed.iloc[0] == pd.Timestamp('2025-01-02')
+
+def test_extract_months_accepts_month_only_values():
+    assert extract_months(pd.Series(['2025-07-01', '3월', '11', '13월', None])).tolist() == [7, 3, 11, pd.NA, pd.NA]
+
+def test_reference_date_from_argument_and_env(monkeypatch):
+    assert get_reference_date('2025-01-31 10:00') == pd.Timestamp('2025-01-31')
+    monkeypatch.setenv('REFERENCE_DATE', '2024-12-01')
+    assert get_reference_date() == pd.Timestamp('2024-12-01')
+    assert reference_date_key() == '2024-12-01'
+    monkeypatch.setenv('REFERENCE_DATE', 'today')
+    assert get_reference_date() == pd.Timestamp.today().normalize()
+
+def test_add_date_columns_status():
+    df = pd.DataFrame({
+        START_DATE_COLUMN: ['2025-09-01', '2025-10-01', '2025-08-01', None, '2025-09-16'],
+        END_DATE_COLUMN: ['2025-09-30', '2025-10-31', '2025-09-15', '2025-09-30', '2025-09-16'],
+    })
+    result = add_date_columns(df, '2025-09-16')
+    assert result[STATUS_COLUMN].tolist() == ['지원가능', '접수예정', '접수마감', '정보부족', '지원가능']
+    assert result[MONTH_COLUMN].tolist()[:3] == [9, 10, 8]
+    assert 'D-day' not in result.columns
+
+def test_add_date_columns_without_date_columns_is_noop():
+    df = pd.DataFrame({'공고제목': ['a']})
+    assert add_date_columns(df).columns.tolist() == ['공고제목']
+
+def test_roadmap_window_crosses_year_boundary():
+    window = roadmap_window('2025-11-20', months=3)
+    assert [str(period) for period in window] == ['2025-11', '2025-12', '2026-01']
+
+def test_roadmap_buckets_place_month_only_values_in_next_occurrence():
+    df = pd.DataFrame({START_DATE_COLUMN: ['2025-11-03', '2026-01-10', '1월', '2025-10-01', '2027-01-01']})
+    window, buckets = roadmap_buckets(df, '2025-11-01', months=3)
+    assert len(window) == 3
+    assert {offset: positions.tolist() for offset, positions in buckets.items()} == {0: [0], 2: [1, 2]}
@@ -0,0 +1,41 @@
+"""이름 -> ID 매칭 색인 (entity_resolver)"""
+import pandas as pd
+
+from entity_resolver import EntityResolver
+
+NAMES = ['(주)대박드림스', '스마트팜코리아', '바이오헬스케어', 'Data Lab', '대박드림스']
+
+def _resolver(**kwargs):
+    return EntityResolver(NAMES, [1, 2, 3, 4, 5], **kwargs)
+
+def test_exact_match_prefers_first_entity():
+    assert _resolver().resolve('대박드림스') == 5
+    assert EntityResolver(['가나', '가나'], [1, 2]).resolve('가나') == 1
+
+def test_normalized_match_ignores_corporate_marker_spacing_and_case():
+    resolver = _resolver()
+    assert resolver.resolve('주식회사 스마트팜 코리아') == 2
+    assert resolver.resolve('data-lab') == 4
+
+def test_partial_match_is_case_insensitive():
+    assert _resolver().resolve('헬스케') == 3
+    assert _resolver().resolve('DATA') == 4
+
+def test_fuzzy_match_respects_threshold():
+    # 한글 키워드가 없는 이름이라 퍼지 단계에서만 매칭됨
+    assert _resolver().resolve('Data Lap') == 4
+    assert _resolver(fuzzy_threshold=101).resolve('Data Lap') is None
+
+def test_keyword_fallback_and_misses():
+    resolver = _resolver()
+    assert resolver.resolve('팜코 농업법인') == 2
+    assert resolver.resolve('전혀없는이름') is None
+    assert resolver.resolve(None) is None
+    assert EntityResolver([], []).resolve('대박') is None
+
+def test_resolve_many_and_from_frame():
+    df = pd.DataFrame({'id': [10, 20], 'name': ['가나다', '라마바']})
+    resolver = EntityResolver.from_frame(df, 'name')
+    assert len(resolver) == 2
+    assert resolver.resolve_many(['가나다', '라마바', '가나다', '없음']) == [10, 20, 10, None]
+    assert len(EntityResolver.from_frame(pd.DataFrame(), 'name')) == 0
@@ -0,0 +1,63 @@
+"""추천 매칭 판정 (matching_engine) - 대소문자 구분 정확한 부분 문자열, 연속 공백만 정리"""
+import pandas as pd
+
+from matching_engine import (
+    INDUSTRY_POINTS, KEYWORD_POINTS, REGION_POINTS, _contains, _first_keyword_hit,
+    score_biz_announcements, score_kstartup_announcements
+)
+from text_normalization import whitespace_series
+
+def _text(*values):
+    return pd.Series(list(values))
+
+def test_contains_is_case_sensitive():
+    text = _text('AI 바우처', 'ai 교육', 'said hello')
+    assert _contains(text, 'AI').tolist() == [True, False, False]
+
+def test_contains_collapses_whitespace_on_both_sides():
+    # 채점 함수는 공고 텍스트를 _text_column(whitespace_series)으로 정리한 뒤 비교
+    text = whitespace_series(_text('AI  바우처', 'AI\n바우처', 'AI바우처'))
+    assert _contains(text, ' AI 바우처 ').tolist() == [True, True, False]
+
+def test_contains_treats_needle_literally():
+    assert _contains(_text('R&D (연구)', 'RD'), 'R&D (').tolist() == [True, False]
+
+def test_empty_needle_matches_nothing():
+    assert not _contains(_text('아무 공고'), '  ').any()
+    assert not _contains(_text('아무 공고'), None).any()
+
+def test_first_keyword_hit_keeps_first_match():
+    hits = _first_keyword_hit(_text('데이터 바이오', '바이오', '기타'), ['데이터', '바이오'])
+    assert hits.tolist() == ['데이터', '바이오', '']
+
+BIZ = pd.DataFrame({
+    '번호': [1, 2, 3],
+    '공고명': ['AI 데이터 바우처', 'said 공고', '바이오 지원'],
+    '지원분야': ['IT', 'security', '바이오'],
+    '소관부처': ['서울', '부산', '서울특별시'],
+    '사업수행기관': ['기관', '기관', '기관'],
+})
+
+def test_biz_scores_use_exact_case_sensitive_rules():
+    company = {'name': '테스트', 'industry': 'IT', 'keywords': ['AI'], 'region': '서울'}
+    results = {row['announcement_key']: row for row in score_biz_announcements(BIZ, company, 1)}
+    assert set(results) == {'biz:1', 'biz:3'}
+    assert results['biz:1']['total_score'] == INDUSTRY_POINTS + KEYWORD_POINTS + REGION_POINTS
+    assert results['biz:1']['matching_reason'] == '업종 매칭: IT; 키워드 매칭: AI; 지역 매칭: 서울'
+    assert results['biz:3']['total_score'] == REGION_POINTS
+
+def test_lowercase_company_values_match_only_lowercase_substrings():
+    # 'it'/'ai'는 'IT'/'AI'와 매칭되지 않고, 단어 경계 없이 부분 문자열('security', 'said')로만 매칭
+    company = {'name': '테스트', 'industry': 'it', 'keywords': ['ai'], 'region': ''}
+    results = score_biz_announcements(BIZ, company, 1)
+    assert [row['announcement_key'] for row in results] == ['biz:2']
+    assert results[0]['total_score'] == INDUSTRY_POINTS + KEYWORD_POINTS
+
+def test_kstartup_keys_and_empty_frame():
+    kstartup = pd.DataFrame({
+        '공고일련번호': [10], '사업공고명': ['AI 창업'], '공고내용': ['AI 기술 창업 지원'], '지원사업분류': ['IT'],
+    })
+    company = {'name': '테스트', 'industry': 'IT', 'keywords': ['AI']}
+    results = score_kstartup_announcements(kstartup, company, 1, business_item='')
+    assert [row['announcement_key'] for row in results] == ['ks:10']
+    assert score_kstartup_announcements(pd.DataFrame(), company, 1) == []
@@ -0,0 +1,65 @@
+"""알림 확인 상태 정수 ID 배열 (notification_seen)"""
+import numpy as np
+
+from announcement_keys import announcement_int_id, content_key
+from fake_supabase import FakeSupabase
+from notification_seen import NOTIFICATION_TABLE, add_seen, contains, legacy_seen_ids, load_seen, seen_array
+
+def test_seen_array_sorted_unique_int64():
+    seen = seen_array([9, 1, 5, 1])
+    assert seen.dtype == np.int64
+    assert seen.tolist() == [1, 5, 9]
+    assert seen_array().tolist() == []
+
+def test_contains_uses_sorted_membership():
+    seen = seen_array([4, 8, 15])
+    assert contains(seen, np.array([8, 3, 15, 16, 0])).tolist() == [True, False, True, False, False]
+    assert contains(seen_array(), np.array([1, 2])).tolist() == [False, False]
+    assert contains(seen, np.array([], dtype=np.int64)).tolist() == []
+
+def test_merge_is_union():
+    merged = np.union1d(seen_array([1, 3]), seen_array([3, 2]))
+    assert merged.tolist() == [1, 2, 3]
+    assert contains(merged, seen_array([2])).all()
+
+def test_legacy_values_keys_and_titles():
+    title = '2025년 공고: 창업 지원'
+    ids = legacy_seen_ids(['biz:12', title, '', None, 'biz:12'])
+    assert ids.tolist() == sorted({announcement_int_id('biz:12'), announcement_int_id(content_key(title))})
+
+class _RpcSupabase(FakeSupabase):
+    """add_seen_announcements RPC 호출만 기록하는 클라이언트"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rpc_calls = []
+
+    def rpc(self, name, params):
+        self.rpc_calls.append((name, params))
+        return self.table(NOTIFICATION_TABLE).select('company_id').limit(0)
+
+def _state_row(seen=(), legacy=()):
+    return {'company_id': 1, 'seen_announcement_ids': list(seen), 'last_seen_announcement_ids': list(legacy),
+            'last_updated': None}
+
+def test_load_seen_merges_legacy_column():
+    client = FakeSupabase({NOTIFICATION_TABLE: [_state_row([announcement_int_id('ks:3')], ['biz:1'])]})
+    seen = load_seen(client, 1)
+    assert seen.tolist() == sorted([announcement_int_id('ks:3'), announcement_int_id('biz:1')])
+
+def test_load_seen_without_row_or_client():
+    assert load_seen(FakeSupabase({NOTIFICATION_TABLE: []}), 1).tolist() == []
+    assert load_seen(None, 1).tolist() == []
+
+def test_add_seen_sends_only_delta():
+    client = _RpcSupabase({NOTIFICATION_TABLE: [_state_row([1, 2])]})
+    delta = add_seen(client, 1, [5, 2, 5])
+    assert delta.tolist() == [2, 5]
+    assert client.rpc_calls == [('add_seen_announcements', {'p_company_id': 1, 'p_ids': [2, 5]})]
+    assert add_seen(client, 1, []).tolist() == []
+    assert len(client.rpc_calls) == 1
+
+def test_add_seen_without_rpc_merges_stored_array():
+    client = FakeSupabase({NOTIFICATION_TABLE: [_state_row([1, 9], ['biz:1'])]})
+    add_seen(client, 1, [4])
+    assert load_seen(client, 1).tolist() == sorted([1, 4, 9, announcement_int_id('biz:1')])
@@ -0,0 +1,39 @@
+"""추천 중복 제거/순위 (recommend_ranking)"""
+import numpy as np
+import pandas as pd
+
+from recommend_ranking import dedup_best, rank_frame, rank_recommendations
+from recommend_schema import RANK_COLUMN
+
+def test_dedup_best_keeps_highest_score_in_original_order():
+    df = pd.DataFrame({'key': ['a', 'b', 'a', 'c', 'b'], 'score': [1, 5, 3, None, 5]})
+    result = dedup_best(df, 'key', 'score')
+    assert result.index.tolist() == [1, 2, 3]
+
+def test_rank_frame_sorts_stably_and_numbers_from_one():
+    df = pd.DataFrame({'공고제목': ['a', 'b', 'c', 'd'], '총점수': [10, 30, 10, np.nan]})
+    result = rank_frame(df, '총점수')
+    assert result['공고제목'].tolist() == ['b', 'a', 'c', 'd']
+    assert result[RANK_COLUMN].tolist() == [1, 2, 3, 4]
+
+def test_rank_frame_dedups_by_announcement_key_before_title():
+    df = pd.DataFrame({
+        'announcement_key': ['biz:1', 'biz:1', 'ks:1'],
+        '공고제목': ['같은 공고', '같은 공고 (수정)', '같은 공고'],
+        '총점수': [50, 80, 70],
+    })
+    result = rank_frame(df, '총점수', dedup=True)
+    assert result['announcement_key'].tolist() == ['biz:1', 'ks:1']
+    assert result['총점수'].tolist() == [80, 70]
+
+def test_rank_frame_dedups_by_title_without_keys():
+    df = pd.DataFrame({'공고제목': ['a', 'a', 'b'], '총점수': [1, 2, 3]})
+    assert rank_frame(df, '총점수', dedup=True)['총점수'].tolist() == [3, 2]
+
+def test_rank_frame_empty():
+    assert rank_frame(pd.DataFrame(), '총점수').empty
+
+def test_rank_recommendations_uses_tab_config():
+    df = pd.DataFrame({'공고제목': ['a', 'a'], '총점수': [1, 2]})
+    assert len(rank_recommendations(df.copy(), 'recommend3')) == 1
+    assert len(rank_recommendations(df.copy(), 'region4')) == 2
@@ -0,0 +1,59 @@
+"""텍스트 정규화/토큰화 (text_normalization)"""
+import pandas as pd
+
+from text_normalization import (
+    extract_company_names, fold_text, hangul_keywords, map_unique, ngrams, normalize_company_name,
+    normalize_query, normalize_whitespace, text_ngrams, to_initials, to_jamo, whitespace_series
+)
+
+def test_fold_text_keeps_only_words_lowercased():
+    assert fold_text(' AI-창업 (2025)! ') == 'ai창업2025'
+    assert fold_text(None) == ''
+    assert fold_text(float('nan')) == ''
+
+def test_normalize_company_name_drops_corporate_markers():
+    for name in ('(주)대박드림스', '㈜ 대박드림스', '주식회사 대박드림스', '대박드림스 유한회사', '대박 드림스'):
+        assert normalize_company_name(name) == '대박드림스'
+
+def test_normalize_whitespace_keeps_case_and_punctuation():
+    assert normalize_whitespace('  AI \t 바우처\n(2차) ') == 'AI 바우처 (2차)'
+    assert normalize_whitespace(None) == ''
+
+def test_whitespace_series_matches_scalar():
+    values = pd.Series(['a  b', None, 'a  b', ' C '])
+    assert whitespace_series(values).tolist() == ['a b', '', 'a b', 'C']
+
+def test_map_unique_calls_once_per_value():
+    calls = []
+    result = map_unique(pd.Series(['x', 'y', 'x']), lambda value: calls.append(value) or value.upper())
+    assert result.tolist() == ['X', 'Y', 'X']
+    assert calls == ['x', 'y']
+
+def test_ngrams_and_text_ngrams_are_case_sensitive_word_runs():
+    assert ngrams('abc') == {'ab', 'bc'}
+    assert ngrams('a') == set()
+    # 구간 경계를 넘는 n-gram은 만들지 않음
+    assert text_ngrams('AI 창업') == {'AI', '창업'}
+    assert 'ai' not in text_ngrams('AI 창업')
+
+def test_text_ngrams_of_substring_are_subset():
+    text = '2025년 AI 바우처  지원사업'
+    for needle in ('AI 바우처', '바우처 지원', '년 AI'):
+        assert normalize_whitespace(needle) in normalize_whitespace(text)
+        assert text_ngrams(needle) <= text_ngrams(text)
+
+def test_hangul_keywords_skip_stopwords():
+    assert hangul_keywords('데이터 지원사업 공고 바이오') == ['데이터', '바이오']
+    assert hangul_keywords(None) == []
+
+def test_jamo_and_initials():
+    assert to_jamo('닭') == 'ㄷㅏㄹㄱ'
+    assert to_jamo('과A') == 'ㄱㅗㅏA'
+    assert to_initials('삼성전자') == 'ㅅㅅㅈㅈ'
+
+def test_normalize_query_keeps_partial_jamo():
+    assert normalize_query('(주)삼성 ㅈ') == '삼성ㅈ'
+
+def test_extract_company_names():
+    labels = pd.Series(['대박드림스 - 스마트 팜', '단독기업'])
+    assert extract_company_names(labels).tolist() == ['대박드림스', '단독기업']
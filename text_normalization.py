@@ -0,0 +1,153 @@
+"""
+한글 텍스트 정규화/토큰화 (매칭, 회사 검색, 동기화, 기업명 추출 공용)
+- fold_text: 공백/문장부호 제거, 영문 소문자 (한글/영문/숫자만 유지) - 기업명/공고제목 키 전용
+- normalize_company_name: 법인 표기((주)/㈜/주식회사/(유)/유한회사) 제거 후 fold_text
+- normalize_whitespace: 연속 공백만 한 칸으로 (공고 매칭은 대소문자/문장부호를 그대로 둔 정확한 부분 문자열 비교)
+- text_ngrams: normalize_whitespace한 텍스트의 한글/영문/숫자 구간별 n-gram (공고 역색인/후보 조회)
+- hangul_keywords: 한글 연속 구간 키워드 (불용어 제외)
+- to_jamo/to_initials: 한글 음절 낱자/초성 분해 (입력 중 검색어 비교)
+- extract_company_names: "기업명 - 사업 아이템" 형식에서 기업명 추출
+- Series 함수는 고유값 단위로 계산하고 문자열별 결과를 메모하므로 같은 문자열은 한 번만 처리
+- 법인 표기/문자 규칙은 SQL normalize_company_name(), normalize_announcement_title()과 동일하게 유지
+"""
+import re
+from functools import lru_cache
+from typing import Callable, List, Set
+
+import pandas as pd
+
+# 법인 표기 (SQL normalize_company_name과 동일한 패턴)
+CORP_SUFFIX_PATTERN = r'\(주\)|㈜|주식회사|\(유\)|유한회사'
+# 한글/영문/숫자 이외 문자 제거
+NON_WORD_PATTERN = r'[^가-힣A-Za-z0-9]'
+# 검색어용: 입력 중인 한글 낱자(ㄱ-ㅎ, ㅏ-ㅣ)도 유지
+QUERY_NON_WORD_PATTERN = r'[^가-힣ㄱ-ㅎㅏ-ㅣA-Za-z0-9]'
+# 매칭용 n-gram 추출 단위 (한글/영문/숫자 연속 구간)
+WORD_RUN_PATTERN = r'[가-힣A-Za-z0-9]+'
+# 기업명 - 사업 아이템 형식
+COMPANY_LABEL_PATTERN = r'^([^-]+) - '
+# 매칭 대상별 한글 키워드 패턴 (auto_sync_system 기존 패턴)
+COMPANY_KEYWORD_PATTERN = r'[가-힣]{2,4}'
+ANNOUNCEMENT_KEYWORD_PATTERN = r'[가-힣]{2,6}'
+
+NGRAM_SIZE = 2
+# 문자열별 메모 크기 (공고/회사 텍스트 전체가 들어갈 정도)
+MEMO_SIZE = 200_000
+
+# 키워드 매칭에서 제외할 흔한 단어 (공고명/기업명 어디에나 나와 구분에 도움이 안 됨)
+STOPWORDS = frozenset([
+    '주식회사', '유한회사', '지원', '사업', '지원사업', '공고', '모집', '모집공고', '공모', '안내',
+    '신청', '접수', '선정', '참여', '기업', '년도', '관련', '대상', '및', '등',
+])
+
+_corp_suffix = re.compile(CORP_SUFFIX_PATTERN)
+_non_word = re.compile(NON_WORD_PATTERN)
+_query_non_word = re.compile(QUERY_NON_WORD_PATTERN)
+_word_run = re.compile(WORD_RUN_PATTERN)
+_whitespace = re.compile(r'\s+')
+
+# 한글 음절 분해 (음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+# 겹받침/겹모음은 입력 중인 글자와 비교할 수 있도록 낱자로 펼침 ('닭' -> ㄷㅏㄹㄱ)
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and pd.isna(value))
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _fold(text: str) -> str:
+    return _non_word.sub('', text).lower()
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _company_name(text: str) -> str:
+    return _fold(_corp_suffix.sub('', text))
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _squash(text: str) -> str:
+    return _whitespace.sub(' ', text).strip()
+
+def fold_text(text) -> str:
+    """공백/문장부호 제거, 영문 소문자 (빈 값은 '')"""
+    return '' if _is_missing(text) else _fold(str(text))
+
+def normalize_company_name(name) -> str:
+    """기업명 정규화 (법인 표기 제거 후 fold_text)"""
+    return '' if _is_missing(name) else _company_name(str(name))
+
+def normalize_whitespace(text) -> str:
+    """연속 공백을 한 칸으로, 앞뒤 공백 제거 (대소문자/문장부호는 유지, 빈 값은 '')"""
+    return '' if _is_missing(text) else _squash(str(text))
+
+def normalize_query(query) -> str:
+    """검색어 정규화 (기업명과 같은 규칙, 입력 중인 한글 낱자는 유지)"""
+    return '' if _is_missing(query) else _query_non_word.sub('', _corp_suffix.sub('', str(query))).lower()
+
+def map_unique(values: pd.Series, func: Callable[[str], object]) -> pd.Series:
+    """고유 문자열마다 한 번만 func을 적용해 Series 전체에 펼침 (빈 값은 '')"""
+    codes, uniques = pd.factorize(values.fillna('').astype(str))
+    mapped = pd.Index([func(value) for value in uniques], dtype=object)
+    return pd.Series(mapped.take(codes).to_numpy(), index=values.index, dtype=object)
+
+def whitespace_series(values: pd.Series) -> pd.Series:
+    """normalize_whitespace의 Series 버전"""
+    return map_unique(values, _squash)
+
+def normalize_company_names(names: pd.Series) -> pd.Series:
+    """normalize_company_name의 Series 버전"""
+    return map_unique(names, _company_name)
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """문자열의 n-gram 집합 (n보다 짧으면 빈 집합)"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def text_ngrams(text, n: int = NGRAM_SIZE) -> Set[str]:
+    """normalize_whitespace한 텍스트의 한글/영문/숫자 구간별 n-gram 집합 (대소문자 구분)
+
+    부분 문자열로 포함된 검색어의 n-gram은 항상 원문 n-gram의 부분집합이므로
+    역색인 후보와 정확한 포함 판정이 어긋나지 않습니다.
+    """
+    grams = set()
+    for run in _word_run.findall(normalize_whitespace(text)):
+        grams |= ngrams(run, n)
+    return grams
+
+def hangul_keywords(text, pattern: str = COMPANY_KEYWORD_PATTERN) -> List[str]:
+    """한글 키워드 추출 (pattern으로 분할, 불용어 제외)"""
+    if _is_missing(text):
+        return []
+    return [keyword for keyword in re.findall(pattern, str(text)) if keyword not in STOPWORDS]
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 낱자로 분해 (그 외 문자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            offset = code - HANGUL_FIRST
+            vowel = JUNGSEONG[(offset // 28) % 21]
+            final = JONGSEONG[offset % 28].strip()
+            chars.append(CHOSEONG[offset // 588])
+            chars.append(COMPOUND_JAMO.get(vowel, vowel))
+            chars.append(COMPOUND_JAMO.get(final, final))
+        else:
+            chars.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(chars)
+
+def to_initials(text: str) -> str:
+    """한글 음절을 초성으로 변환 ('삼성전자' -> 'ㅅㅅㅈㅈ', 그 외 문자는 그대로)"""
+    return ''.join(
+        CHOSEONG[(ord(char) - HANGUL_FIRST) // 588] if HANGUL_FIRST <= ord(char) <= HANGUL_LAST else char
+        for char in text
+    )
+
+def extract_company_names(labels: pd.Series) -> pd.Series:
+    """'기업명 - 사업 아이템' 형식에서 기업명 추출 (형식이 아니면 원래 값)"""
+    names = labels.astype(str).str.extract(COMPANY_LABEL_PATTERN)[0].str.strip()
+    return names.fillna(labels)
@@ -1,44 +1,36 @@
 """
 최종 CSV 파일 업로드 스크립트
 """
+import numpy as np
 import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 시험 업로드할 행 수 (파일 앞부분)
+SAMPLE_ROWS = 100
+
+def with_row_ids(chunk: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+    """CSV 청크에 파일 내 순번 id 추가 (재시도/재실행 시 같은 행은 같은 id)"""
+    return chunk.assign(id=np.arange(row_offset + 1, row_offset + len(chunk) + 1))
+
 def upload_csv_final(supabase: Client, csv_path: str, table_name: str):
-    """CSV 파일을 최종적으로 업로드"""
+    """CSV 파일을 최종적으로 업로드 (파일 앞 SAMPLE_ROWS행, 청크 병렬 전송/재시도)"""
     try:
-        # CSV 파일 읽기 (처음 몇 줄만)
         logger.info(f"CSV 파일 읽기 시작: {csv_path}")
+        logger.info(f"CSV 컬럼: {list(pd.read_csv(csv_path, nrows=0).columns)}")
         
-        # 파일 크기가 크므로 처음 100행만 읽기
-        df = pd.read_csv(csv_path, nrows=100)
-        
-        logger.info(f"CSV 컬럼: {list(df.columns)}")
-        logger.info(f"읽은 행 수: {len(df)}")
-        
-        # NaN 값을 None으로 변환
-        df = df.where(pd.notnull(df), None)
-        
-        # 데이터를 딕셔너리 리스트로 변환
-        data = df.to_dict('records')
-        
-        # 각 레코드에서 NaN 값을 None으로 변환
-        for record in data:
-            for key, value in record.items():
-                if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                    record[key] = None
-        
-        # Supabase에 데이터 삽입
-        result = supabase.table(table_name).insert(data).execute()
+        # id 기준 upsert로 재시도/재실행 시 중복 방지
+        total_rows = upload_csv(supabase, csv_path, table_name, transform=with_row_ids,
+                                on_conflict="id", nrows=SAMPLE_ROWS)
         
-        logger.info(f"성공적으로 {len(data)}행이 삽입되었습니다.")
+        logger.info(f"성공적으로 {total_rows}행이 삽입되었습니다.")
         return True
         
     except Exception as e:
@@ -1,10 +1,12 @@
 """
 CSV 파일을 Supabase 테이블로 업로드하는 스크립트
 """
+import numpy as np
 import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv, has_checkpoint
 import logging
 
 # 로깅 설정
@@ -22,40 +24,18 @@ def check_table_exists(supabase: Client, table_name: str) -> bool:
         logger.info(f"테이블 '{table_name}'이 존재하지 않습니다: {e}")
         return False
 
+def with_row_ids(chunk: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+    """CSV 청크에 파일 내 순번 id 추가 (재시도/재실행 시 같은 행은 같은 id)"""
+    return chunk.assign(id=np.arange(row_offset + 1, row_offset + len(chunk) + 1))
+
 def create_table_from_csv(supabase: Client, csv_path: str, table_name: str):
-    """CSV 파일을 읽어서 테이블 생성 및 데이터 삽입"""
+    """CSV 파일을 읽어서 테이블에 데이터 삽입 (병렬 전송, 중단 시 이어서 업로드)"""
     try:
-        # CSV 파일 읽기 (처음 몇 줄만 읽어서 구조 파악)
         logger.info(f"CSV 파일 읽기 시작: {csv_path}")
+        logger.info(f"CSV 컬럼: {list(pd.read_csv(csv_path, nrows=0).columns)}")
         
-        # 파일 크기가 크므로 청크 단위로 읽기
-        chunk_size = 1000
-        first_chunk = pd.read_csv(csv_path, nrows=chunk_size)
-        
-        logger.info(f"CSV 컬럼: {list(first_chunk.columns)}")
-        logger.info(f"첫 번째 청크 크기: {len(first_chunk)}")
-        
-        # 전체 파일을 청크 단위로 읽어서 데이터 삽입
-        total_rows = 0
-        for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
-            # NaN 값을 None으로 변환하고, 무한대 값도 처리
-            chunk = chunk.replace([float('inf'), float('-inf')], None)
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table(table_name).insert(data).execute()
-            total_rows += len(data)
-            
-            logger.info(f"삽입된 행 수: {total_rows}")
+        # id 기준 upsert로 재시도/재실행 시 중복 방지
+        total_rows = upload_csv(supabase, csv_path, table_name, transform=with_row_ids, on_conflict="id")
         
         logger.info(f"총 {total_rows}행이 성공적으로 삽입되었습니다.")
         return True
@@ -78,7 +58,9 @@ def main():
         return
     
     # 1. 테이블 존재 확인
-    if check_table_exists(supabase, table_name):
+    if has_checkpoint(csv_path, table_name):
+        logger.info("중단된 업로드의 체크포인트가 있어 기존 데이터를 유지하고 이어서 업로드합니다.")
+    elif check_table_exists(supabase, table_name):
         logger.info(f"테이블 '{table_name}'이 이미 존재합니다.")
         
         # 기존 테이블 데이터 삭제
@@ -1,65 +1,43 @@
 """
 전체 CSV 파일을 announcements 테이블에 업로드하는 스크립트
 """
+import numpy as np
 import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def map_to_announcements(chunk: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+    """CSV 청크를 announcements 테이블 컬럼에 맞춰 변환"""
+    company_ids = chunk.get('company_id', pd.Series('', index=chunk.index)).fillna('').astype(str)
+    program_ids = chunk.get('program_id', pd.Series('', index=chunk.index)).fillna('').astype(str)
+    return pd.DataFrame({
+        "id": np.arange(row_offset + 1, row_offset + len(chunk) + 1),  # 고유한 id 생성
+        "title": chunk.get("title", ""),
+        "url": chunk.get("url", ""),
+        "keywords": [[f"company_id:{c}", f"program_id:{p}"] for c, p in zip(company_ids, program_ids)],
+        "agency": "K-Startup",
+        "source": "kstartup",
+        "region": "전국",
+        "stage": "예비창업",
+        "amount_text": "미정",
+        "budget_band": "소규모",
+        "update_type": "신규"
+    }, index=chunk.index)
+
 def upload_full_csv(supabase: Client, csv_path: str):
-    """전체 CSV 파일을 announcements 테이블에 업로드"""
+    """전체 CSV 파일을 announcements 테이블에 업로드 (병렬 전송, 중단 시 이어서 업로드)"""
     try:
-        # CSV 파일 읽기 (청크 단위로)
         logger.info(f"CSV 파일 읽기 시작: {csv_path}")
         
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # announcements 테이블에 맞춰서 매핑
-            mapped_data = []
-            for i, record in enumerate(data):
-                mapped_record = {
-                    "id": total_rows + i + 1,  # 고유한 id 생성
-                    "title": record.get("title", ""),
-                    "url": record.get("url", ""),
-                    "keywords": [f"company_id:{record.get('company_id', '')}", f"program_id:{record.get('program_id', '')}"],
-                    "agency": "K-Startup",
-                    "source": "kstartup",
-                    "region": "전국",
-                    "stage": "예비창업",
-                    "amount_text": "미정",
-                    "budget_band": "소규모",
-                    "update_type": "신규"
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table("announcements").insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
-        
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 삽입되었습니다.")
+        # id가 고정되어 있으므로 id 기준 upsert로 재시도/재실행 시 중복 방지
+        upload_csv(supabase, csv_path, "announcements", transform=map_to_announcements, on_conflict="id")
         return True
         
     except Exception as e:
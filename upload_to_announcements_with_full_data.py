@@ -1,89 +1,53 @@
 """
 announcements 테이블에 recommendations_keyword_enhanced.csv의 모든 데이터를 저장하는 스크립트
 """
+import numpy as np
 import pandas as pd
 import os
 import json
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv, has_checkpoint, frame_records
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# recommendations_keyword_enhanced.csv 컬럼 (recommend_keyword4 구조)
+KEYWORD4_FIELDS = [
+    "company_id", "company_name", "program_id", "title", "priority_type", "apply_start", "apply_end", "url",
+    "kw_intersection", "kw_tfidf", "kw_bm25", "kw_phrase_hit", "kw_must_have_hits", "kw_forbid_hit",
+    "kw_gate", "kw_reason", "keyword_points"
+]
+
+def map_to_announcements(chunk: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+    """CSV 청크를 announcements 테이블 컬럼에 맞춰 변환 (recommendations_keyword_enhanced 데이터는 JSON 문자열로 저장)"""
+    company_ids = chunk.get('company_id', pd.Series('', index=chunk.index)).fillna('').astype(str)
+    program_ids = chunk.get('program_id', pd.Series('', index=chunk.index)).fillna('').astype(str)
+    recommend_data = frame_records(chunk.reindex(columns=KEYWORD4_FIELDS))
+    return pd.DataFrame({
+        "id": np.arange(row_offset + 1, row_offset + len(chunk) + 1),  # 고유한 id 생성
+        "title": chunk.get("title", ""),
+        "url": chunk.get("url", ""),
+        "keywords": [[f"company_id:{c}", f"program_id:{p}"] for c, p in zip(company_ids, program_ids)],
+        "agency": "K-Startup",
+        "source": "kstartup",
+        "region": "전국",
+        "stage": "예비창업",
+        "amount_text": "미정",
+        "budget_band": "소규모",
+        "update_type": "신규",
+        "recommendations_data": [json.dumps(data, ensure_ascii=False) for data in recommend_data]
+    }, index=chunk.index)
+
 def upload_to_announcements_with_full_data(supabase: Client, csv_path: str):
-    """announcements 테이블에 recommendations_keyword_enhanced.csv의 모든 데이터를 저장"""
+    """announcements 테이블에 recommendations_keyword_enhanced.csv의 모든 데이터를 저장 (병렬 전송, 중단 시 이어서 업로드)"""
     try:
-        # CSV 파일 읽기 (청크 단위로)
         logger.info(f"CSV 파일 읽기 시작: {csv_path}")
         
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # announcements 테이블에 맞춰서 매핑 (모든 recommendations_keyword_enhanced 데이터 포함)
-            mapped_data = []
-            for i, record in enumerate(data):
-                # recommendations_keyword_enhanced의 모든 데이터를 JSON으로 저장
-                recommend_data = {
-                    "company_id": record.get("company_id"),
-                    "company_name": record.get("company_name"),
-                    "program_id": record.get("program_id"),
-                    "title": record.get("title"),
-                    "priority_type": record.get("priority_type"),
-                    "apply_start": record.get("apply_start"),
-                    "apply_end": record.get("apply_end"),
-                    "url": record.get("url"),
-                    "kw_intersection": record.get("kw_intersection"),
-                    "kw_tfidf": record.get("kw_tfidf"),
-                    "kw_bm25": record.get("kw_bm25"),
-                    "kw_phrase_hit": record.get("kw_phrase_hit"),
-                    "kw_must_have_hits": record.get("kw_must_have_hits"),
-                    "kw_forbid_hit": record.get("kw_forbid_hit"),
-                    "kw_gate": record.get("kw_gate"),
-                    "kw_reason": record.get("kw_reason"),
-                    "keyword_points": record.get("keyword_points")
-                }
-                
-                mapped_record = {
-                    "id": total_rows + i + 1,
-                    "title": record.get("title", ""),
-                    "url": record.get("url", ""),
-                    "keywords": [f"company_id:{record.get('company_id', '')}", f"program_id:{record.get('program_id', '')}"],
-                    "agency": "K-Startup",
-                    "source": "kstartup",
-                    "region": "전국",
-                    "stage": "예비창업",
-                    "amount_text": "미정",
-                    "budget_band": "소규모",
-                    "update_type": "신규",
-                    # recommendations_keyword_enhanced의 모든 데이터를 JSON으로 저장
-                    "recommendations_data": json.dumps(recommend_data, ensure_ascii=False)
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table("announcements").insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
-        
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 삽입되었습니다.")
+        # id가 고정되어 있으므로 id 기준 upsert로 재시도/재실행 시 중복 방지
+        upload_csv(supabase, csv_path, "announcements", transform=map_to_announcements, on_conflict="id")
         logger.info("recommendations_keyword_enhanced의 모든 데이터가 announcements 테이블의 'recommendations_data' 컬럼에 JSON 형태로 저장되었습니다.")
         return True
         
@@ -110,12 +74,15 @@ def main():
     
     logger.info(f"CSV 파일 확인 완료: {csv_path}")
     
-    # 기존 데이터 삭제
-    try:
-        supabase.table("announcements").delete().neq('id', 0).execute()
-        logger.info("기존 announcements 데이터 삭제 완료")
-    except Exception as e:
-        logger.warning(f"기존 데이터 삭제 중 오류: {e}")
+    # 기존 데이터 삭제 (중단된 업로드를 이어서 올리는 경우 제외)
+    if has_checkpoint(csv_path, "announcements"):
+        logger.info("중단된 업로드의 체크포인트가 있어 기존 데이터를 유지하고 이어서 업로드합니다.")
+    else:
+        try:
+            supabase.table("announcements").delete().neq('id', 0).execute()
+            logger.info("기존 announcements 데이터 삭제 완료")
+        except Exception as e:
+            logger.warning(f"기존 데이터 삭제 중 오류: {e}")
     
     # recommendations_keyword_enhanced 데이터를 announcements 테이블에 저장
     if upload_to_announcements_with_full_data(supabase, csv_path):
@@ -5,6 +5,8 @@ import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv
+from upload_to_recommend_keyword4 import map_to_keyword4, KEYWORD4_COLUMNS
 import logging
 
 # 로깅 설정
@@ -119,60 +121,12 @@ def upload_to_recommend_keyword(supabase: Client, csv_path: str):
         return False
 
 def upload_full_data(supabase: Client, csv_path: str, table_name: str):
-    """전체 CSV 데이터를 업로드 (id 포함)"""
+    """전체 CSV 데이터를 업로드 (id 포함, 병렬 전송, 중단 시 이어서 업로드)"""
     try:
         logger.info(f"전체 CSV 데이터를 '{table_name}' 테이블에 업로드 시작...")
         
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # id를 포함한 데이터로 변환
-            mapped_data = []
-            for i, record in enumerate(data):
-                mapped_record = {
-                    "id": total_rows + i + 1,
-                    "company_id": record.get("company_id"),
-                    "company_name": record.get("company_name"),
-                    "program_id": record.get("program_id"),
-                    "title": record.get("title"),
-                    "priority_type": record.get("priority_type"),
-                    "apply_start": record.get("apply_start"),
-                    "apply_end": record.get("apply_end"),
-                    "url": record.get("url"),
-                    "kw_intersection": record.get("kw_intersection"),
-                    "kw_tfidf": record.get("kw_tfidf"),
-                    "kw_bm25": record.get("kw_bm25"),
-                    "kw_phrase_hit": record.get("kw_phrase_hit"),
-                    "kw_must_have_hits": record.get("kw_must_have_hits"),
-                    "kw_forbid_hit": record.get("kw_forbid_hit"),
-                    "kw_gate": record.get("kw_gate"),
-                    "kw_reason": record.get("kw_reason"),
-                    "keyword_points": record.get("keyword_points")
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table(table_name).insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
-        
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 '{table_name}' 테이블에 삽입되었습니다.")
+        # id 기준 upsert로 재시도/재실행 시 중복 방지
+        upload_csv(supabase, csv_path, table_name, transform=map_to_keyword4, on_conflict="id")
         return True
         
     except Exception as e:
@@ -180,59 +134,11 @@ def upload_full_data(supabase: Client, csv_path: str, table_name: str):
         return False
 
 def upload_full_data_no_id(supabase: Client, csv_path: str, table_name: str):
-    """전체 CSV 데이터를 업로드 (id 없이)"""
+    """전체 CSV 데이터를 업로드 (id 없이, 병렬 전송, 중단 시 이어서 업로드)"""
     try:
-        logger.info(f"전체 CSV 데이터를 '{table_name}' 테이블에 업로드 시작 (id 없이)...")
-        
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # id 없이 데이터로 변환
-            mapped_data = []
-            for i, record in enumerate(data):
-                mapped_record = {
-                    "company_id": record.get("company_id"),
-                    "company_name": record.get("company_name"),
-                    "program_id": record.get("program_id"),
-                    "title": record.get("title"),
-                    "priority_type": record.get("priority_type"),
-                    "apply_start": record.get("apply_start"),
-                    "apply_end": record.get("apply_end"),
-                    "url": record.get("url"),
-                    "kw_intersection": record.get("kw_intersection"),
-                    "kw_tfidf": record.get("kw_tfidf"),
-                    "kw_bm25": record.get("kw_bm25"),
-                    "kw_phrase_hit": record.get("kw_phrase_hit"),
-                    "kw_must_have_hits": record.get("kw_must_have_hits"),
-                    "kw_forbid_hit": record.get("kw_forbid_hit"),
-                    "kw_gate": record.get("kw_gate"),
-                    "kw_reason": record.get("kw_reason"),
-                    "keyword_points": record.get("keyword_points")
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table(table_name).insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
+        logger.info(f"전체 CSV 데이터를 '{table_name}' 테이블에 업로드 시작...")
         
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 '{table_name}' 테이블에 삽입되었습니다.")
+        upload_csv(supabase, csv_path, table_name, transform=lambda chunk, _: chunk.reindex(columns=KEYWORD4_COLUMNS))
         return True
         
     except Exception as e:
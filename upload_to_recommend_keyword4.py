@@ -1,72 +1,38 @@
 """
 recommend_keyword4 테이블에 CSV 데이터를 업로드하는 스크립트
 """
+import numpy as np
 import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# recommend_keyword4 테이블 컬럼 (CSV 컬럼명과 동일)
+KEYWORD4_COLUMNS = [
+    "company_id", "company_name", "program_id", "title", "priority_type", "apply_start", "apply_end", "url",
+    "kw_intersection", "kw_tfidf", "kw_bm25", "kw_phrase_hit", "kw_must_have_hits", "kw_forbid_hit",
+    "kw_gate", "kw_reason", "keyword_points"
+]
+
+def map_to_keyword4(chunk: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+    """CSV 청크를 recommend_keyword4 테이블 컬럼에 맞춰 변환"""
+    mapped = chunk.reindex(columns=KEYWORD4_COLUMNS)
+    mapped.insert(0, "id", np.arange(row_offset + 1, row_offset + len(chunk) + 1))
+    return mapped
+
 def upload_to_recommend_keyword4(supabase: Client, csv_path: str):
-    """recommend_keyword4 테이블에 CSV 데이터를 업로드"""
+    """recommend_keyword4 테이블에 CSV 데이터를 업로드 (병렬 전송, 중단 시 이어서 업로드)"""
     try:
-        # CSV 파일 읽기 (청크 단위로)
         logger.info(f"CSV 파일 읽기 시작: {csv_path}")
         
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # recommend_keyword4 테이블에 맞춰서 매핑
-            mapped_data = []
-            for i, record in enumerate(data):
-                mapped_record = {
-                    "id": total_rows + i + 1,  # id는 자동 생성되므로 제외하고 시도
-                    "company_id": record.get("company_id"),
-                    "company_name": record.get("company_name"),
-                    "program_id": record.get("program_id"),
-                    "title": record.get("title"),
-                    "priority_type": record.get("priority_type"),
-                    "apply_start": record.get("apply_start"),
-                    "apply_end": record.get("apply_end"),
-                    "url": record.get("url"),
-                    "kw_intersection": record.get("kw_intersection"),
-                    "kw_tfidf": record.get("kw_tfidf"),
-                    "kw_bm25": record.get("kw_bm25"),
-                    "kw_phrase_hit": record.get("kw_phrase_hit"),
-                    "kw_must_have_hits": record.get("kw_must_have_hits"),
-                    "kw_forbid_hit": record.get("kw_forbid_hit"),
-                    "kw_gate": record.get("kw_gate"),
-                    "kw_reason": record.get("kw_reason"),
-                    "keyword_points": record.get("keyword_points")
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table("recommend_keyword4").insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
-        
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 삽입되었습니다.")
+        # id가 고정되어 있으므로 id 기준 upsert로 재시도/재실행 시 중복 방지
+        upload_csv(supabase, csv_path, "recommend_keyword4", transform=map_to_keyword4, on_conflict="id")
         return True
         
     except Exception as e:
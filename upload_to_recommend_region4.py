@@ -5,12 +5,69 @@ import pandas as pd
 import os
 from supabase import create_client, Client
 from config import SUPABASE_URL, SUPABASE_KEY
+from bulk_csv_loader import upload_csv, frame_records
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def map_to_region4(chunk: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+    """CSV 청크를 recommend_region4 테이블 컬럼에 맞춰 변환 (기존 테이블 컬럼 기준)"""
+    def column(name, default=None):
+        return chunk[name] if name in chunk.columns else pd.Series(default, index=chunk.index)
+    
+    keyword_points = pd.to_numeric(column("keyword_points", 0), errors='coerce')
+    title = column("title")
+    return pd.DataFrame({
+        "company_id": column("company_id"),
+        "company_name": column("company_name"),
+        "program_id": column("program_id"),
+        "title_x": title,  # title → title_x
+        "url": column("url"),
+        "apply_start_x": column("apply_start"),  # apply_start → apply_start_x
+        "apply_end_x": column("apply_end"),  # apply_end → apply_end_x
+        "priority_type_x": column("priority_type"),  # priority_type → priority_type_x
+        # 기존 테이블의 다른 컬럼들은 기본값으로 설정
+        "company_province": "서울특별시",
+        "final_score": keyword_points,
+        "final_score_10": (keyword_points / 10).round(1),
+        "final_level": "중",
+        "program_provinces": "{'전국'}",
+        "region_match": True,
+        "source": "kstartup",
+        "base_score": "50.0",
+        "sim_raw": column("kw_intersection", 0),
+        "sim_points": pd.to_numeric(column("kw_tfidf", 0), errors='coerce') * 10,
+        "priority_boost_points": "0",
+        "base_score_10": "5.0",
+        "score_stage": 1,
+        "score_industry": 0.2,
+        "score_region": 1,
+        "score_timing": 0.6,
+        "score_bonus": "0",
+        "score_penalty": "0",
+        "sim": column("kw_intersection", 0),
+        "region": "서울특별시",
+        "years": "5.0",
+        "raw_text": title.fillna(""),
+        "industry_primary": "None",
+        "title_y": title,
+        "description": title.fillna(""),
+        "category": "사업화",
+        "doc_text": title.fillna(""),
+        "program_region": "전국",
+        "priority_type_y": column("priority_type"),
+        "apply_start_y": column("apply_start"),
+        "apply_end_y": column("apply_end"),
+        "base_score_recomputed": "44.0",
+        "region_prog": "전국",
+        "title_prog": title,
+        "description_prog": title.fillna(""),
+        "category_prog": "사업화",
+        "doc_text_prog": title.fillna("")
+    }, index=chunk.index)
+
 def upload_to_recommend_region4(supabase: Client, csv_path: str):
     """recommend_region4 테이블에 CSV 데이터를 저장"""
     try:
@@ -22,175 +79,25 @@ def upload_to_recommend_region4(supabase: Client, csv_path: str):
         logger.info(f"CSV 컬럼: {list(df.columns)}")
         logger.info(f"읽은 행 수: {len(df)}")
         
-        # NaN 값을 None으로 변환
-        df = df.where(pd.notnull(df), None)
-        
-        # 데이터를 딕셔너리 리스트로 변환
-        data = df.to_dict('records')
-        
-        # 각 레코드에서 NaN 값을 None으로 변환
-        for record in data:
-            for key, value in record.items():
-                if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                    record[key] = None
-        
-        # recommend_region4 테이블에 맞춰서 매핑
         table_name = "recommend_region4"
         
-        # 기존 테이블의 컬럼에 맞춰서 매핑
-        mapped_data = []
-        for i, record in enumerate(data):
-            mapped_record = {
-                "company_id": record.get("company_id"),
-                "company_name": record.get("company_name"),
-                "program_id": record.get("program_id"),
-                "title_x": record.get("title"),  # title → title_x
-                "url": record.get("url"),
-                "apply_start_x": record.get("apply_start"),  # apply_start → apply_start_x
-                "apply_end_x": record.get("apply_end"),  # apply_end → apply_end_x
-                "priority_type_x": record.get("priority_type"),  # priority_type → priority_type_x
-                # 기존 테이블의 다른 컬럼들은 기본값으로 설정
-                "company_province": "서울특별시",
-                "final_score": record.get("keyword_points", 0),
-                "final_score_10": round(record.get("keyword_points", 0) / 10, 1),
-                "final_level": "중",
-                "program_provinces": "{'전국'}",
-                "region_match": True,
-                "source": "kstartup",
-                "base_score": "50.0",
-                "sim_raw": record.get("kw_intersection", 0),
-                "sim_points": record.get("kw_tfidf", 0) * 10,
-                "priority_boost_points": "0",
-                "base_score_10": "5.0",
-                "score_stage": 1,
-                "score_industry": 0.2,
-                "score_region": 1,
-                "score_timing": 0.6,
-                "score_bonus": "0",
-                "score_penalty": "0",
-                "sim": record.get("kw_intersection", 0),
-                "region": "서울특별시",
-                "years": "5.0",
-                "raw_text": record.get("title", ""),
-                "industry_primary": "None",
-                "title_y": record.get("title"),
-                "description": record.get("title", ""),
-                "category": "사업화",
-                "doc_text": record.get("title", ""),
-                "program_region": "전국",
-                "priority_type_y": record.get("priority_type"),
-                "apply_start_y": record.get("apply_start"),
-                "apply_end_y": record.get("apply_end"),
-                "base_score_recomputed": "44.0",
-                "region_prog": "전국",
-                "title_prog": record.get("title"),
-                "description_prog": record.get("title", ""),
-                "category_prog": "사업화",
-                "doc_text_prog": record.get("title", "")
-            }
-            mapped_data.append(mapped_record)
-        
-        logger.info(f"테이블 '{table_name}'에 데이터 삽입 시도...")
+        # 구조 확인용으로 변환만 해보고, 실제 저장은 전체 업로드에서 한 번만 수행 (처음 10행 중복 저장 방지)
+        mapped_data = frame_records(map_to_region4(df))
+        logger.info(f"변환된 데이터 샘플: {mapped_data[:2]}")
         
-        try:
-            result = supabase.table(table_name).insert(mapped_data).execute()
-            logger.info(f"성공적으로 {len(mapped_data)}행이 삽입되었습니다.")
-            logger.info(f"삽입된 데이터 샘플: {result.data[:2] if result.data else 'None'}")
-            
-            # 이제 전체 데이터 업로드
-            logger.info("전체 데이터 업로드를 시작합니다...")
-            return upload_full_data(supabase, csv_path, table_name)
-            
-        except Exception as insert_error:
-            logger.error(f"데이터 삽입 실패: {insert_error}")
-            return False
+        logger.info("전체 데이터 업로드를 시작합니다...")
+        return upload_full_data(supabase, csv_path, table_name)
         
     except Exception as e:
         logger.error(f"CSV 파일 처리 중 오류 발생: {e}")
         return False
 
 def upload_full_data(supabase: Client, csv_path: str, table_name: str):
-    """전체 CSV 데이터를 업로드"""
+    """전체 CSV 데이터를 업로드 (병렬 전송, 중단 시 이어서 업로드)"""
     try:
         logger.info(f"전체 CSV 데이터를 '{table_name}' 테이블에 업로드 시작...")
         
-        chunk_size = 1000
-        total_rows = 0
-        
-        for chunk_num, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-            logger.info(f"청크 {chunk_num + 1} 처리 중... (행 수: {len(chunk)})")
-            
-            # NaN 값을 None으로 변환
-            chunk = chunk.where(pd.notnull(chunk), None)
-            
-            # 데이터를 딕셔너리 리스트로 변환
-            data = chunk.to_dict('records')
-            
-            # 각 레코드에서 NaN 값을 None으로 변환
-            for record in data:
-                for key, value in record.items():
-                    if pd.isna(value) or value == float('inf') or value == float('-inf'):
-                        record[key] = None
-            
-            # recommend_region4 테이블에 맞춰서 매핑
-            mapped_data = []
-            for i, record in enumerate(data):
-                mapped_record = {
-                    "company_id": record.get("company_id"),
-                    "company_name": record.get("company_name"),
-                    "program_id": record.get("program_id"),
-                    "title_x": record.get("title"),
-                    "url": record.get("url"),
-                    "apply_start_x": record.get("apply_start"),
-                    "apply_end_x": record.get("apply_end"),
-                    "priority_type_x": record.get("priority_type"),
-                    "company_province": "서울특별시",
-                    "final_score": record.get("keyword_points", 0),
-                    "final_score_10": round(record.get("keyword_points", 0) / 10, 1),
-                    "final_level": "중",
-                    "program_provinces": "{'전국'}",
-                    "region_match": True,
-                    "source": "kstartup",
-                    "base_score": "50.0",
-                    "sim_raw": record.get("kw_intersection", 0),
-                    "sim_points": record.get("kw_tfidf", 0) * 10,
-                    "priority_boost_points": "0",
-                    "base_score_10": "5.0",
-                    "score_stage": 1,
-                    "score_industry": 0.2,
-                    "score_region": 1,
-                    "score_timing": 0.6,
-                    "score_bonus": "0",
-                    "score_penalty": "0",
-                    "sim": record.get("kw_intersection", 0),
-                    "region": "서울특별시",
-                    "years": "5.0",
-                    "raw_text": record.get("title", ""),
-                    "industry_primary": "None",
-                    "title_y": record.get("title"),
-                    "description": record.get("title", ""),
-                    "category": "사업화",
-                    "doc_text": record.get("title", ""),
-                    "program_region": "전국",
-                    "priority_type_y": record.get("priority_type"),
-                    "apply_start_y": record.get("apply_start"),
-                    "apply_end_y": record.get("apply_end"),
-                    "base_score_recomputed": "44.0",
-                    "region_prog": "전국",
-                    "title_prog": record.get("title"),
-                    "description_prog": record.get("title", ""),
-                    "category_prog": "사업화",
-                    "doc_text_prog": record.get("title", "")
-                }
-                mapped_data.append(mapped_record)
-            
-            # Supabase에 데이터 삽입
-            result = supabase.table(table_name).insert(mapped_data).execute()
-            total_rows += len(mapped_data)
-            
-            logger.info(f"청크 {chunk_num + 1} 완료: {len(mapped_data)}행 삽입 (총 {total_rows}행)")
-        
-        logger.info(f"전체 업로드 완료: 총 {total_rows}행이 '{table_name}' 테이블에 삽입되었습니다.")
+        upload_csv(supabase, csv_path, table_name, transform=map_to_region4)
         return True
         
     except Exception as e: